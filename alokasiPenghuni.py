@@ -0,0 +1,180 @@
+import csv
+from collections import Counter
+
+KOLOM_WAJIB = ("nim", "nama", "fakultas")
+KOLOM_RENCANA = ("nim", "nama", "fakultas", "asrama_id", "nomor_kamar", "status", "catatan")
+
+
+def iter_pendatang_csv(csv_path):
+    """
+    Membaca daftar calon penghuni baru dari CSV (kolom nim, nama, fakultas, dan opsional asrama_id sebagai preferensi).
+    Menghasilkan dict per baris.
+    """
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        kolom_hilang = [k for k in KOLOM_WAJIB if k not in (reader.fieldnames or [])]
+        if kolom_hilang:
+            raise ValueError(f"Kolom CSV tidak lengkap, tidak ditemukan: {', '.join(kolom_hilang)}")
+        for row in reader:
+            yield row
+
+
+class _Kamar:
+    __slots__ = ("kamar_id_internal", "asrama_id", "nomor_kamar", "kapasitas", "jumlah", "fakultas")
+
+    def __init__(self, row, komposisi):
+        self.kamar_id_internal = row['kamar_id_internal']
+        self.asrama_id = row['asrama_id']
+        self.nomor_kamar = row['nomor_kamar']
+        self.kapasitas = row['kapasitas']
+        self.jumlah = row['jumlah_penghuni']
+        self.fakultas = dict(komposisi.get(row['kamar_id_internal'], {}))
+
+    @property
+    def sisa(self):
+        return self.kapasitas - self.jumlah
+
+    def kunci_pilihan(self, fakultas_id, sisa_kelompok):
+        """
+        Kunci urutan kamar untuk satu kelompok fakultas (semakin kecil semakin diutamakan):
+        0 = kamar yang hanya berisi fakultas yang sama (isi yang paling sedikit sisanya dulu: best fit),
+        1 = kamar kosong (yang kapasitasnya pas terisi penuh oleh kelompok lebih dulu),
+        2 = kamar campuran (yang paling banyak berisi fakultas yang sama lebih dulu).
+        """
+        urutan = (self.asrama_id, self.nomor_kamar)
+        if self.jumlah == 0:
+            if self.kapasitas <= sisa_kelompok:
+                return (1, 0, -self.kapasitas) + urutan
+            return (1, 1, self.kapasitas) + urutan
+        sama = self.fakultas.get(fakultas_id, 0)
+        if sama == self.jumlah:
+            return (0, self.sisa, 0) + urutan
+        return (2, -sama, self.sisa) + urutan
+
+    def tambah(self, fakultas_id, jumlah):
+        self.jumlah += jumlah
+        self.fakultas[fakultas_id] = self.fakultas.get(fakultas_id, 0) + jumlah
+
+
+def alokasikan(kamar_rows, komposisi, pendatang, izinkan_asrama_lain=True):
+    """
+    Heuristik bin packing greedy yang sepenuhnya berjalan di memori.
+    `kamar_rows`: baris kamar (kamar_id_internal, asrama_id, nomor_kamar, kapasitas, jumlah_penghuni).
+    `komposisi`: {kamar_id_internal: {fakultas_id: jumlah}} penghuni saat ini.
+    `pendatang`: dict tervalidasi (nim, nama, fakultas, fakultas_id, asrama_id preferensi atau None).
+    Pendatang dikelompokkan per (preferensi asrama, fakultas); fakultas baru (fakultas_id None) dikelompokkan menurut namanya.
+    kelompok yang punya preferensi asrama diproses lebih dulu,
+    lalu kelompok terbesar lebih dulu,
+    masing-masing ke kamar dengan kunci_pilihan terkecil, agar kamar terisi penuh dan fakultas tetap berkumpul.
+    Mengembalikan (penempatan, tidak_tertempatkan).
+    """
+    kamar = [_Kamar(row, komposisi) for row in kamar_rows]
+    kamar_per_asrama = {}
+    for k in kamar:
+        kamar_per_asrama.setdefault(k.asrama_id, []).append(k)
+
+    kelompok = {}
+    for p in pendatang:
+        kunci_fakultas = p['fakultas_id'] if p['fakultas_id'] is not None else (p['fakultas'] or None)
+        kelompok.setdefault((p['asrama_id'], kunci_fakultas), []).append(p)
+
+    penempatan = []
+    tidak_tertempatkan = []
+    for (asrama_pref, fakultas_id), anggota in sorted(kelompok.items(), key=lambda item: (item[0][0] is None, -len(item[1]))):
+        if asrama_pref is not None and asrama_pref not in kamar_per_asrama:
+            for p in anggota: tidak_tertempatkan.append(dict(p, catatan=f"Asrama {asrama_pref} tidak ditemukan."))
+            continue
+        cakupan = [kamar_per_asrama[asrama_pref]] if asrama_pref is not None else [kamar]
+        if asrama_pref is not None and izinkan_asrama_lain:
+            cakupan.append([k for k in kamar if k.asrama_id != asrama_pref])
+        i = 0
+        for daftar_kamar in cakupan:
+            while i < len(anggota):
+                sisa_kelompok = len(anggota) - i
+                kandidat = [k for k in daftar_kamar if k.sisa > 0]
+                if not kandidat: break
+                terpilih = min(kandidat, key=lambda k: k.kunci_pilihan(fakultas_id, sisa_kelompok))
+                n = min(terpilih.sisa, sisa_kelompok)
+                catatan = "" if asrama_pref is None or terpilih.asrama_id == asrama_pref else "Asrama preferensi penuh."
+                for p in anggota[i:i + n]:
+                    penempatan.append(dict(p, kamar_id_internal=terpilih.kamar_id_internal, asrama_id=terpilih.asrama_id,
+                                           nomor_kamar=terpilih.nomor_kamar, catatan=catatan))
+                terpilih.tambah(fakultas_id, n)
+                i += n
+        for p in anggota[i:]:
+            tidak_tertempatkan.append(dict(p, catatan="Tidak ada kamar dengan tempat kosong."))
+    return penempatan, tidak_tertempatkan
+
+
+def buat_rencana_alokasi(db_service, pendatang, izinkan_asrama_lain=True):
+    """
+    Memvalidasi calon penghuni, memuat kapasitas dan okupansi kamar saat ini, lalu menyusun rencana alokasi.
+    Rencana belum menulis apa pun ke database; tinjau dulu lalu terapkan dengan `terapkan_rencana`.
+    Mengembalikan dict {'penempatan', 'tidak_tertempatkan', 'ringkasan'}.
+    Kegagalan database dilempar sebagai mysql.connector.Error: rencana dari data okupansi yang tidak lengkap
+    akan menempatkan penghuni di kamar yang sebenarnya penuh.
+    Fakultas yang belum terdaftar tidak ditolak: sama seperti sp_TambahPenghuni dan impor massal, fakultas tersebut
+    dibuat oleh terapkan_alokasi saat rencana diterapkan (daftar namanya ada di ringkasan 'fakultas_baru').
+    """
+    kamar_rows, _ = db_service.get_vacancy_board(lempar_galat=True)
+    komposisi = db_service.get_komposisi_fakultas_kamar(lempar_galat=True)
+    valid = []
+    tidak_tertempatkan = []
+    nim_terlihat = set()
+    for row in pendatang:
+        nim = (row.get('nim') or '').strip()
+        nama = (row.get('nama') or '').strip()
+        nama_fakultas = (row.get('fakultas') or '').strip()
+        data = {'nim': nim, 'nama': nama, 'fakultas': nama_fakultas, 'fakultas_id': None, 'asrama_id': None}
+        asrama_pref = (row.get('asrama_id') or '').strip()
+        if not nim.isdigit():
+            tidak_tertempatkan.append(dict(data, catatan="NIM tidak valid (harus berupa angka dan tidak boleh kosong)."))
+        elif not nama:
+            tidak_tertempatkan.append(dict(data, catatan="Nama tidak boleh kosong."))
+        elif nim in nim_terlihat:
+            tidak_tertempatkan.append(dict(data, catatan="NIM muncul lebih dari sekali dalam daftar."))
+        elif asrama_pref and not asrama_pref.isdigit():
+            tidak_tertempatkan.append(dict(data, catatan="ID asrama preferensi tidak valid."))
+        else:
+            data['asrama_id'] = int(asrama_pref) if asrama_pref else None
+            if nama_fakultas:
+                data['fakultas_id'] = db_service.get_fakultas_id_by_name(nama_fakultas, lempar_galat=True)
+            nim_terlihat.add(nim)
+            valid.append(data)
+
+    terdaftar = db_service.get_nim_terdaftar((p['nim'] for p in valid), lempar_galat=True)
+    if terdaftar:
+        tidak_tertempatkan.extend(dict(p, catatan="NIM sudah terdaftar sebagai penghuni.") for p in valid if p['nim'] in terdaftar)
+        valid = [p for p in valid if p['nim'] not in terdaftar]
+
+    penempatan, tidak_muat = alokasikan(kamar_rows, komposisi, valid, izinkan_asrama_lain)
+    tidak_tertempatkan.extend(tidak_muat)
+    kamar_terpakai = {p['kamar_id_internal'] for p in penempatan}
+    return {
+        'penempatan': penempatan,
+        'tidak_tertempatkan': tidak_tertempatkan,
+        'ringkasan': {
+            'ditempatkan': len(penempatan),
+            'tidak_tertempatkan': len(tidak_tertempatkan),
+            'kamar_terpakai': len(kamar_terpakai),
+            'tempat_kosong_sebelum': sum(max(0, r['kapasitas'] - r['jumlah_penghuni']) for r in kamar_rows),
+            'per_asrama': Counter(p['asrama_id'] for p in penempatan),
+            'fakultas_baru': sorted({p['fakultas'] for p in penempatan if p['fakultas_id'] is None and p['fakultas']}),
+        },
+    }
+
+
+def simpan_rencana_csv(rencana, csv_path):
+    """Menulis rencana (penempatan dan yang tidak tertempatkan) ke CSV untuk ditinjau sebelum diterapkan."""
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=KOLOM_RENCANA, extrasaction="ignore")
+        writer.writeheader()
+        for p in rencana['penempatan']:
+            writer.writerow(dict(p, status="ditempatkan"))
+        for p in rencana['tidak_tertempatkan']:
+            writer.writerow(dict(p, status="tidak_tertempatkan", nomor_kamar=""))
+
+
+def terapkan_rencana(db_service, rencana):
+    """Menerapkan seluruh penempatan dalam rencana dalam satu transaksi. Mengembalikan (berhasil, hasil per penghuni)."""
+    return db_service.terapkan_alokasi(rencana['penempatan'])
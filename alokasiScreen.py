@@ -0,0 +1,112 @@
+from baseScreen import BaseScreen
+from tkinter import ttk, filedialog, messagebox
+import tkinter as tk
+from alokasiPenghuni import iter_pendatang_csv, buat_rencana_alokasi, simpan_rencana_csv, terapkan_rencana
+
+class AlokasiScreen(BaseScreen):
+    MAKS_BARIS_TAMPIL = 2000
+
+    def __init__(self, screen_manager, db_service):
+        super().__init__(screen_manager, db_service)
+        self.rencana = None
+        self.rencana_treeview = None
+        self.rencana_scrollbar = None
+        self.info_text_id = None
+
+    def setup_ui(self):
+        style = ttk.Style()
+        style.configure("Alokasi.Treeview", background="#F0F0F0", fieldbackground="#FFFFFF", foreground="black", rowheight=22)
+        style.configure("Alokasi.Treeview.Heading", background="#BFBFBF", foreground="black", font=('Arial', 10, 'bold'), relief="flat")
+        self.create_canvas_text(self.app_instance.appwidth / 2, 50, text="Alokasi Otomatis Penghuni Baru", fill="#F4F0FF", font=("Cooper Black", 24, "bold"))
+        self.tbl(50, 15, 150, 50, 10, 10, 90, 180, 270, 360, "red", "Kembali",
+            self.screen_manager.show_main_menu)
+
+        columns = ("nim", "nama", "fakultas", "asrama", "kamar", "catatan")
+        self.rencana_treeview = ttk.Treeview(self.canvas, columns=columns, show='headings', style="Alokasi.Treeview")
+        for kolom, judul, lebar in (("nim", "NIM", 120), ("nama", "Nama", 240), ("fakultas", "Fakultas", 180),
+                                    ("asrama", "Asrama", 70), ("kamar", "Kamar", 70), ("catatan", "Catatan", 250)):
+            self.rencana_treeview.heading(kolom, text=judul)
+            self.rencana_treeview.column(kolom, width=lebar, anchor=tk.W)
+        self.rencana_treeview.tag_configure("tidak_tertempatkan", foreground="#C0392B")
+        self.rencana_scrollbar = ttk.Scrollbar(self.canvas, orient="vertical", command=self.rencana_treeview.yview)
+        self.rencana_treeview.configure(yscrollcommand=self.rencana_scrollbar.set)
+        self.add_widget(self.rencana_treeview)
+        self.add_widget(self.rencana_scrollbar)
+        self.create_canvas_window(50, 110, anchor=tk.NW, window=self.rencana_treeview, width=960, height=420)
+        self.create_canvas_window(1010, 110, anchor=tk.NW, window=self.rencana_scrollbar, height=420)
+
+        self.info_text_id = self.create_canvas_text(self.app_instance.appwidth / 2, 555,
+                                                    text="Pilih file CSV calon penghuni (kolom nim, nama, fakultas, opsional asrama_id).",
+                                                    fill="#F4FEFF", font=("Arial", 11, "bold"))
+        self.tbl(190, 590, 200, 50, 10, 10, 90, 180, 270, 360, "#4682B4", "Pilih CSV", self._pilih_csv)
+        self.tbl(440, 590, 200, 50, 10, 10, 90, 180, 270, 360, "#8E44AD", "Simpan Rencana", self._simpan_rencana)
+        self.tbl(690, 590, 200, 50, 10, 10, 90, 180, 270, 360, "#F47B07", "Terapkan", self._terapkan)
+
+    def _pilih_csv(self):
+        csv_path = filedialog.askopenfilename(title="Pilih File CSV Calon Penghuni", filetypes=[("CSV", "*.csv")])
+        if not csv_path: return
+        self.rencana = None
+        for item in self.rencana_treeview.get_children(): self.rencana_treeview.delete(item)
+        self.canvas.itemconfig(self.info_text_id, text="Menyusun rencana alokasi, mohon tunggu...")
+        self.run_db(lambda: buat_rencana_alokasi(self.db_service, iter_pendatang_csv(csv_path)),
+                    on_success=self._tampilkan_rencana,
+                    on_error=lambda e: self._gagal("Gagal menyusun rencana alokasi", e))
+
+    def _tampilkan_rencana(self, rencana):
+        self.rencana = rencana
+        baris = [(p, "") for p in rencana['penempatan']] + [(p, "tidak_tertempatkan") for p in rencana['tidak_tertempatkan']]
+        for p, tag in baris[:self.MAKS_BARIS_TAMPIL]:
+            self.rencana_treeview.insert("", tk.END, tags=(tag,) if tag else (), values=(
+                p['nim'], p['nama'], p['fakultas'] or "-", p.get('asrama_id') or "-", p.get('nomor_kamar') or "-", p.get('catatan') or ""))
+        ringkasan = rencana['ringkasan']
+        teks = (f"Ditempatkan: {ringkasan['ditempatkan']} di {ringkasan['kamar_terpakai']} kamar  |  "
+                f"Tidak tertempatkan: {ringkasan['tidak_tertempatkan']}  |  Tempat kosong sebelum alokasi: {ringkasan['tempat_kosong_sebelum']}")
+        if ringkasan['fakultas_baru']:
+            teks += f"\nFakultas baru yang ditambahkan saat diterapkan: {', '.join(ringkasan['fakultas_baru'])}"
+        if len(baris) > self.MAKS_BARIS_TAMPIL:
+            teks += f"\nHanya {self.MAKS_BARIS_TAMPIL} baris pertama yang ditampilkan; simpan rencana ke CSV untuk meninjau semuanya."
+        self.canvas.itemconfig(self.info_text_id, text=teks)
+
+    def _simpan_rencana(self):
+        if not self.rencana:
+            messagebox.showwarning("Belum Ada Rencana", "Susun rencana alokasi terlebih dahulu dengan memilih file CSV.")
+            return
+        csv_path = filedialog.asksaveasfilename(title="Simpan Rencana Alokasi", defaultextension=".csv", filetypes=[("CSV", "*.csv")])
+        if not csv_path: return
+        try:
+            simpan_rencana_csv(self.rencana, csv_path)
+            messagebox.showinfo("Rencana Disimpan", f"Rencana alokasi disimpan ke {csv_path}.")
+        except OSError as e:
+            messagebox.showerror("Gagal Menyimpan", f"Gagal menyimpan rencana: {e}")
+
+    def _terapkan(self):
+        if not self.rencana or not self.rencana['penempatan']:
+            messagebox.showwarning("Belum Ada Rencana", "Tidak ada penempatan yang dapat diterapkan.")
+            return
+        if not messagebox.askyesno("Terapkan Alokasi", f"Tambahkan {len(self.rencana['penempatan'])} penghuni sesuai rencana dalam satu transaksi?"):
+            return
+        self.canvas.itemconfig(self.info_text_id, text="Menerapkan rencana alokasi...")
+        self.run_db(terapkan_rencana, self.db_service, self.rencana, on_success=self._selesai_terapkan,
+                    on_error=lambda e: self._gagal("Gagal menerapkan rencana alokasi", e))
+
+    def _selesai_terapkan(self, hasil):
+        berhasil, hasil_per_penghuni = hasil
+        if berhasil:
+            messagebox.showinfo("Alokasi Diterapkan", f"{len(hasil_per_penghuni)} penghuni berhasil ditempatkan.")
+            self.rencana = None
+            self.screen_manager.show_main_menu()
+            return
+        ditolak = [h for h in hasil_per_penghuni if h['status'] == 'rejected' and not h['pesan'].startswith("Tidak diterapkan")]
+        contoh = "\n".join(f"{h['nim']}: {h['pesan']}" for h in ditolak[:5])
+        messagebox.showerror("Alokasi Dibatalkan", f"Rencana tidak diterapkan karena {len(ditolak)} penempatan tidak lagi valid:\n{contoh}\n\n"
+                                                   "Susun ulang rencana dari file CSV yang sama.")
+        self.canvas.itemconfig(self.info_text_id, text="Rencana dibatalkan; tidak ada data yang ditambahkan.")
+
+    def _gagal(self, judul, exc):
+        self.canvas.itemconfig(self.info_text_id, text=judul)
+        messagebox.showerror(judul, str(exc))
+
+    def clear_screen_elements(self):
+        super().clear_screen_elements()
+        self.rencana_treeview = None
+        self.rencana_scrollbar = None
@@ -1,12 +1,15 @@
-from dbService import DatabaseService
 from tkinter import Tk, Canvas, messagebox, NW
 import tkinter as tk
-from PIL import Image, ImageTk
 from screenManager import ScreenManager
+from dbWorker import DbWorker
+from assetCache import PersiapanAset
 import os as os
 class App: 
-    def __init__(self, root_window):
+    def __init__(self, root_window, profiler=None, profile_path=None):
         self.window = root_window
+        self.profiler = profiler # StartupProfiler dari `main.py --profile-startup`, None jika tidak diprofil
+        self.profile_path = profile_path
+        self._tandai("jendela_dibuat")
         self.window.title("Manajemen Asrama OOP - MySQL")
         self.appwidth = 1080
         self.appheight = 700
@@ -14,22 +17,59 @@ class App:
         self.canvas = Canvas(self.window, width=self.appwidth, height=self.appheight)
         self.canvas.place(x=0, y=0)
         self.bg_image_tk = None
-        self.asset_path = "./assets/um.png" 
-        self._load_assets()
+        self.asset_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "um.png")
+        persiapan_aset = self._start_asset_loading() # Decode/skala gambar berjalan di thread latar
         
-        MYSQL_HOST = os.getenv("DB_HOST", "localhost")
-        MYSQL_USER = os.getenv("DB_USER", "root")
-        MYSQL_PASSWORD = os.getenv("DB_PASSWORD", "") 
-        MYSQL_DB_NAME = os.getenv("DB_NAME", "asrama_db_mysql") 
-        
-        self.db_service = DatabaseService(host=MYSQL_HOST, user=MYSQL_USER, password=MYSQL_PASSWORD, database_name=MYSQL_DB_NAME)
+        MYSQL_POOL_MAX = int(os.getenv("DB_POOL_MAX", "5"))
+        self.db_service = None # Dibuat di thread worker setelah jendela tampil (lihat _mulai_koneksi)
+        self.db_worker = DbWorker(self.window, max_workers=max(1, MYSQL_POOL_MAX - 1))
         self.screen_manager = ScreenManager(self, self.db_service)
-        
-        if self.db_service.conn and self.db_service.conn.is_connected():
-            self._draw_background()
-            self.screen_manager.show_main_menu()
-        else:
-            self.canvas.create_text(self.appwidth / 2, self.appheight / 2, text="Koneksi ke Database Gagal.\nPeriksa konfigurasi dan server MySQL Anda.\nAplikasi tidak dapat dimulai.", font=("Arial", 16, "bold"), fill="red", justify=tk.CENTER)
+        self._load_assets(persiapan_aset)
+        self._draw_background()
+        self._status_id = self.canvas.create_text(self.appwidth / 2, self.appheight / 2, text="Menghubungkan ke database...",
+                                                  font=("Arial", 16, "bold"), fill="black", justify=tk.CENTER)
+        self.window.after_idle(self._tandai, "cat_pertama") # Berjalan setelah redraw idle yang dijadwalkan di atas
+        self._mulai_koneksi()
+
+    def _tandai(self, nama):
+        if self.profiler: self.profiler.tandai(nama)
+
+    def _mulai_koneksi(self):
+        """Membuka koneksi database (termasuk import mysql.connector) di thread worker agar jendela langsung dapat digambar."""
+        self.db_worker.submit(self._buat_db_service, on_success=self._koneksi_selesai, on_error=self._koneksi_gagal)
+
+    def _buat_db_service(self):
+        from dbService import DatabaseService # Menarik mysql.connector; sengaja tidak di-import saat start
+        return DatabaseService(host=os.getenv("DB_HOST", "localhost"), user=os.getenv("DB_USER", "root"),
+                               password=os.getenv("DB_PASSWORD", ""), database_name=os.getenv("DB_NAME", "asrama_db_mysql"),
+                               pool_min=int(os.getenv("DB_POOL_MIN", "1")), pool_max=int(os.getenv("DB_POOL_MAX", "5")),
+                               ref_cache_ttl=int(os.getenv("DB_REF_CACHE_TTL", "300")),
+                               ui_dispatcher=self.db_worker.call_in_ui)
+
+    def _koneksi_selesai(self, db_service):
+        self.db_service = db_service
+        self.screen_manager.db_service = db_service
+        self._tandai("database_terhubung")
+        if not db_service.is_connected():
+            self._tampilkan_koneksi_gagal()
+            return
+        self.canvas.delete(self._status_id)
+        self.screen_manager.show_main_menu()
+        self.window.after_idle(self._selesai_start, "menu_utama_tampil")
+
+    def _koneksi_gagal(self, exc):
+        print(f"Gagal menyiapkan DatabaseService: {exc!r}")
+        self._tampilkan_koneksi_gagal()
+
+    def _tampilkan_koneksi_gagal(self):
+        self.canvas.itemconfigure(self._status_id, text="Koneksi ke Database Gagal.\nPeriksa konfigurasi dan server MySQL Anda.\nAplikasi tidak dapat dimulai.", fill="red")
+        self.window.after_idle(self._selesai_start, "koneksi_gagal_tampil")
+
+    def _selesai_start(self, tanda):
+        if not self.profiler: return
+        self.profiler.tandai(tanda)
+        self.profiler.lepas()
+        self.profiler.tulis(self.profile_path)
 
     def _setup_window_geometry(self):
         screen_width = self.window.winfo_screenwidth()
@@ -38,48 +78,32 @@ class App:
         self.window.geometry(f"{self.appwidth}x{self.appheight}+{int(x_pos)}+{int(y_pos)}")
         self.window.resizable(False, False)
 
-    def _load_assets(self):
-        try:
-            current_script_dir = os.path.dirname(__file__) if "__file__" in locals() else os.getcwd()
-            assets_dir = os.path.join(current_script_dir, "assets")
-            
-            if not os.path.isdir(assets_dir): 
-                try:
-                    os.makedirs(assets_dir)
-                    print(f"Direktori '{assets_dir}' dibuat. Harap letakkan 'um.png' di dalamnya.")
-                except OSError as e:
-                    print(f"Gagal membuat direktori '{assets_dir}': {e}")
-            
-            image_path = os.path.join(assets_dir, "um.png")
-
-            if not os.path.exists(image_path):
-                 messagebox.showwarning("Aset Tidak Ditemukan", f"File gambar '{image_path}' tidak ditemukan. Background akan default.")
-                 self.bg_image_tk = None
-                 return
+    def _start_asset_loading(self):
+        if not os.path.exists(self.asset_path):
+            return None
+        return PersiapanAset(self.asset_path, (self.appwidth, self.appheight))
 
-            bg_img_pil = Image.open(image_path).resize((self.appwidth, self.appheight))
-            self.bg_image_tk = ImageTk.PhotoImage(bg_img_pil)
-        except FileNotFoundError: 
-            messagebox.showwarning("Aset Tidak Ditemukan", f"Pastikan file '{self.asset_path}' ada di direktori 'assets'.")
-            self.bg_image_tk = None 
-        except Exception as e: 
+    def _load_assets(self, persiapan_aset):
+        if persiapan_aset is None:
+            messagebox.showwarning("Aset Tidak Ditemukan", f"File gambar '{self.asset_path}' tidak ditemukan. Background akan default.")
+            self.bg_image_tk = None
+            return
+        try:
+            self.bg_image_tk = persiapan_aset.photo_image(master=self.window)
+        except Exception as e:
             messagebox.showerror("Kesalahan Aset", f"Gagal memuat gambar: {e}")
-            self.bg_image_tk = None 
+            self.bg_image_tk = None
 
     def _draw_background(self):
+        if self.canvas.find_withtag("app_background"): return # Latar digambar sekali; layar menggambar di atasnya
         if self.bg_image_tk: 
             self.canvas.create_image(0, 0, image=self.bg_image_tk, anchor=NW, tags="app_background")
         else: 
             self.canvas.create_rectangle(0,0, self.appwidth, self.appheight, fill="#CCCCCC", tags="app_background")
 
-    def _clear_canvas_for_new_screen(self):
-        all_items = self.canvas.find_all()
-        for item in all_items:
-            if "app_background" not in self.canvas.gettags(item): 
-                self.canvas.delete(item)
-
     def quit(self):
         if messagebox.askokcancel("Keluar", "Anda yakin ingin keluar dari aplikasi?"):
+            self.db_worker.shutdown()
             if self.db_service: 
                 self.db_service._close()
             self.window.quit()
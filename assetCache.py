@@ -0,0 +1,84 @@
+import os
+import threading
+import tkinter as tk
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "assets")
+
+
+def cache_path(source_path, size, cache_dir=CACHE_DIR):
+    """
+    Lokasi salinan terskala `source_path` berukuran `size` (lebar, tinggi). Nama file memuat ukuran target
+    serta mtime dan ukuran file sumber, sehingga salinan lama otomatis tidak terpakai saat gambar sumber diganti.
+    """
+    info = os.stat(source_path)
+    nama = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(cache_dir, f"{nama}-{size[0]}x{size[1]}-{info.st_mtime_ns}-{info.st_size}.ppm")
+
+
+def _hapus_versi_lama(path_baru):
+    awalan = os.path.basename(path_baru).rsplit("-", 2)[0] + "-"
+    direktori = os.path.dirname(path_baru)
+    for nama_file in os.listdir(direktori):
+        if nama_file.startswith(awalan) and nama_file != os.path.basename(path_baru):
+            try:
+                os.remove(os.path.join(direktori, nama_file))
+            except OSError:
+                pass
+
+
+def siapkan_gambar_terskala(source_path, size, cache_dir=CACHE_DIR):
+    """
+    Mengembalikan path salinan PPM terskala di cache (dibuat sekali dengan PIL bila belum ada).
+    PPM dibaca langsung oleh tk.PhotoImage tanpa dekompresi PNG, resize, atau konversi ImageTk.
+    Jika cache tidak dapat ditulis, mengembalikan objek PIL.Image terskala sebagai gantinya.
+    """
+    path = cache_path(source_path, size, cache_dir)
+    if os.path.exists(path):
+        return path
+    from PIL import Image # Hanya diperlukan saat cache dibangun
+    with Image.open(source_path) as gambar:
+        gambar = gambar.convert("RGB")
+        if gambar.size != tuple(size):
+            gambar = gambar.resize(size)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        gambar.save(tmp_path, format="PPM")
+        os.replace(tmp_path, path)
+        _hapus_versi_lama(path)
+    except OSError as e:
+        print(f"Cache aset tidak dapat ditulis di '{cache_dir}': {e}")
+        return gambar
+    return path
+
+
+def muat_photo_image(hasil, master=None):
+    """Membuat PhotoImage dari hasil siapkan_gambar_terskala. Harus dipanggil di thread UI."""
+    if isinstance(hasil, str):
+        return tk.PhotoImage(master=master, file=hasil)
+    from PIL import ImageTk
+    return ImageTk.PhotoImage(hasil, master=master)
+
+
+class PersiapanAset:
+    """
+    Menjalankan siapkan_gambar_terskala di thread latar (misalnya selagi koneksi database dibuka);
+    PhotoImage-nya dibuat kemudian di thread UI dengan `photo_image`.
+    """
+    def __init__(self, source_path, size, cache_dir=CACHE_DIR):
+        self._hasil = None
+        self._error = None
+        self._thread = threading.Thread(target=self._jalankan, args=(source_path, size, cache_dir), name="asset-cache", daemon=True)
+        self._thread.start()
+
+    def _jalankan(self, source_path, size, cache_dir):
+        try:
+            self._hasil = siapkan_gambar_terskala(source_path, size, cache_dir)
+        except Exception as e:
+            self._error = e
+
+    def photo_image(self, master=None):
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return muat_photo_image(self._hasil, master)
@@ -0,0 +1,90 @@
+import csv
+import json
+import os
+from datetime import datetime
+
+
+def _watermark_path(output_path):
+    return f"{output_path}.watermark"
+
+
+def read_watermark(output_path):
+    """Membaca log_id terakhir yang sudah diekspor ke `output_path` (0 jika belum pernah)."""
+    try:
+        with open(_watermark_path(output_path), encoding="utf-8") as f:
+            return int(f.read().strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def _write_watermark(output_path, log_id):
+    """Menulis watermark secara atomik agar ekspor yang terputus dapat dilanjutkan dengan aman."""
+    tmp_path = f"{_watermark_path(output_path)}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(str(log_id))
+    os.replace(tmp_path, _watermark_path(output_path))
+
+
+def _to_text(value):
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return value
+
+
+def _atau_na(value):
+    return "N/A" if value is None else value
+
+
+def detail_perubahan(log):
+    """Ringkasan perpindahan kamar/fakultas satu baris log, dibentuk dari kolom mentah."""
+    lama = f"{_atau_na(log['nomor_kamar_lama'])} ({_atau_na(log['nama_asrama_lama'])})"
+    baru = f"{_atau_na(log['nomor_kamar_baru'])} ({_atau_na(log['nama_asrama_baru'])})"
+    if log['aksi'] == 'INSERT':
+        return f"Ke: {baru} - Fak: {_atau_na(log['fakultas_baru'])}"
+    if log['aksi'] == 'DELETE':
+        return f"Dari: {lama} - Fak: {_atau_na(log['fakultas_lama'])}"
+    return f"Dari: {lama} Fak: {_atau_na(log['fakultas_lama'])} Ke: {baru} Fak: {_atau_na(log['fakultas_baru'])}"
+
+
+def format_log(log):
+    """
+    Membentuk nilai tampilan satu baris log mentah (dict berkolom AUDIT_LOG_COLUMNS):
+    (log_id, waktu, aksi, nim, nama_terkait, detail_perubahan, keterangan_tambahan).
+    Dipanggil hanya untuk baris yang ditampilkan, bukan untuk setiap baris yang diambil dari server.
+    """
+    nama_terkait = log['nama_penghuni_baru'] if log['nama_penghuni_baru'] is not None else log['nama_penghuni_lama']
+    return (log['log_id'], _to_text(log['waktu_aksi']), log['aksi'], log['nim'], nama_terkait,
+            detail_perubahan(log), log['keterangan_tambahan'])
+
+
+def export_audit_log(db_service, output_path, fmt="csv", incremental=False, batch_size=1000, sertakan_arsip=False):
+    """
+    Mengekspor AuditLogAktivitasPenghuni ke CSV atau JSON Lines ("jsonl") secara streaming.
+    Pada mode incremental, ekspor dilanjutkan dari watermark log_id terakhir dan baris baru ditambahkan
+    ke akhir file. Mengembalikan (jumlah_baris_diekspor, log_id_terakhir).
+    Tanpa `sertakan_arsip`, log yang sudah dipindahkan oleh job retensi (auditRetention.py) tidak ikut diekspor.
+    """
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError(f"Format ekspor tidak dikenal: {fmt}")
+    after_log_id = read_watermark(output_path) if incremental and os.path.exists(output_path) else 0
+    mode = "a" if after_log_id else "w"
+    jumlah = 0
+    last_log_id = after_log_id
+    with open(output_path, mode, newline="", encoding="utf-8") as f:
+        writer = None
+        for kolom, batch in db_service.iter_audit_log_batches(after_log_id, batch_size, sertakan_arsip=sertakan_arsip):
+            if fmt == "csv":
+                if writer is None:
+                    writer = csv.writer(f)
+                    if mode == "w":
+                        writer.writerow(kolom)
+                writer.writerows([_to_text(v) for v in row] for row in batch)
+            else:
+                for row in batch:
+                    f.write(json.dumps({k: _to_text(v) for k, v in zip(kolom, row)}, ensure_ascii=False))
+                    f.write("\n")
+            f.flush()
+            jumlah += len(batch)
+            last_log_id = batch[-1][0]
+            _write_watermark(output_path, last_log_id)
+    return jumlah, last_log_id
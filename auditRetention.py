@@ -0,0 +1,27 @@
+import argparse
+import os
+from datetime import datetime, timedelta
+from dbService import DatabaseService
+
+
+def main():
+    """Job retensi: memindahkan log aktivitas yang lebih tua dari N hari ke tabel arsip."""
+    parser = argparse.ArgumentParser(description="Arsipkan log aktivitas penghuni yang sudah lama.")
+    parser.add_argument("--hari", type=int, default=365, help="Umur minimum log (hari) yang diarsipkan. Default 365.")
+    parser.add_argument("--chunk", type=int, default=500, help="Jumlah baris per transaksi. Default 500.")
+    parser.add_argument("--jeda", type=float, default=0.05, help="Jeda (detik) antar chunk. Default 0.05.")
+    args = parser.parse_args()
+
+    db_service = DatabaseService(host=os.getenv("DB_HOST", "localhost"), user=os.getenv("DB_USER", "root"),
+                                 password=os.getenv("DB_PASSWORD", ""), database_name=os.getenv("DB_NAME", "asrama_db_mysql"),
+                                 pool_min=1, pool_max=1)
+    if not db_service.is_connected():
+        raise SystemExit(1)
+    cutoff = datetime.now() - timedelta(days=args.hari)
+    print(f"Mengarsipkan log sebelum {cutoff:%Y-%m-%d %H:%M:%S} ...")
+    db_service.arsipkan_audit_log(cutoff, chunk_size=args.chunk, jeda_detik=args.jeda)
+    db_service._close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,14 @@
+import time
+from tkinter import ttk
+from tombol import tbl as buat_tombol, lupakan_tombol, reset_tombol
+
 class BaseScreen:
+    # Layar yang boleh disimpan ScreenManager dalam keadaan tersembunyi lalu ditampilkan ulang tanpa dibangun ulang.
+    # Form input tetap False agar isiannya selalu kosong saat dibuka.
+    dapat_disimpan = False
+    pakai_konteks_asrama = False # True jika layar membaca konteks asrama ScreenManager saat dibuat
+    KEDALUWARSA_DETIK = 60 # Data layar tersimpan dimuat ulang jika sudah lebih lama dari ini (perubahan dari komputer lain)
+
     def __init__(self, screen_manager, db_service):
         self.screen_manager = screen_manager
         self.db_service = db_service
@@ -6,20 +16,90 @@ class BaseScreen:
         self.canvas = self.app_instance.canvas
         self.widgets_on_screen = []
         self.canvas_items_on_screen = []
+        self._aktif = True
+        self.tag_layar = f"layar_{id(self)}"
+        self._generasi = 0
+        self._permintaan_tertunda = set()
+        self._posisi_place = {}
+        self._versi_data = getattr(db_service, "versi_data", 0)
+        self._dimuat_pada = time.monotonic()
+        self.kunci_layar = None
+    def is_active(self): return self._aktif
+    def run_db(self, fungsi, *args, on_success=None, on_error=None, **kwargs):
+        """Menjalankan pemanggilan database di DbWorker; callback dibuang jika layar ini sudah ditinggalkan atau disembunyikan."""
+        token = object()
+        self._permintaan_tertunda.add(token)
+        def selesai(callback):
+            def jalankan(hasil):
+                self._permintaan_tertunda.discard(token)
+                if callback: callback(hasil)
+            return jalankan
+        generasi = self._generasi
+        return self.app_instance.db_worker.submit(fungsi, *args, on_success=selesai(on_success),
+                                                  on_error=selesai(on_error) if on_error else None,
+                                                  is_current=lambda: self._aktif and self._generasi == generasi, **kwargs)
     def clear_screen_elements(self):
+        self._aktif = False
         for widget in self.widgets_on_screen: widget.destroy()
         self.widgets_on_screen = []
         for item in self.canvas_items_on_screen: self.canvas.delete(item)
+        lupakan_tombol(self.canvas, self.canvas_items_on_screen)
         self.canvas_items_on_screen = []
+    def hide(self):
+        """Menyembunyikan layar tanpa menghancurkannya: item canvas disembunyikan, widget yang di-place dilepas."""
+        self._aktif = False
+        self._generasi += 1
+        if self._permintaan_tertunda: # Hasilnya akan dibuang selagi tersembunyi; muat ulang saat ditampilkan lagi
+            self._permintaan_tertunda.clear()
+            self._versi_data = None
+        self.on_hide()
+        self.canvas.itemconfigure(self.tag_layar, state="hidden")
+        reset_tombol(self.canvas, self.canvas_items_on_screen)
+        self._posisi_place = {}
+        for widget in self.widgets_on_screen:
+            if widget.winfo_manager() == "place":
+                self._posisi_place[widget] = widget.place_info()
+                widget.place_forget()
+    def show(self):
+        """Menampilkan kembali layar yang disembunyikan; data dimuat ulang hanya jika sudah berubah atau kedaluwarsa."""
+        self.canvas.itemconfigure(self.tag_layar, state="normal")
+        for widget, info in self._posisi_place.items(): widget.place(**info)
+        self._posisi_place = {}
+        self._aktif = True
+        self.on_show()
+        if self._versi_data != self.db_service.versi_data or time.monotonic() - self._dimuat_pada >= self.KEDALUWARSA_DETIK:
+            self._versi_data = self.db_service.versi_data
+            self._dimuat_pada = time.monotonic()
+            self.refresh_data()
+    def bobot(self):
+        """Perkiraan ukuran layar untuk batas memori cache ScreenManager (item canvas, widget, dan baris Treeview)."""
+        jumlah = len(self.canvas_items_on_screen) + len(self.widgets_on_screen)
+        for widget in self.widgets_on_screen:
+            if isinstance(widget, ttk.Treeview): jumlah += len(widget.get_children())
+        return jumlah
+    def on_hide(self): pass
+    def on_show(self): pass
+    def refresh_data(self):
+        """Memuat ulang panel data layar tersimpan setelah data berubah. Subclass dengan data dari database meng-override ini."""
+        pass
     def add_widget(self, widget):
         self.widgets_on_screen.append(widget)
         return widget
-    def create_canvas_text(self, *args, **kwargs):
-        item = self.canvas.create_text(*args, **kwargs)
+    def _catat_item(self, item):
+        self.canvas.addtag_withtag(self.tag_layar, item)
         self.canvas_items_on_screen.append(item)
         return item
+    def create_canvas_text(self, *args, **kwargs):
+        return self._catat_item(self.canvas.create_text(*args, **kwargs))
     def create_canvas_image(self, *args, **kwargs):
-        item = self.canvas.create_image(*args, **kwargs)
-        self.canvas_items_on_screen.append(item)
-        return item
+        return self._catat_item(self.canvas.create_image(*args, **kwargs))
+    def create_canvas_rectangle(self, *args, **kwargs):
+        return self._catat_item(self.canvas.create_rectangle(*args, **kwargs))
+    def create_canvas_window(self, *args, **kwargs):
+        return self._catat_item(self.canvas.create_window(*args, **kwargs))
+    def tbl(self, *args, **kwargs):
+        """Membuat tombol (tombol.tbl) di canvas layar ini dan mencatat itemnya agar ikut dihapus saat layar ditinggalkan."""
+        items = buat_tombol(self.canvas, *args, **kwargs)
+        for item in items: self._catat_item(item)
+        return items
     def setup_ui(self): raise NotImplementedError("Subclass harus mengimplementasikan metode setup_ui")
@@ -0,0 +1 @@
+"""Micro-benchmark untuk DatabaseService. Jalankan dengan `python -m benchmark.<nama_modul>`."""
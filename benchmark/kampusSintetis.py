@@ -0,0 +1,229 @@
+import argparse
+import json
+import math
+import os
+import random
+import time
+from datetime import datetime, timedelta
+import mysql.connector
+from schemaMigrator import ensure_schema
+
+DATABASE_DEFAULT = "asrama_bench"
+TABEL_METADATA = "benchmark_kampus"
+NIM_AWAL = 200000000 # NIM penghuni sintetis; benchmark.suite memakai 9xxxxxxxx untuk penghuni sementaranya
+
+NAMA_ASRAMA = ["Aster", "Soka", "Tulip", "Edelweiss", "Lily", "Dahlia", "Melati", "Anyelir"] # Sama dengan data awal query.ddl
+NAMA_DEPAN = ["Adi", "Ayu", "Bagus", "Citra", "Dewi", "Eka", "Fajar", "Gita", "Hadi", "Indah", "Joko", "Kartika", "Lestari",
+              "Made", "Nur", "Putri", "Rizki", "Sari", "Teguh", "Wahyu", "Yoga", "Zahra", "Bima", "Rina", "Agus", "Siti"]
+NAMA_BELAKANG = ["Pratama", "Saputra", "Wijaya", "Lestari", "Hidayat", "Nugroho", "Santoso", "Kusuma", "Permata", "Setiawan",
+                 "Rahmawati", "Susanto", "Utami", "Gunawan", "Purnomo", "Anggraini", "Halim", "Siregar", "Nasution", "Wibowo"]
+
+KOLOM_AUDIT = ("nim", "nama_penghuni_lama", "nama_penghuni_baru", "fakultas_lama", "fakultas_baru", "kamar_id_internal_lama",
+               "kamar_id_internal_baru", "nomor_kamar_lama", "nama_asrama_lama", "nomor_kamar_baru", "nama_asrama_baru",
+               "aksi", "waktu_aksi", "keterangan_tambahan")
+
+
+def _nama(rng):
+    return f"{rng.choice(NAMA_DEPAN)} {rng.choice(NAMA_BELAKANG)}"
+
+
+def _nomor_kamar(indeks, kamar_per_lantai):
+    """Kamar ke-`indeks` (mulai 0) dalam satu asrama: 101, 102, ..., lalu 201 setelah `kamar_per_lantai` kamar."""
+    return (1 + indeks // kamar_per_lantai) * 100 + indeks % kamar_per_lantai + 1
+
+
+def _siapkan_database(args):
+    """Membuat (atau dengan --reset, membuat ulang) database benchmark lalu menerapkan query.ddl lewat schemaMigrator."""
+    conn = mysql.connector.connect(host=args.host, user=args.user, password=args.password)
+    cursor = conn.cursor()
+    if args.reset:
+        cursor.execute(f"DROP DATABASE IF EXISTS `{args.database}`")
+    cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{args.database}` CHARACTER SET utf8mb4")
+    cursor.close()
+    conn.database = args.database
+    ensure_schema(conn)
+    cursor = conn.cursor()
+    cursor.execute("SELECT (SELECT COUNT(*) FROM Penghuni) + (SELECT COUNT(*) FROM AuditLogAktivitasPenghuni)")
+    if cursor.fetchone()[0]:
+        conn.close()
+        raise SystemExit(f"Database '{args.database}' sudah berisi penghuni/log. Gunakan --reset untuk membuatnya ulang.")
+    # Data contoh dari query.ddl diganti seluruhnya oleh kampus sintetis (belum ada penghuni, jadi tidak ada trigger yang terpicu).
+    cursor.execute("DELETE FROM Kamar")
+    cursor.execute("DELETE FROM Asrama")
+    conn.commit()
+    cursor.close()
+    return conn
+
+
+def _isi_asrama_dan_kamar(conn, args, rng):
+    """Mengembalikan daftar (kamar_id_internal, asrama_id, nama_asrama, nomor_kamar, kapasitas)."""
+    cursor = conn.cursor()
+    asrama = [(i, NAMA_ASRAMA[i - 1] if i <= len(NAMA_ASRAMA) else f"Asrama {i}") for i in range(1, args.asrama + 1)]
+    cursor.executemany("INSERT INTO Asrama (asrama_id, nama_asrama) VALUES (%s, %s)", asrama)
+    # Kapasitas dasar dipilih agar seluruh penghuni muat dengan tingkat hunian sekitar --okupansi.
+    total_kamar = args.asrama * args.kamar
+    kapasitas_dasar = max(2, math.ceil(args.penghuni / (total_kamar * args.okupansi)))
+    kamar = [(nomor, asrama_id, kapasitas_dasar + (1 if rng.random() < 0.3 else 0))
+             for asrama_id, _ in asrama for nomor in (_nomor_kamar(i, args.kamar_per_lantai) for i in range(args.kamar))]
+    for i in range(0, len(kamar), args.chunk):
+        cursor.executemany("INSERT INTO Kamar (nomor_kamar, asrama_id, kapasitas) VALUES (%s, %s, %s)", kamar[i:i + args.chunk])
+    conn.commit()
+    cursor.execute("SELECT K.kamar_id_internal, K.asrama_id, A.nama_asrama, K.nomor_kamar, K.kapasitas "
+                   "FROM Kamar K JOIN Asrama A ON K.asrama_id = A.asrama_id ORDER BY K.kamar_id_internal")
+    hasil = cursor.fetchall()
+    cursor.close()
+    return hasil
+
+
+def _fakultas(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT fakultas_id, nama_fakultas FROM Fakultas ORDER BY fakultas_id")
+    hasil = cursor.fetchall()
+    cursor.close()
+    return hasil
+
+
+def _baris_audit_historis(jumlah, kamar, fakultas, args, rng):
+    """
+    Menghasilkan (yield) baris log aktivitas lama (INSERT/UPDATE/DELETE) berurutan waktu, berakhir sebelum penghuni
+    sintetis dimasukkan, sehingga urutan log_id tetap searah dengan waktu_aksi seperti pada data yang tumbuh alami.
+    """
+    sekarang = datetime.now().replace(microsecond=0)
+    awal = sekarang - timedelta(days=args.hari)
+    langkah = (sekarang - awal) / max(jumlah, 1)
+    jumlah_nim = max(args.penghuni * 3, 1) # Termasuk penghuni yang sudah keluar
+    for n in range(jumlah):
+        waktu = awal + langkah * n
+        nim = str(NIM_AWAL + rng.randrange(jumlah_nim))
+        nama = _nama(rng)
+        fak = rng.choice(fakultas)[1]
+        k_lama = rng.choice(kamar)
+        k_baru = rng.choice(kamar)
+        aksi = rng.choices(("INSERT", "UPDATE", "DELETE"), weights=(4, 5, 1))[0]
+        if aksi == "INSERT":
+            yield (nim, None, nama, None, fak, None, k_baru[0], None, None, k_baru[3], k_baru[2], aksi, waktu,
+                   f"Penghuni baru ditambahkan ke kamar {k_baru[3]} Asrama {k_baru[2]}")
+        elif aksi == "DELETE":
+            yield (nim, nama, None, fak, None, k_lama[0], None, k_lama[3], k_lama[2], None, None, aksi, waktu,
+                   f"Penghuni dihapus dari kamar {k_lama[3]} Asrama {k_lama[2]}")
+        else:
+            yield (nim, nama, nama, fak, fak, k_lama[0], k_baru[0], k_lama[3], k_lama[2], k_baru[3], k_baru[2], aksi, waktu,
+                   f"Penghuni pindah dari kamar {k_lama[3]} Asrama {k_lama[2]} ke kamar {k_baru[3]} Asrama {k_baru[2]}.")
+
+
+def _isi_audit_historis(conn, jumlah, kamar, fakultas, args, rng):
+    query = (f"INSERT INTO AuditLogAktivitasPenghuni ({', '.join(KOLOM_AUDIT)}) "
+             f"VALUES ({', '.join(['%s'] * len(KOLOM_AUDIT))})")
+    cursor = conn.cursor()
+    chunk = []
+    ditulis = 0
+    for baris in _baris_audit_historis(jumlah, kamar, fakultas, args, rng):
+        chunk.append(baris)
+        if len(chunk) >= args.chunk:
+            cursor.executemany(query, chunk)
+            conn.commit()
+            ditulis += len(chunk)
+            chunk = []
+            if ditulis % (args.chunk * 100) == 0:
+                print(f"  log aktivitas: {ditulis}/{jumlah}")
+    if chunk:
+        cursor.executemany(query, chunk)
+        conn.commit()
+    cursor.close()
+
+
+def _isi_penghuni(conn, kamar, fakultas, args, rng):
+    """Menempatkan penghuni ke slot kamar acak. Trigger trg_LogInsertPenghuni memelihara jumlah_penghuni dan menulis log."""
+    slot = [k[0] for k in kamar for _ in range(k[4])]
+    rng.shuffle(slot)
+    if len(slot) < args.penghuni:
+        raise SystemExit(f"Kapasitas total {len(slot)} lebih kecil dari {args.penghuni} penghuni.")
+    query = "INSERT INTO Penghuni (nim, nama_penghuni, fakultas_id, kamar_id_internal) VALUES (%s, %s, %s, %s)"
+    cursor = conn.cursor()
+    for mulai in range(0, args.penghuni, args.chunk):
+        chunk = [(str(NIM_AWAL + i), _nama(rng), None if rng.random() < 0.05 else rng.choice(fakultas)[0], slot[i])
+                 for i in range(mulai, min(mulai + args.chunk, args.penghuni))]
+        cursor.executemany(query, chunk)
+        conn.commit()
+        if (mulai // args.chunk) % 10 == 9:
+            print(f"  penghuni: {mulai + len(chunk)}/{args.penghuni}")
+    cursor.close()
+
+
+def _simpan_metadata(conn, parameter):
+    cursor = conn.cursor()
+    cursor.execute(f"CREATE TABLE IF NOT EXISTS {TABEL_METADATA} (id INT PRIMARY KEY, parameter JSON NOT NULL, "
+                   f"dibuat_pada TIMESTAMP DEFAULT CURRENT_TIMESTAMP) ENGINE=InnoDB")
+    cursor.execute(f"REPLACE INTO {TABEL_METADATA} (id, parameter) VALUES (1, %s)", (json.dumps(parameter),))
+    conn.commit()
+    cursor.close()
+
+
+def baca_metadata(conn):
+    """Parameter kampus sintetis yang tersimpan di database benchmark, atau None jika database tidak dibuat oleh modul ini."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"SELECT parameter FROM {TABEL_METADATA} WHERE id = 1")
+        row = cursor.fetchone()
+    except mysql.connector.Error:
+        return None
+    finally:
+        cursor.close()
+    return json.loads(row[0]) if row else None
+
+
+def main():
+    """
+    Mengisi database MySQL lokal dengan kampus sintetis yang dapat diulang (seed tetap):
+    asrama x kamar, penghuni, dan log aktivitas historis, untuk dipakai `python -m benchmark.suite`.
+    """
+    parser = argparse.ArgumentParser(description="Generator kampus sintetis untuk benchmark DatabaseService.")
+    parser.add_argument("--database", default=os.getenv("BENCH_DB_NAME", DATABASE_DEFAULT),
+                        help=f"Database tujuan (dibuat bila belum ada). Default {DATABASE_DEFAULT}.")
+    parser.add_argument("--host", default=os.getenv("DB_HOST", "localhost"))
+    parser.add_argument("--user", default=os.getenv("DB_USER", "root"))
+    parser.add_argument("--password", default=os.getenv("DB_PASSWORD", ""))
+    parser.add_argument("--asrama", type=int, default=50, help="Jumlah asrama. Default 50.")
+    parser.add_argument("--kamar", type=int, default=300, help="Jumlah kamar per asrama. Default 300.")
+    parser.add_argument("--kamar-per-lantai", type=int, default=20, help="Kamar per lantai (101..120, 201..). Default 20.")
+    parser.add_argument("--penghuni", type=int, default=100000, help="Jumlah penghuni. Default 100000.")
+    parser.add_argument("--audit", type=int, default=5000000,
+                        help="Total baris log aktivitas, termasuk log INSERT dari trigger untuk setiap penghuni. Default 5000000.")
+    parser.add_argument("--okupansi", type=float, default=0.85, help="Perkiraan tingkat hunian kamar (0-1). Default 0.85.")
+    parser.add_argument("--hari", type=int, default=730, help="Rentang waktu log historis dalam hari. Default 730.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed generator acak. Default 1.")
+    parser.add_argument("--chunk", type=int, default=5000, help="Baris per executemany/commit. Default 5000.")
+    parser.add_argument("--reset", action="store_true", help="Hapus dan buat ulang database tujuan terlebih dahulu.")
+    args = parser.parse_args()
+    if args.database == os.getenv("DB_NAME", "asrama_db_mysql"):
+        raise SystemExit(f"Menolak mengisi database aplikasi '{args.database}'; gunakan database terpisah untuk benchmark.")
+    if not 0 < args.okupansi <= 1:
+        raise SystemExit("--okupansi harus di antara 0 dan 1.")
+
+    rng = random.Random(args.seed)
+    mulai = time.perf_counter()
+    conn = _siapkan_database(args)
+    try:
+        kamar = _isi_asrama_dan_kamar(conn, args, rng)
+        fakultas = _fakultas(conn)
+        print(f"{args.asrama} asrama, {len(kamar)} kamar, {len(fakultas)} fakultas.")
+        historis = max(0, args.audit - args.penghuni)
+        print(f"Menulis {historis} log aktivitas historis ...")
+        _isi_audit_historis(conn, historis, kamar, fakultas, args, rng)
+        print(f"Menambahkan {args.penghuni} penghuni (trigger menulis {args.penghuni} log INSERT) ...")
+        _isi_penghuni(conn, kamar, fakultas, args, rng)
+        cursor = conn.cursor()
+        for tabel in ("Asrama", "Kamar", "Penghuni", "AuditLogAktivitasPenghuni"):
+            cursor.execute(f"ANALYZE TABLE {tabel}")
+            cursor.fetchall()
+        cursor.close()
+        parameter = {nama: getattr(args, nama) for nama in ("asrama", "kamar", "kamar_per_lantai", "penghuni", "audit",
+                                                             "okupansi", "hari", "seed")}
+        _simpan_metadata(conn, parameter)
+    finally:
+        conn.close()
+    print(f"Kampus sintetis '{args.database}' selesai dalam {time.perf_counter() - mulai:.1f} detik.")
+
+
+if __name__ == "__main__":
+    main()
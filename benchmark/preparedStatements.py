@@ -0,0 +1,66 @@
+import argparse
+import os
+import statistics
+import time
+from dbService import DatabaseService
+
+
+def _ukur(fungsi, iterasi):
+    """Menjalankan `fungsi` sebanyak `iterasi` kali dan mengembalikan daftar latensi (ms)."""
+    latensi = []
+    for _ in range(iterasi):
+        mulai = time.perf_counter()
+        fungsi()
+        latensi.append((time.perf_counter() - mulai) * 1000)
+    return latensi
+
+
+def _sampel(db_service):
+    """Memilih satu kamar berpenghuni (atau kamar pertama) sebagai data uji."""
+    for asrama in db_service.get_all_asrama():
+        for nomor_kamar in db_service.get_all_kamar_in_asrama(asrama['asrama_id']):
+            snapshot = db_service.get_room_snapshot(nomor_kamar, asrama['asrama_id'])
+            if snapshot and snapshot['penghuni']:
+                return nomor_kamar, asrama['asrama_id'], snapshot['penghuni'][0]['nim']
+    raise SystemExit("Tidak ada kamar berpenghuni untuk dijadikan sampel benchmark.")
+
+
+def main():
+    """Membandingkan latensi metode DatabaseService dengan dan tanpa server-side prepared statement."""
+    parser = argparse.ArgumentParser(description="Benchmark prepared statement DatabaseService.")
+    parser.add_argument("--iterasi", type=int, default=500, help="Jumlah pemanggilan per metode. Default 500.")
+    parser.add_argument("--pemanasan", type=int, default=20, help="Pemanggilan pemanasan yang tidak diukur. Default 20.")
+    args = parser.parse_args()
+
+    db_service = DatabaseService(host=os.getenv("DB_HOST", "localhost"), user=os.getenv("DB_USER", "root"),
+                                 password=os.getenv("DB_PASSWORD", ""), database_name=os.getenv("DB_NAME", "asrama_db_mysql"),
+                                 pool_min=1, pool_max=1)
+    if not db_service.is_connected():
+        raise SystemExit(1)
+    nomor_kamar, asrama_id, nim = _sampel(db_service)
+    kamar_id = db_service.get_kamar_id_internal(nomor_kamar, asrama_id)
+    metode = {
+        "get_kapasitas_kamar": lambda: db_service.get_kapasitas_kamar(nomor_kamar, asrama_id),
+        "get_jumlah_penghuni": lambda: db_service.get_jumlah_penghuni(nomor_kamar, asrama_id),
+        "get_kamar_id_internal (DB)": lambda: db_service._execute_prepared('kamar_id_internal', (nomor_kamar, asrama_id), fetch_one=True),
+        "get_penghuni_in_kamar": lambda: db_service.get_penghuni_in_kamar(nomor_kamar, asrama_id),
+        "get_room_snapshot": lambda: db_service.get_room_snapshot(nomor_kamar, asrama_id),
+        "cek NIM (update_penghuni)": lambda: db_service._execute_prepared('nim_exists', (nim,), fetch_one=True),
+    }
+    print(f"Sampel: kamar {nomor_kamar}, asrama {asrama_id}, kamar_id_internal {kamar_id}, NIM {nim}; {args.iterasi} iterasi.")
+    print(f"{'Metode':<30}{'biasa p50':>12}{'prepared p50':>14}{'biasa p95':>12}{'prepared p95':>14}{'selisih p50':>13}")
+    for nama, fungsi in metode.items():
+        hasil = {}
+        for prepared in (False, True):
+            db_service.use_prepared_statements = prepared
+            _ukur(fungsi, args.pemanasan)
+            latensi = sorted(_ukur(fungsi, args.iterasi))
+            hasil[prepared] = (statistics.median(latensi), latensi[int(len(latensi) * 0.95) - 1])
+        selisih = (hasil[True][0] - hasil[False][0]) / hasil[False][0] * 100 if hasil[False][0] else 0.0
+        print(f"{nama:<30}{hasil[False][0]:>10.3f}ms{hasil[True][0]:>12.3f}ms"
+              f"{hasil[False][1]:>10.3f}ms{hasil[True][1]:>12.3f}ms{selisih:>12.1f}%")
+    db_service._close()
+
+
+if __name__ == "__main__":
+    main()
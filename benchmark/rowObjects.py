@@ -0,0 +1,93 @@
+import argparse
+import gc
+import os
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from records import AuditEntry
+
+# Menghasilkan baris berbentuk log aktivitas di server tanpa bergantung pada isi tabel.
+KUERI_SINTETIS = """
+    WITH RECURSIVE seq (n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < %s)
+    SELECT n AS log_id, NOW() - INTERVAL n SECOND AS waktu_aksi, ELT(1 + n %% 3, 'INSERT', 'UPDATE', 'DELETE') AS aksi,
+           CAST(100000000 + n AS CHAR) AS nim, CONCAT('Penghuni Lama ', n) AS nama_penghuni_lama,
+           CONCAT('Penghuni Baru ', n) AS nama_penghuni_baru, 'Teknik' AS fakultas_lama, 'Teknik' AS fakultas_baru,
+           100 + n %% 40 AS nomor_kamar_lama, 'Asrama A' AS nama_asrama_lama, 200 + n %% 40 AS nomor_kamar_baru,
+           'Asrama B' AS nama_asrama_baru, NULL AS keterangan_tambahan
+    FROM seq
+"""
+
+
+def _ukur(fungsi, iterasi):
+    """Mengembalikan (latensi p50 ms, puncak memori MB, memori hasil yang ditahan MB) dari `iterasi` pemanggilan."""
+    latensi = []
+    for _ in range(iterasi):
+        gc.collect()
+        mulai = time.perf_counter()
+        hasil = fungsi()
+        latensi.append((time.perf_counter() - mulai) * 1000)
+        del hasil
+    gc.collect()
+    tracemalloc.start()
+    hasil = fungsi()
+    ditahan, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del hasil
+    return statistics.median(latensi), puncak / 2**20, ditahan / 2**20
+
+
+def _baris_sintetis(jumlah):
+    awal = datetime(2024, 1, 1)
+    return [(n, awal + timedelta(seconds=n), ("INSERT", "UPDATE", "DELETE")[n % 3], str(100000000 + n), f"Penghuni Lama {n}",
+             f"Penghuni Baru {n}", "Teknik", "Teknik", 100 + n % 40, "Asrama A", 200 + n % 40, "Asrama B", None)
+            for n in range(1, jumlah + 1)]
+
+
+def _cetak(judul, hasil):
+    print(f"{judul:<34}{hasil[0]:>10.1f}ms{hasil[1]:>12.1f}MB{hasil[2]:>12.1f}MB")
+
+
+def main():
+    """Membandingkan cursor dictionary=True dengan cursor tuple + record __slots__ pada hasil berukuran besar."""
+    parser = argparse.ArgumentParser(description="Benchmark dict cursor vs record __slots__.")
+    parser.add_argument("--baris", type=int, default=100000, help="Jumlah baris hasil. Default 100000.")
+    parser.add_argument("--iterasi", type=int, default=5, help="Pengulangan pengukuran latensi. Default 5.")
+    parser.add_argument("--tanpa-db", action="store_true", help="Hanya mengukur pemetaan baris di Python dari tuple sintetis.")
+    args = parser.parse_args()
+
+    print(f"{args.baris} baris, {args.iterasi} iterasi.")
+    print(f"{'Mode':<34}{'p50':>12}{'puncak':>14}{'ditahan':>14}")
+    if args.tanpa_db:
+        baris = _baris_sintetis(args.baris)
+        kolom = AuditEntry.__slots__
+        _cetak("dict per baris", _ukur(lambda: [dict(zip(kolom, row)) for row in baris], args.iterasi))
+        buat = AuditEntry.pembuat(kolom)
+        _cetak("record AuditEntry", _ukur(lambda: [buat(row) for row in baris], args.iterasi))
+        return
+
+    from dbService import DatabaseService
+    db_service = DatabaseService(host=os.getenv("DB_HOST", "localhost"), user=os.getenv("DB_USER", "root"),
+                                 password=os.getenv("DB_PASSWORD", ""), database_name=os.getenv("DB_NAME", "asrama_db_mysql"),
+                                 pool_min=1, pool_max=1)
+    if not db_service.is_connected():
+        raise SystemExit(1)
+
+    def ambil_dict():
+        with db_service._cursor() as (conn, cursor):
+            cursor.execute("SET SESSION cte_max_recursion_depth = %s", (args.baris + 1,))
+            cursor.execute(KUERI_SINTETIS, (args.baris,))
+            return cursor.fetchall()
+
+    def ambil_record():
+        with db_service._cursor(dictionary=False) as (conn, cursor):
+            cursor.execute("SET SESSION cte_max_recursion_depth = %s", (args.baris + 1,))
+        return db_service._fetch_records(AuditEntry, KUERI_SINTETIS, (args.baris,))
+
+    _cetak("cursor dictionary=True", _ukur(ambil_dict, args.iterasi))
+    _cetak("cursor tuple + AuditEntry", _ukur(ambil_record, args.iterasi))
+    db_service._close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+DIREKTORI_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASET = os.path.join(DIREKTORI_REPO, "assets", "um.png")
+UKURAN = (1080, 700)
+
+# Setiap varian dijalankan di proses Python baru agar biaya import (PIL, ImageTk) ikut terukur seperti saat cold start.
+KODE_LAMA = """
+from PIL import Image, ImageTk
+gambar = Image.open({aset!r}).resize({ukuran!r})
+if root is not None: ImageTk.PhotoImage(gambar, master=root)
+else: gambar.tobytes()
+"""
+KODE_CACHE = """
+from assetCache import siapkan_gambar_terskala, muat_photo_image
+hasil = siapkan_gambar_terskala({aset!r}, {ukuran!r}, {cache_dir!r})
+if root is not None: muat_photo_image(hasil, master=root)
+else:
+    with open(hasil, "rb") as f: f.read()
+"""
+PEMBUNGKUS = """
+import sys, time
+sys.path.insert(0, {repo!r})
+try:
+    import tkinter as tk
+    root = tk.Tk() if {pakai_tk!r} else None
+except tk.TclError:
+    root = None
+mulai = time.perf_counter()
+{kode}
+print((time.perf_counter() - mulai) * 1000, root is not None)
+"""
+
+
+def _jalankan(kode, pakai_tk):
+    skrip = PEMBUNGKUS.format(repo=DIREKTORI_REPO, pakai_tk=pakai_tk, kode=kode)
+    keluaran = subprocess.run([sys.executable, "-c", skrip], capture_output=True, text=True, check=True).stdout.split()
+    return float(keluaran[0]), keluaran[1] == "True"
+
+
+def main():
+    """Mengukur waktu cold start pemuatan gambar latar: PNG + resize setiap start vs salinan PPM terskala di cache."""
+    parser = argparse.ArgumentParser(description="Benchmark pemuatan gambar latar saat start.")
+    parser.add_argument("--iterasi", type=int, default=10, help="Jumlah proses per varian. Default 10.")
+    parser.add_argument("--tanpa-tk", action="store_true", help="Tidak membuat PhotoImage (untuk lingkungan tanpa display).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        varian = {
+            "PNG + resize (lama)": KODE_LAMA.format(aset=ASET, ukuran=UKURAN),
+            "cache PPM (hangat)": KODE_CACHE.format(aset=ASET, ukuran=UKURAN, cache_dir=cache_dir),
+        }
+        pertama, dengan_tk = _jalankan(varian["cache PPM (hangat)"], not args.tanpa_tk) # Membangun cache (start pertama)
+        print(f"PhotoImage dibuat: {'ya' if dengan_tk else 'tidak (tanpa display)'}; start pertama membangun cache: {pertama:.1f}ms")
+        print(f"{'Varian':<24}{'p50':>10}{'min':>10}{'maks':>10}")
+        for nama, kode in varian.items():
+            latensi = sorted(_jalankan(kode, not args.tanpa_tk)[0] for _ in range(args.iterasi))
+            print(f"{nama:<24}{statistics.median(latensi):>8.1f}ms{latensi[0]:>8.1f}ms{latensi[-1]:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime
+from benchmark.kampusSintetis import DATABASE_DEFAULT, baca_metadata
+from dbService import DatabaseService
+
+DIREKTORI_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VERSI_FORMAT = 1
+PERSENTIL = (50, 95, 99)
+NIM_SEMENTARA = 900000000 # Penghuni yang dibuat dan dihapus selama benchmark; tidak bertabrakan dengan NIM kampus sintetis
+TABEL_TANPA_TRIGGER = "benchmark_PenghuniTanpaTrigger" # Salinan struktur Penghuni tanpa trigger, pembanding biaya trigger
+
+
+def persentil(terurut, p):
+    """Persentil nearest-rank dari daftar yang sudah terurut."""
+    return terurut[max(0, math.ceil(p / 100 * len(terurut)) - 1)]
+
+
+def ringkas(latensi):
+    terurut = sorted(latensi)
+    hasil = {"n": len(terurut)}
+    for p in PERSENTIL:
+        hasil[f"p{p}_ms"] = round(persentil(terurut, p), 4)
+    hasil.update(min_ms=round(terurut[0], 4), maks_ms=round(terurut[-1], 4), rata_ms=round(sum(terurut) / len(terurut), 4))
+    return hasil
+
+
+class _DatabaseServiceBenchmark(DatabaseService):
+    """DatabaseService yang hanya mencatat pesan _notify alih-alih membuka messagebox, agar dapat berjalan tanpa display."""
+    def _notify(self, fungsi_dialog, *args):
+        self.pesan_terakhir = args
+
+
+class Suite:
+    """
+    Mengukur setiap kasus sebanyak `iterasi` kali setelah `pemanasan` pemanggilan. `siapkan` dan `pulihkan`
+    (opsional, tidak ikut diukur) dijalankan sebelum dan sesudah setiap pemanggilan, sehingga kasus yang
+    mengubah data meninggalkan database dalam keadaan semula.
+    """
+    def __init__(self, iterasi, pemanasan, pola=None):
+        self.iterasi = iterasi
+        self.pemanasan = pemanasan
+        self.pola = re.compile(pola) if pola else None
+        self.hasil = []
+
+    def ukur(self, nama, kategori, fungsi, siapkan=None, pulihkan=None, iterasi=None):
+        if self.pola and not self.pola.search(nama):
+            return None
+        iterasi = iterasi or self.iterasi
+        latensi = []
+        with open(os.devnull, "w") as senyap, contextlib.redirect_stdout(senyap): # DatabaseService mencetak log per operasi
+            for i in range(self.pemanasan + iterasi):
+                konteks = siapkan() if siapkan else None
+                mulai = time.perf_counter()
+                fungsi(konteks) if siapkan else fungsi()
+                durasi = (time.perf_counter() - mulai) * 1000
+                if pulihkan: pulihkan(konteks)
+                if i >= self.pemanasan:
+                    latensi.append(durasi)
+        entri = {"nama": nama, "kategori": kategori, **ringkas(latensi)}
+        self.hasil.append(entri)
+        print(f"{nama:<52}{entri['p50_ms']:>10.3f}{entri['p95_ms']:>10.3f}{entri['p99_ms']:>10.3f}")
+        return entri
+
+
+class _Kampus:
+    """Sampel data dari database benchmark dan pembantu SQL mentah untuk menyiapkan/memulihkan kasus yang mengubah data."""
+    def __init__(self, db_service):
+        self.db = db_service
+        self._nim_berikut = NIM_SEMENTARA
+        self.hapus_penghuni_sementara()
+        self.kamar_kosong = self._satu("SELECT nomor_kamar, asrama_id, kamar_id_internal FROM Kamar "
+                                       "WHERE kapasitas - jumlah_penghuni >= 2 ORDER BY kamar_id_internal LIMIT 1")
+        if not self.kamar_kosong:
+            raise SystemExit("Tidak ada kamar dengan minimal 2 tempat kosong; isi ulang dengan --okupansi yang lebih rendah.")
+        self.penghuni = self._satu("SELECT P.nim, P.nama_penghuni, F.nama_fakultas, K.nomor_kamar, K.asrama_id, K.kamar_id_internal "
+                                   "FROM Penghuni P JOIN Kamar K ON P.kamar_id_internal = K.kamar_id_internal "
+                                   "LEFT JOIN Fakultas F ON P.fakultas_id = F.fakultas_id "
+                                   "WHERE P.kamar_id_internal <> %s ORDER BY P.nim LIMIT 1", (self.kamar_kosong[2],))
+        if not self.penghuni:
+            raise SystemExit("Database benchmark belum berisi penghuni; jalankan `python -m benchmark.kampusSintetis` terlebih dahulu.")
+        self.log_id_min, self.log_id_maks = self._satu("SELECT MIN(log_id), MAX(log_id) FROM AuditLogAktivitasPenghuni")
+        self.log_id_awal = self.log_id_maks or 0 # Log di atas ini ditulis trigger selama benchmark; dihapus oleh hapus_log_benchmark
+        self.fakultas = [row[0] for row in self._semua("SELECT nama_fakultas FROM Fakultas ORDER BY fakultas_id")]
+        self.nims = [row[0] for row in self._semua("SELECT nim FROM Penghuni ORDER BY nim LIMIT 1000")]
+
+    def _satu(self, query, params=()):
+        with self.db._cursor(dictionary=False) as (conn, cursor):
+            cursor.execute(query, params)
+            return cursor.fetchone()
+
+    def _semua(self, query, params=()):
+        with self.db._cursor(dictionary=False) as (conn, cursor):
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    def tulis(self, query, params=(), banyak=False):
+        with self.db._cursor(dictionary=False) as (conn, cursor):
+            (cursor.executemany if banyak else cursor.execute)(query, params)
+            conn.commit()
+
+    def nim_baru(self, jumlah=1):
+        nims = [str(self._nim_berikut + i) for i in range(jumlah)]
+        self._nim_berikut += jumlah
+        return nims
+
+    def slot_kosong(self, jumlah, kecuali=()):
+        """Daftar (nomor_kamar, asrama_id, kamar_id_internal) sebanyak `jumlah` tempat kosong, satu baris per tempat."""
+        slot = []
+        for nomor, asrama_id, kamar_id, sisa in self._semua(
+                "SELECT nomor_kamar, asrama_id, kamar_id_internal, kapasitas - jumlah_penghuni FROM Kamar "
+                "WHERE jumlah_penghuni < kapasitas ORDER BY kamar_id_internal LIMIT %s", (jumlah + len(kecuali) + 1,)):
+            if kamar_id in kecuali: continue
+            slot.extend([(nomor, asrama_id, kamar_id)] * sisa)
+            if len(slot) >= jumlah: return slot[:jumlah]
+        raise SystemExit(f"Tempat kosong tidak cukup untuk {jumlah} penghuni sementara.")
+
+    def tambah_penghuni(self, slot):
+        """Menyisipkan penghuni sementara ke `slot` dengan SQL mentah; mengembalikan NIM-nya."""
+        nims = self.nim_baru(len(slot))
+        self.tulis("INSERT INTO Penghuni (nim, nama_penghuni, fakultas_id, kamar_id_internal) VALUES (%s, 'Penghuni Benchmark', NULL, %s)",
+                   [(nim, s[2]) for nim, s in zip(nims, slot)], banyak=True)
+        return nims
+
+    def hapus_penghuni(self, nims):
+        if nims:
+            self.tulis(f"DELETE FROM Penghuni WHERE nim IN ({', '.join(['%s'] * len(nims))})", tuple(nims))
+
+    def hapus_penghuni_sementara(self):
+        """Membersihkan sisa penghuni sementara jika run sebelumnya terhenti di tengah jalan."""
+        self.tulis("DELETE FROM Penghuni WHERE nim LIKE %s", (str(NIM_SEMENTARA)[0] + "_" * 8,))
+
+    def hapus_log_benchmark(self):
+        """
+        Menghapus log aktivitas yang ditulis trigger Penghuni selama benchmark, agar run berikutnya mengukur kasus log
+        pada tabel berukuran sama. Panggil setelah hapus_penghuni_sementara, yang juga memicu trigger DELETE.
+        """
+        self.tulis("DELETE FROM AuditLogAktivitasPenghuni WHERE log_id > %s", (self.log_id_awal,))
+
+    def jumlah_baris(self):
+        return {tabel: self._satu(f"SELECT COUNT(*) FROM {tabel}")[0]
+                for tabel in ("Asrama", "Kamar", "Penghuni", "AuditLogAktivitasPenghuni", "AuditLogAktivitasPenghuniArsip")}
+
+
+def _kasus_referensi(suite, db, kampus):
+    k = kampus.kamar_kosong
+    suite.ukur("is_connected", "referensi", db.is_connected)
+    suite.ukur("warm_reference_cache (cache kosong)", "referensi", lambda _: db.warm_reference_cache(),
+               siapkan=lambda: db.invalidate_reference_cache())
+    suite.ukur("invalidate_reference_cache", "referensi", lambda: db.invalidate_reference_cache('kamar'))
+    db.warm_reference_cache()
+    suite.ukur("get_all_asrama", "referensi", db.get_all_asrama)
+    suite.ukur("get_all_kamar_in_asrama", "referensi", lambda: db.get_all_kamar_in_asrama(k[1]))
+    suite.ukur("get_kamar_id_internal", "referensi", lambda: db.get_kamar_id_internal(k[0], k[1]))
+    suite.ukur("get_fakultas_id_by_name", "referensi", lambda: db.get_fakultas_id_by_name(kampus.fakultas[0]))
+
+
+def _kasus_kamar(suite, db, kampus):
+    k, p = kampus.kamar_kosong, kampus.penghuni
+    suite.ukur("get_kapasitas_kamar", "kamar", lambda: db.get_kapasitas_kamar(k[0], k[1]))
+    suite.ukur("get_jumlah_penghuni", "kamar", lambda: db.get_jumlah_penghuni(k[0], k[1]))
+    suite.ukur("get_room_snapshot", "kamar", lambda: db.get_room_snapshot(p[3], p[4]))
+    suite.ukur("get_penghuni_in_kamar", "kamar", lambda: db.get_penghuni_in_kamar(p[3], p[4]))
+    suite.ukur("get_asrama_occupancy", "kamar", lambda: db.get_asrama_occupancy(k[1]))
+    suite.ukur("get_vacancy_board", "kamar", db.get_vacancy_board)
+    suite.ukur("get_occupancy_changes (100 log terakhir)", "kamar", lambda: db.get_occupancy_changes(kampus.log_id_maks - 100))
+    db.cari_kamar_kosong(k[1]) # Memuat VacancyIndex sekali; kasus berikut mengukur pencarian pada indeks yang sudah hangat
+    suite.ukur("cari_kamar_kosong", "kamar", lambda: db.cari_kamar_kosong(k[1], k[0]))
+    suite.ukur("cari_kamar_kosong_di_lantai", "kamar", lambda: db.cari_kamar_kosong_di_lantai(k[0] // 100))
+    suite.ukur("get_komposisi_fakultas_kamar", "kamar", db.get_komposisi_fakultas_kamar)
+    suite.ukur("get_nim_terdaftar (1000 NIM)", "kamar", lambda: db.get_nim_terdaftar(kampus.nims))
+    suite.ukur("rekonsiliasi_jumlah_penghuni", "kamar", db.rekonsiliasi_jumlah_penghuni, iterasi=max(1, suite.iterasi // 10))
+
+
+def _kasus_pencarian(suite, db, kampus):
+    p = kampus.penghuni
+    nama_belakang = p[1].split()[-1]
+    suite.ukur("cari_penghuni (awalan NIM)", "pencarian", lambda: db.cari_penghuni(p[0][:5]))
+    suite.ukur("cari_penghuni (potongan nama, FULLTEXT)", "pencarian", lambda: db.cari_penghuni(nama_belakang[1:5]))
+    suite.ukur("cari_penghuni (1 huruf, LIKE)", "pencarian", lambda: db.cari_penghuni(nama_belakang[0]))
+    halaman_pertama = db.cari_penghuni(nama_belakang)
+    if halaman_pertama:
+        suite.ukur("cari_penghuni (halaman berikutnya)", "pencarian", lambda: db.cari_penghuni(nama_belakang, after=halaman_pertama[-1]))
+
+
+def _kasus_log(suite, db, kampus):
+    dalam = kampus.log_id_min + 1000 # Halaman jauh di belakang (log tertua)
+    sampai = datetime.now()
+    dari = sampai.replace(hour=0, minute=0, second=0, microsecond=0)
+    suite.ukur("get_audit_log_penghuni (100)", "log", lambda: db.get_audit_log_penghuni(100))
+    suite.ukur("get_audit_log_penghuni (100, + arsip)", "log", lambda: db.get_audit_log_penghuni(100, include_archive=True))
+    suite.ukur("get_audit_log_page (terbaru)", "log", lambda: db.get_audit_log_page(limit=100))
+    suite.ukur("get_audit_log_page (before_log_id lama)", "log", lambda: db.get_audit_log_page(before_log_id=dalam, limit=100))
+    suite.ukur("get_audit_log_page (after_log_id)", "log", lambda: db.get_audit_log_page(after_log_id=dalam, limit=100))
+    suite.ukur("get_audit_log_page (filter nim)", "log", lambda: db.get_audit_log_page(limit=100, filters={'nim': kampus.penghuni[0]}))
+    suite.ukur("get_audit_log_page (filter aksi + hari ini)", "log",
+               lambda: db.get_audit_log_page(limit=100, filters={'aksi': 'UPDATE', 'dari': dari, 'sampai': sampai}))
+    suite.ukur("get_audit_log_page (terbaru, + arsip)", "log", lambda: db.get_audit_log_page(limit=100, include_archive=True))
+    suite.ukur("iter_audit_log_batches (10000 baris)", "log",
+               lambda: sum(len(batch) for _, batch in db.iter_audit_log_batches(after_log_id=kampus.log_id_maks - 10000)))
+
+    def siapkan_arsip():
+        cutoff = kampus._satu("SELECT waktu_aksi FROM AuditLogAktivitasPenghuni ORDER BY waktu_aksi, log_id LIMIT 1 OFFSET 499")[0]
+        log_ids = [row[0] for row in kampus._semua("SELECT log_id FROM AuditLogAktivitasPenghuni WHERE waktu_aksi < %s", (cutoff,))]
+        return cutoff, log_ids
+
+    def kembalikan_arsip(data):
+        # Log yang baru diarsipkan dikembalikan (log_id tetap sama) agar setiap iterasi memindahkan baris yang setara.
+        log_ids = data[1]
+        if not log_ids: return
+        placeholders = ", ".join(["%s"] * len(log_ids))
+        kampus.tulis(f"INSERT INTO AuditLogAktivitasPenghuni SELECT * FROM AuditLogAktivitasPenghuniArsip WHERE log_id IN ({placeholders})",
+                     tuple(log_ids))
+        kampus.tulis(f"DELETE FROM AuditLogAktivitasPenghuniArsip WHERE log_id IN ({placeholders})", tuple(log_ids))
+    suite.ukur("arsipkan_audit_log (~500 baris)", "log", lambda data: db.arsipkan_audit_log(data[0], chunk_size=500, jeda_detik=0),
+               siapkan=siapkan_arsip, pulihkan=kembalikan_arsip, iterasi=max(1, suite.iterasi // 10))
+
+
+def _kasus_tulis(suite, db, kampus, iterasi, ukuran_batch):
+    k, p = kampus.kamar_kosong, kampus.penghuni
+
+    suite.ukur("add_penghuni (sp_TambahPenghuni)", "tulis",
+               lambda nim: db.add_penghuni(nim, "Penghuni Benchmark", kampus.fakultas[0], k[0], k[1]),
+               siapkan=lambda: kampus.nim_baru()[0], pulihkan=lambda nim: kampus.hapus_penghuni([nim]), iterasi=iterasi)
+    suite.ukur("delete_penghuni", "tulis", lambda nims: db.delete_penghuni(nims[0]),
+               siapkan=lambda: kampus.tambah_penghuni([k]), iterasi=iterasi)
+    suite.ukur("pindah_kamar_penghuni (sp_PindahKamarPenghuni)", "tulis", lambda _: db.pindah_kamar_penghuni(p[0], k[0], k[1]),
+               siapkan=lambda: None, iterasi=iterasi,
+               pulihkan=lambda _: kampus.tulis("UPDATE Penghuni SET kamar_id_internal = %s WHERE nim = %s", (p[5], p[0])))
+    nama_lain = p[1] + " B"
+    suite.ukur("update_penghuni (nama)", "tulis", lambda _: db.update_penghuni(p[0], "", nama_lain, None),
+               siapkan=lambda: None, iterasi=iterasi,
+               pulihkan=lambda _: kampus.tulis("UPDATE Penghuni SET nama_penghuni = %s WHERE nim = %s", (p[1], p[0])))
+
+    def siapkan_bulk():
+        slot = kampus.slot_kosong(ukuran_batch)
+        return slot, kampus.nim_baru(ukuran_batch)
+    suite.ukur(f"add_penghuni_bulk ({ukuran_batch} baris)", "tulis",
+               lambda data: list(db.add_penghuni_bulk(
+                   (i, {'nim': nim, 'nama': "Penghuni Benchmark", 'fakultas': kampus.fakultas[0], 'nomor_kamar': s[0], 'asrama_id': s[1]})
+                   for i, (s, nim) in enumerate(zip(*data)))),
+               siapkan=siapkan_bulk, pulihkan=lambda data: kampus.hapus_penghuni(data[1]), iterasi=iterasi)
+    suite.ukur(f"terapkan_alokasi ({ukuran_batch} penghuni)", "tulis",
+               lambda data: db.terapkan_alokasi([{'nim': nim, 'nama': "Penghuni Benchmark", 'fakultas_id': None, 'kamar_id_internal': s[2]}
+                                                 for s, nim in zip(*data)]),
+               siapkan=siapkan_bulk, pulihkan=lambda data: kampus.hapus_penghuni(data[1]), iterasi=iterasi)
+
+    def siapkan_pindah_bulk():
+        asal = kampus.slot_kosong(ukuran_batch)
+        nims = kampus.tambah_penghuni(asal)
+        tujuan = kampus.slot_kosong(ukuran_batch, kecuali={s[2] for s in asal})
+        return nims, tujuan
+    suite.ukur(f"pindah_kamar_bulk ({ukuran_batch} perpindahan)", "tulis",
+               lambda data: db.pindah_kamar_bulk([(nim, s[0], s[1]) for nim, s in zip(*data)]),
+               siapkan=siapkan_pindah_bulk, pulihkan=lambda data: kampus.hapus_penghuni(data[0]), iterasi=iterasi)
+
+
+def _kasus_stored_procedure(suite, db, kampus, iterasi):
+    """Memanggil stored procedure langsung (tanpa lapisan DatabaseService) untuk memisahkan biaya di server."""
+    k, p = kampus.kamar_kosong, kampus.penghuni
+
+    def panggil(nama, args):
+        with db._cursor(dictionary=False) as (conn, cursor):
+            cursor.callproc(nama, args)
+            for hasil in cursor.stored_results(): hasil.fetchall()
+            conn.commit()
+    suite.ukur("CALL sp_TambahPenghuni", "stored_procedure",
+               lambda nim: panggil('sp_TambahPenghuni', [nim, "Penghuni Benchmark", kampus.fakultas[0], k[0], k[1], None, None]),
+               siapkan=lambda: kampus.nim_baru()[0], pulihkan=lambda nim: kampus.hapus_penghuni([nim]), iterasi=iterasi)
+    suite.ukur("CALL sp_PindahKamarPenghuni", "stored_procedure",
+               lambda _: panggil('sp_PindahKamarPenghuni', [p[0], k[0], k[1], None, None]), siapkan=lambda: None, iterasi=iterasi,
+               pulihkan=lambda _: kampus.tulis("UPDATE Penghuni SET kamar_id_internal = %s WHERE nim = %s", (p[5], p[0])))
+    suite.ukur("CALL sp_PindahKamarPenghuni (kamar sama)", "stored_procedure",
+               lambda: panggil('sp_PindahKamarPenghuni', [p[0], p[3], p[4], None, None]), iterasi=iterasi)
+    suite.ukur("CALL sp_RekonsiliasiJumlahPenghuni", "stored_procedure",
+               lambda: panggil('sp_RekonsiliasiJumlahPenghuni', []), iterasi=max(1, suite.iterasi // 10))
+
+
+def _kasus_trigger(suite, db, kampus, iterasi):
+    """
+    Biaya trigger diperkirakan dari selisih DML yang sama pada Penghuni (memicu trigger) dan pada salinan
+    strukturnya tanpa trigger. Salinan dibuat dengan CREATE TABLE ... LIKE sehingga tidak memiliki foreign key;
+    selisihnya mencakup pemeriksaan foreign key Penghuni selain isi trigger.
+    """
+    k = kampus.kamar_kosong
+    k_lain = kampus.slot_kosong(1, kecuali={k[2]})[0]
+    kampus.tulis(f"CREATE TABLE IF NOT EXISTS {TABEL_TANPA_TRIGGER} LIKE Penghuni")
+    kampus.tulis(f"DELETE FROM {TABEL_TANPA_TRIGGER}")
+    for tabel, label in (("Penghuni", None), (TABEL_TANPA_TRIGGER, "tanpa trigger")):
+        def sisip(nim, tabel=tabel):
+            kampus.tulis(f"INSERT INTO {tabel} (nim, nama_penghuni, fakultas_id, kamar_id_internal) VALUES (%s, 'Penghuni Benchmark', NULL, %s)",
+                         (nim, k[2]))
+            return nim
+        def hapus(nim, tabel=tabel): kampus.tulis(f"DELETE FROM {tabel} WHERE nim = %s", (nim,))
+        def pindah(nim, tabel=tabel): kampus.tulis(f"UPDATE {tabel} SET kamar_id_internal = %s WHERE nim = %s", (k_lain[2], nim))
+        nama = {"INSERT": "trg_LogInsertPenghuni", "UPDATE": "trg_LogUpdatePenghuni", "DELETE": "trg_LogDeletePenghuni"}
+        akhiran = f" ({label})" if label else ""
+        for aksi, fungsi, siapkan, pulihkan in (("INSERT", sisip, lambda: kampus.nim_baru()[0], hapus),
+                                                ("UPDATE", pindah, lambda: sisip(kampus.nim_baru()[0]), hapus),
+                                                ("DELETE", hapus, lambda: sisip(kampus.nim_baru()[0]), None)):
+            suite.ukur(f"{nama[aksi] if not label else aksi + ' Penghuni'}{akhiran}", "trigger", fungsi,
+                       siapkan=siapkan, pulihkan=pulihkan, iterasi=iterasi)
+    kampus.tulis(f"DROP TABLE IF EXISTS {TABEL_TANPA_TRIGGER}")
+    per_nama = {entri['nama']: entri for entri in suite.hasil}
+    for aksi, nama in (("INSERT", "trg_LogInsertPenghuni"), ("UPDATE", "trg_LogUpdatePenghuni"), ("DELETE", "trg_LogDeletePenghuni")):
+        dengan, tanpa = per_nama.get(nama), per_nama.get(f"{aksi} Penghuni (tanpa trigger)")
+        if dengan and tanpa:
+            dengan["pembanding"] = tanpa["nama"]
+            dengan["overhead_p50_ms"] = round(dengan["p50_ms"] - tanpa["p50_ms"], 4)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=DIREKTORI_REPO, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bandingkan(path_lama, path_baru, ambang_persen):
+    """Mencetak perubahan p50/p95/p99 per kasus antara dua file hasil. Mengembalikan jumlah kasus yang melambat melebihi ambang (p95)."""
+    with open(path_lama, encoding="utf-8") as f: lama = json.load(f)
+    with open(path_baru, encoding="utf-8") as f: baru = json.load(f)
+    if lama.get("kampus") != baru.get("kampus"):
+        print(f"Peringatan: parameter kampus berbeda ({lama.get('kampus')} vs {baru.get('kampus')}).")
+    per_nama = {entri["nama"]: entri for entri in lama["hasil"]}
+    print(f"{lama.get('git')} -> {baru.get('git')}")
+    print(f"{'Kasus':<52}" + "".join(f"{f'p{p} lama':>11}{f'p{p} baru':>11}{'Δ':>8}" for p in PERSENTIL))
+    melambat = 0
+    for entri in baru["hasil"]:
+        sebelum = per_nama.get(entri["nama"])
+        if not sebelum: continue
+        kolom = ""
+        for p in PERSENTIL:
+            a, b = sebelum[f"p{p}_ms"], entri[f"p{p}_ms"]
+            delta = (b - a) / a * 100 if a else 0.0
+            kolom += f"{a:>11.3f}{b:>11.3f}{delta:>+7.0f}%"
+        regresi = sebelum["p95_ms"] and (entri["p95_ms"] - sebelum["p95_ms"]) / sebelum["p95_ms"] * 100 > ambang_persen
+        melambat += bool(regresi)
+        print(f"{entri['nama']:<52}{kolom}{'  <- lebih lambat' if regresi else ''}")
+    return melambat
+
+
+def main():
+    """
+    Benchmark DatabaseService pada database kampus sintetis (lihat benchmark.kampusSintetis): setiap metode publik,
+    stored procedure, dan trigger diukur p50/p95/p99 lalu ditulis ke file JSON agar run dapat dibandingkan.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark suite DatabaseService.")
+    parser.add_argument("--database", default=os.getenv("BENCH_DB_NAME", DATABASE_DEFAULT),
+                        help=f"Database kampus sintetis. Default {DATABASE_DEFAULT}.")
+    parser.add_argument("--iterasi", type=int, default=200, help="Pemanggilan terukur per kasus baca. Default 200.")
+    parser.add_argument("--iterasi-tulis", type=int, default=50, help="Pemanggilan terukur per kasus yang mengubah data. Default 50.")
+    parser.add_argument("--pemanasan", type=int, default=5, help="Pemanggilan pemanasan yang tidak diukur. Default 5.")
+    parser.add_argument("--ukuran-batch", type=int, default=100, help="Ukuran batch untuk metode bulk. Default 100.")
+    parser.add_argument("--hanya", metavar="POLA", help="Hanya jalankan kasus yang namanya cocok dengan regex POLA.")
+    parser.add_argument("--keluaran", metavar="FILE", help="File hasil JSON. Default benchmark-<database>-<waktu>.json.")
+    parser.add_argument("--bandingkan", nargs=2, metavar=("LAMA", "BARU"),
+                        help="Bandingkan dua file hasil tanpa menjalankan benchmark.")
+    parser.add_argument("--ambang", type=float, default=10.0,
+                        help="Dengan --bandingkan: keluar dengan status 1 jika p95 suatu kasus naik lebih dari ambang persen. Default 10.")
+    args = parser.parse_args()
+
+    if args.bandingkan:
+        sys.exit(1 if bandingkan(*args.bandingkan, args.ambang) else 0)
+    if args.database == os.getenv("DB_NAME", "asrama_db_mysql"):
+        raise SystemExit(f"Menolak menjalankan benchmark yang mengubah data pada database aplikasi '{args.database}'.")
+
+    db = _DatabaseServiceBenchmark(host=os.getenv("DB_HOST", "localhost"), user=os.getenv("DB_USER", "root"),
+                                   password=os.getenv("DB_PASSWORD", ""), database_name=args.database, pool_min=1, pool_max=2)
+    if not db.is_connected():
+        raise SystemExit(1)
+    kampus = _Kampus(db)
+    with db._pool.connection() as conn:
+        metadata = baca_metadata(conn)
+        cursor = conn.cursor()
+        cursor.execute("SELECT VERSION()")
+        versi_server = cursor.fetchone()[0]
+        cursor.close()
+    jumlah_baris = kampus.jumlah_baris()
+    print(f"Database '{args.database}' (server {versi_server}): " + ", ".join(f"{t} {n}" for t, n in jumlah_baris.items()))
+    print(f"{'Kasus':<52}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+
+    suite = Suite(args.iterasi, args.pemanasan, args.hanya)
+    mulai = time.perf_counter()
+    try:
+        _kasus_referensi(suite, db, kampus)
+        _kasus_kamar(suite, db, kampus)
+        _kasus_pencarian(suite, db, kampus)
+        _kasus_log(suite, db, kampus)
+        _kasus_tulis(suite, db, kampus, args.iterasi_tulis, args.ukuran_batch)
+        _kasus_stored_procedure(suite, db, kampus, args.iterasi_tulis)
+        _kasus_trigger(suite, db, kampus, args.iterasi_tulis)
+    finally:
+        kampus.hapus_penghuni_sementara()
+        kampus.hapus_log_benchmark()
+
+    waktu = datetime.now()
+    hasil = {
+        "versi_format": VERSI_FORMAT,
+        "waktu": waktu.isoformat(timespec="seconds"),
+        "git": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "server": versi_server,
+        "database": args.database,
+        "kampus": metadata,
+        "jumlah_baris": jumlah_baris,
+        "parameter": {"iterasi": args.iterasi, "iterasi_tulis": args.iterasi_tulis, "pemanasan": args.pemanasan,
+                      "ukuran_batch": args.ukuran_batch, "hanya": args.hanya},
+        "durasi_detik": round(time.perf_counter() - mulai, 1),
+        "hasil": suite.hasil,
+    }
+    path = args.keluaran or f"benchmark-{args.database}-{waktu:%Y%m%d-%H%M%S}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(hasil, f, indent=2, default=str)
+    print(f"{len(suite.hasil)} kasus ditulis ke '{path}' ({hasil['durasi_detik']} detik).")
+    db._close()
+
+
+if __name__ == "__main__":
+    main()
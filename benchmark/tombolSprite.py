@@ -0,0 +1,72 @@
+import argparse
+import statistics
+import time
+import tkinter as tk
+from tombol import tbl, lupakan_tombol
+
+# Tata letak KamarListScreen: tombol Kembali ditambah 9 tombol kamar.
+TATA_LETAK = [(50, 15, 150, 50, 10, "red", "Kembali")] + [
+    (x, y, 250, 120, 20, "#F47B07", f"Kamar {lantai}0{i + 1}")
+    for lantai, y in ((1, 100), (2, 300), (3, 500)) for i, x in enumerate((50, 420, 780))
+]
+
+
+def _tbl_lama(canvas, x, y, lebar, tinggi, radius, warna, teks, perintah):
+    """Implementasi tbl sebelum sprite: satu poligon, empat busur, satu teks, dan dua binding per tombol."""
+    path_id = canvas.create_polygon(x + radius, y, x + lebar - radius, y, x + lebar - radius, y, x + lebar, y + radius,
+                                    x + lebar, y + tinggi - radius, x + lebar - radius, y + tinggi, x + radius, y + tinggi,
+                                    x, y + tinggi - radius, x, y + radius, x + radius, y, fill=warna, outline=warna, smooth=False)
+    for x0, y0, start in ((x, y, 90), (x + lebar - 2 * radius, y, 0), (x, y + tinggi - 2 * radius, 180),
+                          (x + lebar - 2 * radius, y + tinggi - 2 * radius, 270)):
+        canvas.create_arc(x0, y0, x0 + 2 * radius, y0 + 2 * radius, start=start, extent=90, style=tk.PIESLICE, fill=warna, outline=warna)
+    teks_id = canvas.create_text(x + lebar / 2, y + tinggi / 2, text=teks, fill="white", font=("Arial", 12, "bold"))
+    canvas.tag_bind(path_id, "<Button-1>", lambda event: perintah())
+    canvas.tag_bind(teks_id, "<Button-1>", lambda event: perintah())
+    return path_id, teks_id
+
+
+def _transisi_lama(canvas):
+    for x, y, lebar, tinggi, radius, warna, teks in TATA_LETAK:
+        _tbl_lama(canvas, x, y, lebar, tinggi, radius, warna, teks, lambda: None)
+    canvas.update_idletasks()
+    canvas.delete("all") # Layar lama tidak melacak item tombol; app menghapus seluruh canvas
+
+
+def _transisi_sprite(canvas):
+    items = []
+    for x, y, lebar, tinggi, radius, warna, teks in TATA_LETAK:
+        items.extend(tbl(canvas, x, y, lebar, tinggi, radius, radius, 90, 180, 270, 360, warna, teks, lambda: None))
+    canvas.update_idletasks()
+    for item in items: canvas.delete(item)
+    lupakan_tombol(canvas, items)
+
+
+def main():
+    """Mengukur biaya membuat lalu menghapus tombol satu layar (KamarListScreen) dengan tbl lama vs tbl sprite."""
+    parser = argparse.ArgumentParser(description="Benchmark transisi layar dengan tombol sprite.")
+    parser.add_argument("--iterasi", type=int, default=500, help="Jumlah transisi per varian. Default 500.")
+    args = parser.parse_args()
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        raise SystemExit(f"Benchmark ini membutuhkan display Tk: {e}")
+    root.withdraw()
+    canvas = tk.Canvas(root, width=1080, height=700)
+    canvas.pack()
+    print(f"{len(TATA_LETAK)} tombol per layar, {args.iterasi} transisi.")
+    print(f"{'Varian':<26}{'p50':>10}{'p95':>10}{'item canvas':>14}")
+    for nama, transisi, jumlah_item in (("tbl lama (6 item)", _transisi_lama, 6), ("tbl sprite (2 item)", _transisi_sprite, 2)):
+        transisi(canvas) # Pemanasan: sprite di-render pada transisi pertama
+        latensi = []
+        for _ in range(args.iterasi):
+            mulai = time.perf_counter()
+            transisi(canvas)
+            latensi.append((time.perf_counter() - mulai) * 1000)
+        latensi.sort()
+        print(f"{nama:<26}{statistics.median(latensi):>8.3f}ms{latensi[int(len(latensi) * 0.95) - 1]:>8.3f}ms"
+              f"{jumlah_item * len(TATA_LETAK):>14}")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import csv
+import os
+from collections import Counter
+
+KOLOM_WAJIB = ("nim", "nama", "fakultas", "nomor_kamar", "asrama_id")
+KOLOM_LAPORAN = ("baris", "nim", "status", "pesan")
+
+
+def iter_penghuni_csv(csv_path):
+    """
+    Membaca file CSV penghuni baris demi baris (generator), tanpa memuat seluruh file ke memori.
+    Menghasilkan tuple (nomor_baris, dict) dengan kolom nim, nama, fakultas, nomor_kamar, asrama_id.
+    """
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        kolom_hilang = [k for k in KOLOM_WAJIB if k not in (reader.fieldnames or [])]
+        if kolom_hilang:
+            raise ValueError(f"Kolom CSV tidak lengkap, tidak ditemukan: {', '.join(kolom_hilang)}")
+        for row in reader:
+            yield reader.line_num, row
+
+
+def import_penghuni_csv(db_service, csv_path, report_path=None, chunk_size=1000):
+    """
+    Mengimpor penghuni dari CSV secara streaming dan menulis laporan per baris ke `report_path`.
+    Mengembalikan Counter jumlah baris per status (inserted, room_full, duplicate_nim, invalid, error).
+    """
+    if report_path is None:
+        report_path = f"{os.path.splitext(csv_path)[0]}_laporan.csv"
+    ringkasan = Counter()
+    with open(report_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=KOLOM_LAPORAN)
+        writer.writeheader()
+        for hasil in db_service.add_penghuni_bulk(iter_penghuni_csv(csv_path), chunk_size=chunk_size):
+            writer.writerow(hasil)
+            ringkasan[hasil['status']] += 1
+    return ringkasan
@@ -0,0 +1,114 @@
+from baseScreen import BaseScreen
+from tkinter import ttk, messagebox
+import tkinter as tk
+
+class CariPenghuniScreen(BaseScreen):
+    UKURAN_HALAMAN = 50
+    dapat_disimpan = True
+
+    def __init__(self, screen_manager, db_service):
+        super().__init__(screen_manager, db_service)
+        self.kata_kunci_entry = None
+        self.hasil_treeview = None
+        self.hasil_scrollbar = None
+        self.info_text_id = None
+        self._kata_kunci = ""
+        self._baris_terakhir = None
+        self._ada_halaman_berikutnya = False
+        self._baris_per_item = {}
+
+    def setup_ui(self):
+        style = ttk.Style()
+        style.configure("Cari.Treeview", background="#F0F0F0", fieldbackground="#FFFFFF", foreground="black", rowheight=25)
+        style.configure("Cari.Treeview.Heading", background="#BFBFBF", foreground="black", font=('Arial', 10, 'bold'), relief="flat")
+        self.create_canvas_text(self.app_instance.appwidth / 2, 50, text="Cari Penghuni", fill="#F4F0FF", font=("Cooper Black", 24, "bold"))
+        self.create_canvas_text(240, 110, text="NIM (awalan) atau Nama", fill="#F4FEFF", font=("Arial", 12, "bold"))
+        self.kata_kunci_entry = self.add_widget(tk.Entry(self.canvas, width=40, font=("Arial", 18), bg="#F4FEFF"))
+        self.kata_kunci_entry.place(x=150, y=125)
+        self.kata_kunci_entry.bind("<Return>", lambda event: self._cari())
+        self.kata_kunci_entry.focus_set()
+        self.tbl(720, 120, 150, 45, 10, 10, 90, 180, 270, 360, "#F47B07", "Cari", self._cari)
+
+        columns = ("nim", "nama", "fakultas", "asrama", "kamar")
+        self.hasil_treeview = ttk.Treeview(self.canvas, columns=columns, show='headings', style="Cari.Treeview")
+        self.hasil_treeview.heading("nim", text="NIM")
+        self.hasil_treeview.heading("nama", text="Nama")
+        self.hasil_treeview.heading("fakultas", text="Fakultas")
+        self.hasil_treeview.heading("asrama", text="Asrama")
+        self.hasil_treeview.heading("kamar", text="Kamar")
+        self.hasil_treeview.column("nim", width=150, anchor=tk.W)
+        self.hasil_treeview.column("nama", width=320, anchor=tk.W)
+        self.hasil_treeview.column("fakultas", width=230, anchor=tk.W)
+        self.hasil_treeview.column("asrama", width=150, anchor=tk.W)
+        self.hasil_treeview.column("kamar", width=80, anchor=tk.CENTER)
+        self.hasil_treeview.bind("<Double-1>", self._buka_kamar)
+        self.hasil_scrollbar = ttk.Scrollbar(self.canvas, orient="vertical", command=self.hasil_treeview.yview)
+        self.hasil_treeview.configure(yscrollcommand=self.hasil_scrollbar.set)
+        self.add_widget(self.hasil_treeview)
+        self.add_widget(self.hasil_scrollbar)
+        self.create_canvas_window(70, 190, anchor=tk.NW, window=self.hasil_treeview, width=930, height=400)
+        self.create_canvas_window(1000, 190, anchor=tk.NW, window=self.hasil_scrollbar, height=400)
+
+        self.info_text_id = self.create_canvas_text(self.app_instance.appwidth / 2, 610, text="Klik dua kali pada hasil untuk membuka kamar penghuni.",
+                                                    fill="#F4FEFF", font=("Arial", 11, "bold"))
+        self.tbl(50, 15, 150, 50, 10, 10, 90, 180, 270, 360, "red", "Kembali",
+            self.screen_manager.show_main_menu)
+        self.tbl(850, 630, 150, 45, 10, 10, 90, 180, 270, 360, "#4682B4", "Muat Lagi", self._muat_lagi)
+
+    def _cari(self):
+        kata_kunci = self.kata_kunci_entry.get().strip()
+        if not kata_kunci:
+            messagebox.showwarning("Input Kosong", "Masukkan NIM atau nama penghuni yang dicari.")
+            return
+        self._mulai_pencarian(kata_kunci)
+
+    def refresh_data(self):
+        if self._kata_kunci: self._mulai_pencarian(self._kata_kunci)
+
+    def _mulai_pencarian(self, kata_kunci):
+        self._kata_kunci = kata_kunci
+        self._baris_terakhir = None
+        self._baris_per_item = {}
+        for item in self.hasil_treeview.get_children(): self.hasil_treeview.delete(item)
+        self.canvas.itemconfig(self.info_text_id, text="Mencari...")
+        self.run_db(self.db_service.cari_penghuni, kata_kunci, None, self.UKURAN_HALAMAN + 1,
+                    on_success=lambda hasil: self._tampilkan_hasil(kata_kunci, hasil))
+
+    def _muat_lagi(self):
+        if not self._ada_halaman_berikutnya: return
+        self._ada_halaman_berikutnya = False # Mencegah halaman yang sama diminta dua kali saat tombol ditekan berulang
+        kata_kunci = self._kata_kunci
+        self.run_db(self.db_service.cari_penghuni, kata_kunci, self._baris_terakhir, self.UKURAN_HALAMAN + 1,
+                    on_success=lambda hasil: self._tampilkan_hasil(kata_kunci, hasil))
+
+    def _tampilkan_hasil(self, kata_kunci, hasil):
+        if kata_kunci != self._kata_kunci: return # Hasil pencarian lama yang tiba setelah pencarian baru dimulai
+        # Satu baris ekstra diminta hanya untuk mengetahui apakah masih ada halaman berikutnya.
+        self._ada_halaman_berikutnya = len(hasil) > self.UKURAN_HALAMAN
+        hasil = hasil[:self.UKURAN_HALAMAN]
+        for row in hasil:
+            item = self.hasil_treeview.insert("", tk.END, values=(row['nim'], row['nama_penghuni'], row['fakultas'] or "-",
+                                                                  row['nama_asrama'], row['nomor_kamar']))
+            self._baris_per_item[item] = row
+        if hasil:
+            self._baris_terakhir = hasil[-1]
+        jumlah = len(self._baris_per_item)
+        if not jumlah:
+            teks = f"Tidak ada penghuni yang cocok dengan '{kata_kunci}'."
+        elif self._ada_halaman_berikutnya:
+            teks = f"Menampilkan {jumlah} hasil pertama. Tekan 'Muat Lagi' untuk hasil berikutnya."
+        else:
+            teks = f"{jumlah} hasil ditemukan. Klik dua kali untuk membuka kamar penghuni."
+        self.canvas.itemconfig(self.info_text_id, text=teks)
+
+    def _buka_kamar(self, event):
+        item = self.hasil_treeview.identify_row(event.y)
+        row = self._baris_per_item.get(item)
+        if row:
+            self.screen_manager.show_kamar_detail_in_asrama(row['asrama_id'], row['nama_asrama'], row['nomor_kamar'])
+
+    def clear_screen_elements(self):
+        super().clear_screen_elements()
+        self.kata_kunci_entry = None
+        self.hasil_treeview = None
+        self.hasil_scrollbar = None
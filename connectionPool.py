@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+import mysql.connector
+from mysql.connector import errors
+
+
+class ConnectionPool:
+    """
+    Pool koneksi MySQL dengan jumlah minimum/maksimum yang dapat dikonfigurasi.
+    Koneksi dipinjam per operasi (acquire) dan dikembalikan setelah selesai (release),
+    sehingga beberapa thread tidak pernah berbagi satu koneksi atau cursor yang sama.
+    Setiap koneksi diperiksa kesehatannya (ping) saat dipinjam bila sudah lama menganggur.
+    """
+    def __init__(self, min_size=1, max_size=5, checkout_timeout=10, health_check_idle=30, **connect_kwargs):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Ukuran pool tidak valid: harus 0 <= min_size <= max_size dan max_size >= 1.")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_idle = health_check_idle
+        self._connect_kwargs = connect_kwargs
+        self._idle = deque() # (koneksi, waktu_terakhir_dipakai)
+        self._jumlah_koneksi = 0
+        self._lock = threading.Condition()
+        self._closed = False
+        for _ in range(min_size):
+            self._idle.append((self._new_connection(), time.monotonic()))
+            self._jumlah_koneksi += 1
+
+    def _new_connection(self):
+        """Membuat koneksi fisik baru ke server MySQL."""
+        return mysql.connector.connect(**self._connect_kwargs)
+
+    def _is_healthy(self, conn, idle_since):
+        """Health check saat checkout: ping hanya jika koneksi sudah menganggur cukup lama."""
+        if time.monotonic() - idle_since < self.health_check_idle:
+            return True
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except mysql.connector.Error:
+            return False
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except mysql.connector.Error:
+            pass
+
+    def acquire(self, timeout=None):
+        """Meminjam satu koneksi sehat dari pool. Menunggu hingga `timeout` detik jika pool penuh."""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise errors.PoolError("Pool koneksi sudah ditutup.")
+                while not self._idle and self._jumlah_koneksi >= self.max_size:
+                    sisa = deadline - time.monotonic()
+                    if sisa <= 0:
+                        raise errors.PoolError(f"Tidak ada koneksi tersedia dalam {timeout} detik (maksimum {self.max_size}).")
+                    self._lock.wait(sisa)
+                if self._idle:
+                    conn, idle_since = self._idle.pop() # LIFO: koneksi yang paling baru dipakai paling mungkin masih hidup
+                else:
+                    conn, idle_since = None, None
+                    self._jumlah_koneksi += 1 # Reservasi slot sebelum membuka koneksi di luar lock
+
+            if conn is None:
+                try:
+                    return self._new_connection()
+                except mysql.connector.Error:
+                    with self._lock:
+                        self._jumlah_koneksi -= 1
+                        self._lock.notify()
+                    raise
+
+            if self._is_healthy(conn, idle_since):
+                return conn
+            # Koneksi mati (misalnya diputus server setelah idle lama): buang dan coba lagi.
+            self._discard(conn)
+            with self._lock:
+                self._jumlah_koneksi -= 1
+                self._lock.notify()
+
+    def release(self, conn):
+        """Mengembalikan koneksi ke pool. Transaksi yang masih terbuka akan di-rollback."""
+        sehat = True
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except mysql.connector.Error:
+            sehat = False
+        with self._lock:
+            if self._closed or not sehat:
+                self._discard(conn)
+                self._jumlah_koneksi -= 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._lock.notify()
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """Context manager untuk meminjam koneksi selama satu operasi."""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close_all(self):
+        """Menutup semua koneksi yang sedang menganggur dan menandai pool sebagai tertutup."""
+        with self._lock:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.popleft()
+                self._discard(conn)
+                self._jumlah_koneksi -= 1
+            self._lock.notify_all()
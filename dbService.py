@@ -1,128 +1,295 @@
+import re
+import threading
+import time
+import weakref
 import mysql.connector
+from contextlib import contextmanager
 from tkinter import messagebox
+from connectionPool import ConnectionPool
+from referenceCache import ReferenceCache
+from schemaMigrator import ensure_schema
+from vacancyIndex import VacancyIndex
+from records import Penghuni, Kamar, AuditEntry
+
+NIM_PATTERN = re.compile(r'^[0-9]+$')
+
+# Kolom log untuk tampilan: nilai mentah saja (waktu sebagai datetime, nomor kamar sebagai integer).
+# Teks tampilan (waktu terformat, nama terkait, detail perubahan) dibentuk di Python oleh auditExport.format_log
+# hanya untuk baris yang benar-benar ditampilkan.
+AUDIT_LOG_COLUMNS = ("log_id, waktu_aksi, aksi, nim, nama_penghuni_lama, nama_penghuni_baru, fakultas_lama, fakultas_baru, "
+                     "nomor_kamar_lama, nama_asrama_lama, nomor_kamar_baru, nama_asrama_baru, keterangan_tambahan")
+
+AUDIT_LOG_RAW_COLUMNS = ("log_id, waktu_aksi, aksi, nim, nama_penghuni_lama, nama_penghuni_baru, fakultas_lama, fakultas_baru, "
+                         "kamar_id_internal_lama, kamar_id_internal_baru, nomor_kamar_lama, nama_asrama_lama, "
+                         "nomor_kamar_baru, nama_asrama_baru, keterangan_tambahan")
+
+# Registri kueri panas yang dijalankan sebagai server-side prepared statement.
+# Objek string yang sama harus dipakai ulang: cursor prepared hanya mem-prepare ulang jika kuerinya berbeda.
+PREPARED_STATEMENTS = {
+    'kapasitas_kamar': "SELECT kapasitas FROM vw_DetailKamarPenghuni WHERE nomor_kamar = %s AND asrama_id = %s",
+    'jumlah_penghuni': "SELECT jumlah_penghuni_sekarang FROM vw_DetailKamarPenghuni WHERE nomor_kamar = %s AND asrama_id = %s",
+    'kamar_id_internal': "SELECT kamar_id_internal FROM Kamar WHERE nomor_kamar = %s AND asrama_id = %s",
+    'penghuni_in_kamar': """
+            SELECT nim, nama_penghuni, fakultas, nomor_kamar, nama_asrama
+            FROM vw_DaftarPenghuniLengkap
+            WHERE kamar_id_internal = %s
+            ORDER BY nama_penghuni ASC
+        """,
+    'room_snapshot': """
+            SELECT K.kamar_id_internal, K.kapasitas,
+                   P.nim, P.nama_penghuni, F.nama_fakultas AS fakultas
+            FROM Kamar K
+            LEFT JOIN Penghuni P ON P.kamar_id_internal = K.kamar_id_internal
+            LEFT JOIN Fakultas F ON P.fakultas_id = F.fakultas_id
+            WHERE K.nomor_kamar = %s AND K.asrama_id = %s
+            ORDER BY P.nama_penghuni ASC
+        """,
+    'nim_exists': "SELECT 1 AS ada FROM Penghuni WHERE nim = %s",
+}
+
+# Statement prepared yang hasilnya dipetakan ke record __slots__ (cursor tuple) alih-alih dict.
+PREPARED_RECORDS = {
+    'penghuni_in_kamar': Penghuni,
+}
+
+ER_UNKNOWN_STMT_HANDLER = 1243
+NGRAM_TOKEN_SIZE = 2 # Nilai default ngram_token_size di server MySQL
+
 class DatabaseService:
     """
     Mengenkapsulasi semua interaksi dengan database MySQL.
     Menyediakan metode untuk operasi CRUD pada entitas Asrama, Kamar, dan Penghuni.
     Menggunakan View dan Stored Procedure.
+    Setiap operasi meminjam koneksi dan cursor sendiri dari pool koneksi.
     """
-    def __init__(self, host, user, password, database_name):
+    def __init__(self, host, user, password, database_name, pool_min=1, pool_max=5, ref_cache_ttl=300, use_prepared_statements=True,
+                 vacancy_ttl=10, vacancy_resync_setiap=30, ui_dispatcher=None):
         self.__host = host
         self.__user = user
         self.__password = password
         self.__database_name = database_name
-        self.conn = None
-        self.cursor = None
+        self.__pool_min = pool_min
+        self.__pool_max = pool_max
+        self._pool = None
+        self.use_prepared_statements = use_prepared_statements
+        self._prepared = weakref.WeakKeyDictionary() # koneksi -> {nama_statement: cursor prepared}
+        self._prepared_lock = threading.Lock()
+        self._vacancy = VacancyIndex()
+        self._vacancy_lock = threading.Lock()
+        self._vacancy_ttl = vacancy_ttl
+        self._vacancy_watermark = None # None = indeks belum pernah dimuat
+        self._vacancy_disinkron_pada = 0.0
+        self._vacancy_resync_setiap = vacancy_resync_setiap
+        self._vacancy_jumlah_sinkron = 0 # Sinkron inkremental sejak muat penuh terakhir
+        self.versi_data = 0 # Naik setiap kali aplikasi ini mengubah data penghuni
+        self._vacancy_kotor = False
+        self._fulltext_nama = None # None = belum diperiksa (lihat _ada_indeks_fulltext_nama)
+        self.ui_dispatcher = ui_dispatcher # DbWorker.call_in_ui agar dialog dari thread worker tampil di thread Tk
+        self._ref_cache = ReferenceCache(ttl=ref_cache_ttl)
+        self._ref_cache.register('asrama', self._load_asrama_reference)
+        self._ref_cache.register('fakultas', self._load_fakultas_reference)
+        self._ref_cache.register('kamar', self._load_kamar_reference)
         self._connect()
-        if self.conn:
-            # DDL utama (tabel Asrama, Kamar, Penghuni, View, Trigger, SP)
-            # sebaiknya sudah dijalankan di server MySQL melalui skrip SQL terpisah.
-            self._create_main_tables_if_not_exist() 
-            self._ensure_log_table_exists() 
+        if self._pool:
+            # Skema (tabel, View, Trigger, SP) diterapkan dari query.ddl sekali per versi.
+            self._ensure_schema()
+            self.warm_reference_cache()
 
     def _connect(self):
-        """Membuat koneksi ke database MySQL."""
+        """Membuat pool koneksi ke database MySQL."""
         try:
-            self.conn = mysql.connector.connect(
+            self._pool = ConnectionPool(
+                min_size=self.__pool_min,
+                max_size=self.__pool_max,
                 host=self.__host,
                 user=self.__user,
                 password=self.__password,
                 database=self.__database_name
             )
-            self.cursor = self.conn.cursor(dictionary=True) # dictionary=True penting untuk akses hasil SP
-            print("Berhasil terhubung ke database MySQL.")
+            self._pool.release(self._pool.acquire()) # Memastikan server benar-benar dapat dijangkau
+            print(f"Berhasil terhubung ke database MySQL (pool {self.__pool_min}-{self.__pool_max} koneksi).")
         except mysql.connector.Error as err:
             print(f"Kesalahan koneksi database MySQL: {err}")
-            messagebox.showerror("Kesalahan Database", f"Tidak dapat terhubung ke MySQL: {err}\n\nPastikan server MySQL berjalan dan detail koneksi benar.")
-            self.conn = None
-            self.cursor = None
+            self._notify(messagebox.showerror, "Kesalahan Database", f"Tidak dapat terhubung ke MySQL: {err}\n\nPastikan server MySQL berjalan dan detail koneksi benar.")
+            if self._pool:
+                self._pool.close_all()
+            self._pool = None
+
+    def _notify(self, fungsi_dialog, *args):
+        """Menampilkan messagebox; jika dipanggil dari thread worker, dialog diteruskan ke thread Tk."""
+        if self.ui_dispatcher and threading.current_thread() is not threading.main_thread():
+            self.ui_dispatcher(fungsi_dialog, *args)
+        else:
+            fungsi_dialog(*args)
+
+    def is_connected(self):
+        """True jika pool koneksi berhasil dibuat."""
+        return self._pool is not None
+
+    @contextmanager
+    def _cursor(self, dictionary=True, buffered=True):
+        """Meminjam koneksi dari pool dan membuat cursor khusus untuk satu operasi."""
+        with self._pool.connection() as conn:
+            cursor = conn.cursor(dictionary=dictionary, buffered=buffered)
+            try:
+                yield conn, cursor
+            finally:
+                try:
+                    cursor.close()
+                except mysql.connector.Error as err:
+                    # Cursor unbuffered yang dihentikan di tengah jalan; koneksinya dibuang oleh pool saat release.
+                    print(f"Cursor ditutup dengan hasil yang belum dibaca: {err}")
 
     def _close(self):
-        """Menutup koneksi database."""
-        if self.cursor:
-            self.cursor.close()
-        if self.conn and self.conn.is_connected():
-            self.conn.close()
+        """Menutup semua koneksi database di pool."""
+        if self._pool:
+            self._pool.close_all()
+            self._pool = None
             print("Koneksi MySQL ditutup.")
 
-    def _execute_query(self, query, params=None, fetch_one=False, fetch_all=False, is_ddl_or_commit_managed_elsewhere=False):
-        """Helper untuk eksekusi kueri dengan error handling."""
-        if not self.conn or not self.conn.is_connected():
+    def _execute_query(self, query, params=None, fetch_one=False, fetch_all=False, is_ddl_or_commit_managed_elsewhere=False, return_rowcount=False,
+                       lempar_galat=False):
+        """
+        Helper untuk eksekusi kueri dengan error handling.
+        Dengan `lempar_galat=True` kesalahan dilempar ke pemanggil alih-alih ditampilkan sebagai dialog
+        (untuk pemanggilan berkala seperti polling yang menangani kegagalannya sendiri).
+        """
+        if not self.is_connected():
             print("Kesalahan Database: Tidak ada koneksi ke database MySQL.")
+            if lempar_galat:
+                raise mysql.connector.errors.InterfaceError("Tidak ada koneksi ke database MySQL.")
             return None if fetch_one or fetch_all else False
         try:
-            self.cursor.execute(query, params)
-            # Commit hanya untuk DML jika tidak dikelola di tempat lain (misalnya oleh SP yang auto-commit atau DDL)
-            if not is_ddl_or_commit_managed_elsewhere and \
-               query.strip().upper().startswith(("INSERT", "UPDATE", "DELETE")):
-                self.conn.commit()
-            if fetch_one:
-                return self.cursor.fetchone()
-            if fetch_all:
-                return self.cursor.fetchall()
-            return True # Sukses untuk DDL atau operasi tanpa fetch yang berhasil
+            with self._cursor() as (conn, cursor):
+                try:
+                    cursor.execute(query, params)
+                    # Commit hanya untuk DML jika tidak dikelola di tempat lain (misalnya oleh SP yang auto-commit atau DDL)
+                    if not is_ddl_or_commit_managed_elsewhere and \
+                       query.strip().upper().startswith(("INSERT", "UPDATE", "DELETE")):
+                        conn.commit()
+                    if fetch_one:
+                        return cursor.fetchone()
+                    if fetch_all:
+                        return cursor.fetchall()
+                    if return_rowcount:
+                        return cursor.rowcount
+                    return True # Sukses untuk DDL atau operasi tanpa fetch yang berhasil
+                except mysql.connector.Error:
+                    if not is_ddl_or_commit_managed_elsewhere: 
+                         try:
+                            if conn.in_transaction: 
+                                conn.rollback()
+                         except mysql.connector.Error as rb_err:
+                            print(f"Kesalahan saat rollback: {rb_err}")
+                    raise
         except mysql.connector.Error as err:
             print(f"Kesalahan kueri MySQL: {err}\nKueri: {query}\nParams: {params}")
-            messagebox.showerror("Kesalahan Kueri Database", f"Terjadi kesalahan saat menjalankan kueri: {err}")
-            if not is_ddl_or_commit_managed_elsewhere: 
-                 try:
-                    if self.conn.in_transaction: 
-                        self.conn.rollback()
-                 except mysql.connector.Error as rb_err:
-                    print(f"Kesalahan saat rollback: {rb_err}")
+            if lempar_galat:
+                raise
+            self._notify(messagebox.showerror, "Kesalahan Kueri Database", f"Terjadi kesalahan saat menjalankan kueri: {err}")
             return None if fetch_one or fetch_all else False
 
-    def _create_main_tables_if_not_exist(self):
-        """Membuat tabel utama jika belum ada. View, SP, Trigger harus dibuat di server."""
-        if not self.conn or not self.conn.is_connected(): return
-        tables_ddl = [
-            """CREATE TABLE IF NOT EXISTS Asrama (
-                asrama_id INTEGER PRIMARY KEY,
-                nama_asrama VARCHAR(255) NOT NULL UNIQUE
-            ) ENGINE=InnoDB;""",
-            """CREATE TABLE IF NOT EXISTS Kamar (
-                kamar_id_internal INTEGER PRIMARY KEY AUTO_INCREMENT,
-                nomor_kamar INTEGER NOT NULL,
-                asrama_id INTEGER NOT NULL,
-                kapasitas INTEGER NOT NULL DEFAULT 2,
-                FOREIGN KEY (asrama_id) REFERENCES Asrama(asrama_id) ON DELETE CASCADE,
-                UNIQUE (nomor_kamar, asrama_id)
-            ) ENGINE=InnoDB;""",
-            """CREATE TABLE IF NOT EXISTS Penghuni (
-                nim VARCHAR(50) PRIMARY KEY,
-                nama_penghuni VARCHAR(255) NOT NULL,
-                fakultas VARCHAR(255),
-                kamar_id_internal INTEGER NOT NULL,
-                FOREIGN KEY (kamar_id_internal) REFERENCES Kamar(kamar_id_internal) ON DELETE CASCADE
-            ) ENGINE=InnoDB;"""
-        ]
+    def _fetch_records(self, record_cls, query, params=None, lempar_galat=False):
+        """
+        Menjalankan SELECT dengan cursor tuple (tanpa dict per baris) dan memetakan setiap baris ke record
+        __slots__ `record_cls` (lihat records.py). Dipakai untuk hasil besar seperti papan okupansi dan log aktivitas.
+        `lempar_galat` sama seperti pada _execute_query.
+        """
+        if not self.is_connected():
+            print("Kesalahan Database: Tidak ada koneksi ke database MySQL.")
+            if lempar_galat:
+                raise mysql.connector.errors.InterfaceError("Tidak ada koneksi ke database MySQL.")
+            return None
         try:
-            for ddl in tables_ddl:
-                self._execute_query(ddl, is_ddl_or_commit_managed_elsewhere=True)
-            self.conn.commit() 
-            print("Tabel utama Asrama, Kamar, Penghuni telah diperiksa/dibuat.")
-        except mysql.connector.Error as e:
-            print(f"Kesalahan pembuatan tabel utama MySQL: {e}")
-            messagebox.showerror("Kesalahan Database", f"Gagal membuat tabel utama di MySQL: {e}")
-
-
-    def _ensure_log_table_exists(self):
-        """Memastikan tabel log aktivitas ada."""
-        ddl_log_table = """
-        CREATE TABLE IF NOT EXISTS AuditLogAktivitasPenghuni (
-            log_id INT AUTO_INCREMENT PRIMARY KEY, nim VARCHAR(50),
-            nama_penghuni_lama VARCHAR(255) DEFAULT NULL, nama_penghuni_baru VARCHAR(255) DEFAULT NULL,
-            fakultas_lama VARCHAR(255) DEFAULT NULL, fakultas_baru VARCHAR(255) DEFAULT NULL,
-            kamar_id_internal_lama INT DEFAULT NULL, kamar_id_internal_baru INT DEFAULT NULL,
-            nomor_kamar_lama INT DEFAULT NULL, nama_asrama_lama VARCHAR(255) DEFAULT NULL,
-            nomor_kamar_baru INT DEFAULT NULL, nama_asrama_baru VARCHAR(255) DEFAULT NULL,
-            aksi VARCHAR(10) NOT NULL, waktu_aksi TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            user_aksi VARCHAR(100) DEFAULT NULL, keterangan_tambahan TEXT DEFAULT NULL
-        ) ENGINE=InnoDB;
-        """
-        if self._execute_query(ddl_log_table, is_ddl_or_commit_managed_elsewhere=True):
-            self.conn.commit() 
-            print("Tabel AuditLogAktivitasPenghuni telah diperiksa/dibuat.")
+            with self._cursor(dictionary=False) as (conn, cursor):
+                cursor.execute(query, params)
+                buat = record_cls.pembuat(cursor.column_names)
+                return [buat(row) for row in cursor.fetchall()]
+        except mysql.connector.Error as err:
+            print(f"Kesalahan kueri MySQL: {err}\nKueri: {query}\nParams: {params}")
+            if lempar_galat:
+                raise
+            self._notify(messagebox.showerror, "Kesalahan Kueri Database", f"Terjadi kesalahan saat menjalankan kueri: {err}")
+            return None
+
+    def _prepared_cursor(self, conn, nama):
+        """Mengambil cursor prepared untuk statement `nama` pada koneksi ini; di-prepare sekali per koneksi."""
+        with self._prepared_lock:
+            per_koneksi = self._prepared.setdefault(conn, {})
+            cursor = per_koneksi.get(nama)
+            if cursor is None:
+                cursor = conn.cursor(prepared=True, dictionary=nama not in PREPARED_RECORDS)
+                per_koneksi[nama] = cursor
+        return cursor
+
+    def _forget_prepared(self, conn):
+        """Melupakan semua statement milik koneksi (misalnya setelah koneksi putus atau statement tidak dikenal server)."""
+        with self._prepared_lock:
+            per_koneksi = self._prepared.pop(conn, {})
+        for cursor in per_koneksi.values():
+            try:
+                cursor.close()
+            except mysql.connector.Error:
+                pass
+
+    def _execute_prepared(self, nama, params, fetch_one=False):
+        """
+        Menjalankan SELECT terdaftar di PREPARED_STATEMENTS sebagai server-side prepared statement.
+        Statement di-prepare sekali per koneksi di pool; bila koneksi putus atau server tidak mengenal
+        statement-nya lagi, registri koneksi tersebut dikosongkan dan kueri dicoba ulang sekali
+        (koneksi baru dari pool akan mem-prepare ulang dengan sendirinya).
+        """
+        query = PREPARED_STATEMENTS[nama]
+        record_cls = PREPARED_RECORDS.get(nama)
+        if not self.use_prepared_statements:
+            if record_cls:
+                rows = self._fetch_records(record_cls, query, params)
+                return (rows[0] if rows else None) if fetch_one else rows
+            return self._execute_query(query, params, fetch_one=fetch_one, fetch_all=not fetch_one)
+        if not self.is_connected():
+            print("Kesalahan Database: Tidak ada koneksi ke database MySQL.")
+            return None
+        for percobaan in (1, 2):
+            try:
+                with self._pool.connection() as conn:
+                    try:
+                        cursor = self._prepared_cursor(conn, nama)
+                        cursor.execute(query, params)
+                        rows = cursor.fetchall() # Cursor prepared tidak di-buffer: hasil harus selalu dibaca habis
+                        if record_cls:
+                            buat = record_cls.pembuat(cursor.column_names)
+                            rows = [buat(row) for row in rows]
+                    except (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError):
+                        self._forget_prepared(conn)
+                        raise
+                    except mysql.connector.Error as err:
+                        if err.errno == ER_UNKNOWN_STMT_HANDLER:
+                            self._forget_prepared(conn)
+                        raise
+                if fetch_one:
+                    return rows[0] if rows else None
+                return rows
+            except mysql.connector.Error as err:
+                if percobaan == 1 and (err.errno == ER_UNKNOWN_STMT_HANDLER or
+                                       isinstance(err, (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError))):
+                    print(f"Prepared statement '{nama}' gagal ({err}), mencoba ulang dengan statement baru.")
+                    continue
+                print(f"Kesalahan prepared statement MySQL: {err}\nStatement: {nama}\nParams: {params}")
+                self._notify(messagebox.showerror, "Kesalahan Kueri Database", f"Terjadi kesalahan saat menjalankan kueri: {err}")
+                return None
+
+    def _ensure_schema(self):
+        """
+        Memastikan skema database sesuai query.ddl (tabel, view, trigger, SP) melalui schemaMigrator.
+        Jika versi skema sudah cocok, biayanya hanya satu SELECT ke tabel schema_version.
+        """
+        if not self.is_connected(): return
+        try:
+            with self._pool.connection() as conn:
+                ensure_schema(conn)
+        except (mysql.connector.Error, OSError) as e:
+            print(f"Kesalahan migrasi skema MySQL: {e}")
+            self._notify(messagebox.showerror, "Kesalahan Database", f"Gagal menerapkan skema database: {e}")
 
     def _update_data_action(self):
         if not self.selected_mahasiswa_nim_original:
@@ -142,153 +309,667 @@ class DatabaseService:
         if self.db_service.update_penghuni(self.selected_mahasiswa_nim_original, nim_baru, nama_baru, fakultas_baru):
             self.screen_manager.show_kamar_detail(self.kamar_id)
 
+    # --- Cache data referensi ---
+    def _load_asrama_reference(self):
+        rows = self._execute_query("SELECT asrama_id, nama_asrama FROM Asrama ORDER BY asrama_id", fetch_all=True)
+        return None if rows is None else [dict(row) for row in rows]
+
+    def _load_fakultas_reference(self):
+        rows = self._execute_query("SELECT fakultas_id, nama_fakultas FROM Fakultas", fetch_all=True)
+        return None if rows is None else {row['nama_fakultas']: row['fakultas_id'] for row in rows}
+
+    def _load_kamar_reference(self):
+        rows = self._execute_query("SELECT kamar_id_internal, nomor_kamar, asrama_id FROM Kamar ORDER BY asrama_id, nomor_kamar", fetch_all=True)
+        if rows is None: return None
+        id_by_key = {}
+        nomor_by_asrama = {}
+        for row in rows:
+            id_by_key[(row['nomor_kamar'], row['asrama_id'])] = row['kamar_id_internal']
+            nomor_by_asrama.setdefault(row['asrama_id'], []).append(row['nomor_kamar'])
+        return {'id_by_key': id_by_key, 'nomor_by_asrama': nomor_by_asrama}
+
+    def warm_reference_cache(self):
+        """Memuat Asrama, Fakultas, dan peta kamar ke memori (dipanggil sekali saat startup)."""
+        self._ref_cache.warm()
+
+    def invalidate_reference_cache(self, section=None):
+        """Memaksa data referensi ('asrama', 'fakultas', 'kamar' atau semua) dimuat ulang dari database."""
+        self._ref_cache.invalidate(section)
+
     # --- Metode CRUD untuk Asrama ---
     def get_all_asrama(self):
-        """Mengambil semua data asrama."""
-        return self._execute_query("SELECT asrama_id, nama_asrama FROM Asrama ORDER BY asrama_id", fetch_all=True) or []
+        """Mengambil semua data asrama (dari cache referensi)."""
+        return list(self._ref_cache.get('asrama') or [])
 
     # --- Metode CRUD untuk Kamar ---
     def get_kamar_id_internal(self, nomor_kamar_val, asrama_id_val):
-        """Mendapatkan ID internal kamar."""
-        result = self._execute_query("SELECT kamar_id_internal FROM Kamar WHERE nomor_kamar = %s AND asrama_id = %s",
-                                     (nomor_kamar_val, asrama_id_val), fetch_one=True)
-        return result['kamar_id_internal'] if result else None
+        """Mendapatkan ID internal kamar (dari cache referensi)."""
+        try:
+            key = (int(nomor_kamar_val), int(asrama_id_val))
+        except (TypeError, ValueError):
+            return None
+        kamar_ref = self._ref_cache.get('kamar')
+        if kamar_ref and key in kamar_ref['id_by_key']:
+            return kamar_ref['id_by_key'][key]
+        # Tidak ada di cache: mungkin kamar baru ditambahkan dari mesin lain, periksa langsung ke database.
+        result = self._execute_prepared('kamar_id_internal', key, fetch_one=True)
+        if result:
+            self._ref_cache.invalidate('kamar')
+            return result['kamar_id_internal']
+        return None
 
     def get_kapasitas_kamar(self, nomor_kamar_val, asrama_id_val):
         """Mengambil kapasitas kamar menggunakan View."""
-        result = self._execute_query("SELECT kapasitas FROM vw_DetailKamarPenghuni WHERE nomor_kamar = %s AND asrama_id = %s",
-                                     (nomor_kamar_val, asrama_id_val), fetch_one=True)
+        result = self._execute_prepared('kapasitas_kamar', (nomor_kamar_val, asrama_id_val), fetch_one=True)
         return result['kapasitas'] if result else 0
 
     def get_jumlah_penghuni(self, nomor_kamar_val, asrama_id_val):
         """Mengambil jumlah penghuni dalam satu kamar menggunakan View."""
-        result = self._execute_query("SELECT jumlah_penghuni_sekarang FROM vw_DetailKamarPenghuni WHERE nomor_kamar = %s AND asrama_id = %s",
-                                     (nomor_kamar_val, asrama_id_val), fetch_one=True)
+        result = self._execute_prepared('jumlah_penghuni', (nomor_kamar_val, asrama_id_val), fetch_one=True)
         return result['jumlah_penghuni_sekarang'] if result else 0
     
+    def get_room_snapshot(self, nomor_kamar_val, asrama_id_val):
+        """
+        Mengambil kapasitas, jumlah penghuni, dan daftar penghuni satu kamar dalam satu kueri.
+        Mengembalikan None jika kamar tidak ditemukan.
+        """
+        rows = self._execute_prepared('room_snapshot', (nomor_kamar_val, asrama_id_val))
+        if not rows:
+            return None
+        penghuni = [{'nim': row['nim'], 'nama_penghuni': row['nama_penghuni'], 'fakultas': row['fakultas']}
+                    for row in rows if row['nim'] is not None]
+        return {
+            'kamar_id_internal': rows[0]['kamar_id_internal'],
+            'kapasitas': rows[0]['kapasitas'],
+            'jumlah_penghuni': len(penghuni),
+            'penghuni': penghuni
+        }
+
+    def get_asrama_occupancy(self, asrama_id_val):
+        """Mengambil jumlah penghuni dan kapasitas setiap kamar dalam satu asrama dengan satu kueri (penghitung Kamar.jumlah_penghuni)."""
+        query = """
+            SELECT kamar_id_internal, nomor_kamar, kapasitas, jumlah_penghuni
+            FROM Kamar
+            WHERE asrama_id = %s
+            ORDER BY nomor_kamar ASC
+        """
+        return self._fetch_records(Kamar, query, (asrama_id_val,)) or []
+
+    def get_vacancy_board(self, lempar_galat=False):
+        """
+        Mengambil okupansi semua kamar di semua asrama dengan satu kueri, beserta watermark log_id terakhir.
+        Mengembalikan (rows, log_id_terakhir); perubahan setelah watermark diambil dengan get_occupancy_changes.
+        Tanpa `lempar_galat` kegagalan ditampilkan sebagai dialog dan menghasilkan ([], 0).
+        """
+        watermark = self._execute_query("SELECT IFNULL(MAX(log_id), 0) AS log_id FROM AuditLogAktivitasPenghuni", fetch_one=True,
+                                        lempar_galat=lempar_galat)
+        if watermark is None:
+            return [], 0
+        query = """
+            SELECT K.kamar_id_internal, K.asrama_id, A.nama_asrama, K.nomor_kamar, K.kapasitas, K.jumlah_penghuni
+            FROM Kamar K
+            JOIN Asrama A ON K.asrama_id = A.asrama_id
+            ORDER BY K.asrama_id ASC, K.nomor_kamar ASC
+        """
+        return self._fetch_records(Kamar, query, lempar_galat=lempar_galat) or [], watermark['log_id']
+
+    def get_occupancy_changes(self, after_log_id, lempar_galat=False):
+        """
+        Mengambil okupansi terbaru hanya untuk kamar yang disentuh log aktivitas setelah `after_log_id`
+        (kamar lama dan kamar baru). Mengembalikan (rows, log_id_terakhir); rows kosong jika tidak ada perubahan.
+        Tanpa `lempar_galat` kegagalan ditampilkan sebagai dialog dan watermark tidak maju.
+        """
+        watermark = self._execute_query("SELECT IFNULL(MAX(log_id), 0) AS log_id FROM AuditLogAktivitasPenghuni", fetch_one=True,
+                                        lempar_galat=lempar_galat)
+        if watermark is None or watermark['log_id'] <= after_log_id:
+            return [], after_log_id
+        query = """
+            SELECT K.kamar_id_internal, K.kapasitas, K.jumlah_penghuni
+            FROM Kamar K
+            JOIN (
+                SELECT kamar_id_internal_lama AS kamar_id_internal FROM AuditLogAktivitasPenghuni
+                WHERE log_id > %s AND log_id <= %s AND kamar_id_internal_lama IS NOT NULL
+                UNION
+                SELECT kamar_id_internal_baru FROM AuditLogAktivitasPenghuni
+                WHERE log_id > %s AND log_id <= %s AND kamar_id_internal_baru IS NOT NULL
+            ) Berubah ON Berubah.kamar_id_internal = K.kamar_id_internal
+        """
+        params = (after_log_id, watermark['log_id'], after_log_id, watermark['log_id'])
+        rows = self._fetch_records(Kamar, query, params, lempar_galat=lempar_galat)
+        if rows is None:
+            return [], after_log_id
+        return rows, watermark['log_id']
+
+    def _tandai_data_berubah(self):
+        """Menaikkan versi_data setelah mutasi data penghuni; layar yang disimpan ScreenManager memuat ulang datanya saat ditampilkan."""
+        self.versi_data += 1
+
+    def _tandai_okupansi_berubah(self):
+        """Dipanggil setelah tambah/pindah/hapus penghuni: indeks kamar kosong disinkronkan pada pencarian berikutnya."""
+        self._vacancy_kotor = True
+        self._tandai_data_berubah()
+
+    def _vacancy_index(self):
+        """
+        Mengembalikan VacancyIndex yang mutakhir. Dimuat penuh sekali; setelah itu hanya kamar yang disentuh log
+        aktivitas sejak watermark terakhir yang diperbarui, yaitu setelah penulisan dari aplikasi ini
+        atau setelah `vacancy_ttl` detik (untuk menangkap perubahan dari komputer lain).
+        Setiap `vacancy_resync_setiap` sinkron inkremental indeks dimuat penuh lagi, seperti RESYNC_SETIAP pada papan
+        okupansi, untuk menangkap log yang ter-commit di bawah watermark serta kamar yang baru ditambahkan.
+        """
+        with self._vacancy_lock:
+            perlu_sinkron = self._vacancy_kotor or time.monotonic() - self._vacancy_disinkron_pada >= self._vacancy_ttl
+            if self._vacancy_watermark is None or (perlu_sinkron and self._vacancy_jumlah_sinkron >= self._vacancy_resync_setiap):
+                rows, watermark = self.get_vacancy_board()
+                if rows:
+                    self._vacancy.muat(rows)
+                    self._vacancy_watermark = watermark
+                    self._vacancy_disinkron_pada = time.monotonic()
+                    self._vacancy_kotor = False
+                    self._vacancy_jumlah_sinkron = 0
+            elif perlu_sinkron:
+                self._vacancy_kotor = False
+                rows, self._vacancy_watermark = self.get_occupancy_changes(self._vacancy_watermark)
+                self._vacancy.terapkan(rows)
+                self._vacancy_disinkron_pada = time.monotonic()
+                self._vacancy_jumlah_sinkron += 1
+        return self._vacancy
+
+    def cari_kamar_kosong(self, asrama_id_val, nomor_kamar_acuan=None, batas=5):
+        """Saran kamar dengan tempat kosong di satu asrama, dari yang paling dekat dengan `nomor_kamar_acuan`."""
+        return self._vacancy_index().terdekat(int(asrama_id_val), int(nomor_kamar_acuan) if nomor_kamar_acuan is not None else None, batas)
+
+    def cari_kamar_kosong_di_lantai(self, lantai, asrama_id_val=None, batas=5):
+        """Saran kamar dengan tempat kosong di lantai tertentu, di satu asrama atau di semua asrama."""
+        return self._vacancy_index().di_lantai(int(lantai), int(asrama_id_val) if asrama_id_val is not None else None, batas)
+
+    def rekonsiliasi_jumlah_penghuni(self):
+        """Membangun ulang penghitung Kamar.jumlah_penghuni dari tabel Penghuni. Mengembalikan jumlah kamar yang diperbaiki."""
+        if not self.is_connected(): return None
+        try:
+            with self._cursor() as (conn, cursor):
+                cursor.callproc('sp_RekonsiliasiJumlahPenghuni')
+                jumlah_diperbaiki = 0
+                for result in cursor.stored_results():
+                    row = result.fetchone()
+                    if row: jumlah_diperbaiki = row.get('jumlah_kamar_diperbaiki', 0)
+                conn.commit()
+                print(f"Rekonsiliasi jumlah penghuni selesai: {jumlah_diperbaiki} kamar diperbaiki.")
+                return jumlah_diperbaiki
+        except mysql.connector.Error as err:
+            print(f"Kesalahan rekonsiliasi jumlah penghuni: {err}")
+            self._notify(messagebox.showerror, "Kesalahan Database", f"Gagal merekonsiliasi jumlah penghuni: {err}")
+            return None
+
     def get_all_kamar_in_asrama(self, asrama_id_val):
-        """Mengambil semua nomor kamar dalam satu asrama."""
-        query = "SELECT nomor_kamar FROM Kamar WHERE asrama_id = %s ORDER BY nomor_kamar ASC"
-        return self._execute_query(query, (asrama_id_val,), fetch_all=True) or []
+        """Mengambil semua nomor kamar dalam satu asrama (dari cache referensi)."""
+        kamar_ref = self._ref_cache.get('kamar')
+        if not kamar_ref: return []
+        return [{'nomor_kamar': nomor} for nomor in kamar_ref['nomor_by_asrama'].get(asrama_id_val, [])]
     
-    def get_fakultas_id_by_name(self, nama_fakultas):
-        """Mendapatkan fakultas_id berdasarkan nama_fakultas."""
+    def get_fakultas_id_by_name(self, nama_fakultas, lempar_galat=False):
+        """
+        Mendapatkan fakultas_id berdasarkan nama_fakultas (dari cache referensi); None jika tidak ada.
+        Dengan `lempar_galat=True` kegagalan kueri dilempar sehingga dapat dibedakan dari fakultas yang memang tidak ada.
+        """
         if not nama_fakultas: return None
+        fakultas_ref = self._ref_cache.get('fakultas')
+        if fakultas_ref and nama_fakultas in fakultas_ref:
+            return fakultas_ref[nama_fakultas]
         query = "SELECT fakultas_id FROM Fakultas WHERE nama_fakultas = %s"
-        result = self._execute_query(query, (nama_fakultas,), fetch_one=True)
-        return result['fakultas_id'] if result else None
+        result = self._execute_query(query, (nama_fakultas,), fetch_one=True, lempar_galat=lempar_galat)
+        if result:
+            self._ref_cache.invalidate('fakultas')
+            return result['fakultas_id']
+        return None
 
 
     # --- Metode CRUD untuk Penghuni ---
     def get_penghuni_in_kamar(self, nomor_kamar_val, asrama_id_val):
-        """Mengambil data penghuni dalam satu kamar menggunakan View."""
+        """Mengambil data penghuni dalam satu kamar menggunakan View (baris berupa record Penghuni)."""
         kamar_internal_id = self.get_kamar_id_internal(nomor_kamar_val, asrama_id_val)
         if not kamar_internal_id:
             return ["Info: Kamar tidak ditemukan"], []
 
-        query = """
-            SELECT nim, nama_penghuni, fakultas, nomor_kamar, nama_asrama
-            FROM vw_DaftarPenghuniLengkap
-            WHERE kamar_id_internal = %s
-            ORDER BY nama_penghuni ASC
-        """
-        data_lengkap_rows = self._execute_query(query, (kamar_internal_id,), fetch_all=True)
+        data_lengkap_rows = self._execute_prepared('penghuni_in_kamar', (kamar_internal_id,))
 
         if not data_lengkap_rows:
             return ["Info: Kamar ini kosong"], []
 
-        opsi_display = [f"{row['nim']} - {row['nama_penghuni']}" for row in data_lengkap_rows]
-        data_lengkap_list_of_dicts = [dict(row) for row in data_lengkap_rows]
-        return opsi_display, data_lengkap_list_of_dicts
+        opsi_display = [f"{row.nim} - {row.nama_penghuni}" for row in data_lengkap_rows]
+        return opsi_display, data_lengkap_rows
+
+    def _ada_indeks_fulltext_nama(self):
+        """True jika indeks FULLTEXT ngram ft_penghuni_nama ada (tidak dibuat di MariaDB). Hasil pemeriksaan disimpan."""
+        if self._fulltext_nama is None:
+            row = self._execute_query("SELECT COUNT(*) AS jumlah FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE() "
+                                      "AND TABLE_NAME = 'Penghuni' AND INDEX_NAME = 'ft_penghuni_nama'", fetch_one=True)
+            if row is None:
+                return False # Dicoba lagi pada pencarian berikutnya
+            self._fulltext_nama = row['jumlah'] > 0
+        return self._fulltext_nama
+
+    def cari_penghuni(self, kata_kunci, after=None, limit=25):
+        """
+        Mencari penghuni di semua asrama. Kata kunci berupa angka dicocokkan sebagai awalan NIM (indeks PK),
+        selain itu sebagai potongan nama tanpa membedakan huruf besar/kecil (indeks FULLTEXT ngram;
+        kata kunci 1 huruf, atau server tanpa indeks tersebut seperti MariaDB, memakai LIKE saja). Hasil dipaginasi dengan keyset: `after` adalah baris terakhir
+        dari halaman sebelumnya (None untuk halaman pertama).
+        """
+        kata_kunci = (kata_kunci or "").strip()
+        if not kata_kunci:
+            return []
+        kondisi = []
+        params = []
+        if NIM_PATTERN.match(kata_kunci):
+            kondisi.append("P.nim LIKE %s")
+            params.append(f"{kata_kunci}%")
+            if after:
+                kondisi.append("P.nim > %s")
+                params.append(after['nim'])
+            order_sql = "P.nim"
+        else:
+            pola_like = "%" + re.sub(r'([\\%_])', r'\\\1', kata_kunci) + "%"
+            frasa = kata_kunci.replace('"', ' ').strip()
+            if len(frasa) >= NGRAM_TOKEN_SIZE and self._ada_indeks_fulltext_nama():
+                # Frasa ngram mencocokkan potongan nama; LIKE menyaring sisa kecocokan semu pada baris kandidat saja.
+                kondisi.append("MATCH(P.nama_penghuni) AGAINST (%s IN BOOLEAN MODE)")
+                params.append(f'"{frasa}"')
+            kondisi.append("P.nama_penghuni LIKE %s")
+            params.append(pola_like)
+            if after:
+                kondisi.append("(P.nama_penghuni, P.nim) > (%s, %s)")
+                params.extend([after['nama_penghuni'], after['nim']])
+            order_sql = "P.nama_penghuni, P.nim"
+        params.append(limit)
+        query = f"""
+            SELECT P.nim, P.nama_penghuni, F.nama_fakultas AS fakultas,
+                   K.nomor_kamar, K.asrama_id, A.nama_asrama
+            FROM Penghuni P
+            JOIN Kamar K ON P.kamar_id_internal = K.kamar_id_internal
+            JOIN Asrama A ON K.asrama_id = A.asrama_id
+            LEFT JOIN Fakultas F ON P.fakultas_id = F.fakultas_id
+            WHERE {' AND '.join(kondisi)}
+            ORDER BY {order_sql}
+            LIMIT %s
+        """
+        return self._fetch_records(Penghuni, query, tuple(params)) or []
 
     def add_penghuni(self, nim, nama, fakultas, nomor_kamar_val, asrama_id_val):
         """Menambahkan penghuni baru menggunakan Stored Procedure sp_TambahPenghuni."""
-        if not self.conn or not self.conn.is_connected():
-            messagebox.showerror("Kesalahan Database", "Tidak ada koneksi ke database MySQL.")
+        if not self.is_connected():
+            self._notify(messagebox.showerror, "Kesalahan Database", "Tidak ada koneksi ke database MySQL.")
             return False
         try:
-            args_for_callproc = [nim, nama, fakultas, nomor_kamar_val, asrama_id_val, None, None] 
-            
-            self.cursor.callproc('sp_TambahPenghuni', args_for_callproc) 
-            
-            out_params_dict = None
-            for result in self.cursor.stored_results():
-                out_params_dict = result.fetchone() 
-                break 
-
-            if out_params_dict:
-                status_code = out_params_dict.get('p_status_code') 
-                status_message = out_params_dict.get('p_status_message')
-
-                if status_code == 0: 
-                    messagebox.showinfo("Sukses", status_message)
-                    self.conn.commit() 
-                    return True
+            with self._cursor() as (conn, cursor):
+                args_for_callproc = [nim, nama, fakultas, nomor_kamar_val, asrama_id_val, None, None] 
+                
+                cursor.callproc('sp_TambahPenghuni', args_for_callproc) 
+                
+                out_params_dict = None
+                for result in cursor.stored_results():
+                    out_params_dict = result.fetchone() 
+                    break 
+
+                if out_params_dict:
+                    status_code = out_params_dict.get('p_status_code') 
+                    status_message = out_params_dict.get('p_status_message')
+
+                    if status_code == 0: 
+                        conn.commit() 
+                        self._tandai_okupansi_berubah()
+                        if fakultas and fakultas not in (self._ref_cache.get('fakultas') or {}):
+                            self._ref_cache.invalidate('fakultas') # SP menambahkan fakultas baru
+                        self._notify(messagebox.showinfo, "Sukses", status_message)
+                        return True
+                    else:
+                        self._notify(messagebox.showerror, "Gagal Menambah Penghuni", status_message if status_message else "Status tidak diketahui dari SP.")
+                        return False
                 else:
-                    messagebox.showerror("Gagal Menambah Penghuni", status_message if status_message else "Status tidak diketahui dari SP.")
+                    self._notify(messagebox.showerror, "Kesalahan SP", "Tidak dapat mengambil status dari Stored Procedure Tambah Penghuni.")
                     return False
-            else:
-                messagebox.showerror("Kesalahan SP", "Tidak dapat mengambil status dari Stored Procedure Tambah Penghuni.")
-                return False
         except mysql.connector.Error as err:
-            messagebox.showerror("Kesalahan Database SP", f"Gagal memanggil sp_TambahPenghuni: {err}")
-            try:
-                if self.conn.in_transaction: self.conn.rollback()
-            except: pass
+            # Transaksi yang belum di-commit otomatis di-rollback saat koneksi dikembalikan ke pool.
+            self._notify(messagebox.showerror, "Kesalahan Database SP", f"Gagal memanggil sp_TambahPenghuni: {err}")
             return False
 
     def pindah_kamar_penghuni(self, nim, nomor_kamar_baru, asrama_id_baru):
         """Memindahkan penghuni ke kamar lain menggunakan Stored Procedure sp_PindahKamarPenghuni."""
-        if not self.conn or not self.conn.is_connected():
-            messagebox.showerror("Kesalahan Database", "Tidak ada koneksi ke database MySQL.")
+        if not self.is_connected():
+            self._notify(messagebox.showerror, "Kesalahan Database", "Tidak ada koneksi ke database MySQL.")
             return False, "Tidak ada koneksi database."
         try:
-            # SP sp_PindahKamarPenghuni expects 5 parameters: 3 IN, 2 OUT.
-            args_for_callproc = [nim, nomor_kamar_baru, asrama_id_baru, None, None]
-            self.cursor.callproc('sp_PindahKamarPenghuni', args_for_callproc)
+            with self._cursor() as (conn, cursor):
+                # SP sp_PindahKamarPenghuni expects 5 parameters: 3 IN, 2 OUT.
+                args_for_callproc = [nim, nomor_kamar_baru, asrama_id_baru, None, None]
+                cursor.callproc('sp_PindahKamarPenghuni', args_for_callproc)
 
-            out_params_dict = None
-            for result in self.cursor.stored_results():
-                out_params_dict = result.fetchone()
-                break
-            
-            if out_params_dict:
-                status_code = out_params_dict.get('p_status_code')
-                status_message = out_params_dict.get('p_status_message')
-
-                if status_code == 0: 
-                    if status_message and "Info:" in status_message: 
-                        messagebox.showinfo("Info Pindah Kamar", status_message)
+                out_params_dict = None
+                for result in cursor.stored_results():
+                    out_params_dict = result.fetchone()
+                    break
+                
+                if out_params_dict:
+                    status_code = out_params_dict.get('p_status_code')
+                    status_message = out_params_dict.get('p_status_message')
+
+                    if status_code == 0: 
+                        conn.commit()
+                        self._tandai_okupansi_berubah()
+                        if status_message and "Info:" in status_message: 
+                            self._notify(messagebox.showinfo, "Info Pindah Kamar", status_message)
+                        else:
+                            self._notify(messagebox.showinfo, "Sukses Pindah Kamar", status_message if status_message else "Operasi berhasil.")
+                        return True, status_message
                     else:
-                        messagebox.showinfo("Sukses Pindah Kamar", status_message if status_message else "Operasi berhasil.")
-                    self.conn.commit()
-                    return True, status_message
+                        self._notify(messagebox.showerror, "Gagal Pindah Kamar", status_message if status_message else "Status tidak diketahui dari SP.")
+                        return False, status_message
                 else:
-                    messagebox.showerror("Gagal Pindah Kamar", status_message if status_message else "Status tidak diketahui dari SP.")
-                    return False, status_message
-            else:
-                messagebox.showerror("Kesalahan SP", "Tidak dapat mengambil status dari Stored Procedure Pindah Kamar.")
-                return False, "Gagal mengambil status SP."
+                    self._notify(messagebox.showerror, "Kesalahan SP", "Tidak dapat mengambil status dari Stored Procedure Pindah Kamar.")
+                    return False, "Gagal mengambil status SP."
         except mysql.connector.Error as err:
-            messagebox.showerror("Kesalahan Database SP", f"Gagal memanggil sp_PindahKamarPenghuni: {err}")
-            try:
-                if self.conn.in_transaction: self.conn.rollback()
-            except: pass
+            self._notify(messagebox.showerror, "Kesalahan Database SP", f"Gagal memanggil sp_PindahKamarPenghuni: {err}")
             return False, str(err)
     
 
 
+    def pindah_kamar_bulk(self, moves):
+        """
+        Memindahkan banyak penghuni sekaligus. `moves` berisi tuple (nim, nomor_kamar_baru, asrama_id_baru).
+        Kapasitas keadaan akhir divalidasi di memori sehingga pertukaran dan rantai perpindahan lewat kamar penuh
+        tetap bisa dilakukan. Semua perpindahan diterapkan dengan satu UPDATE dalam satu transaksi,
+        atau seluruh rencana ditolak. Mengembalikan (berhasil, daftar hasil per item).
+        """
+        if not self.is_connected():
+            return False, [{'nim': m[0], 'status': 'rejected', 'pesan': "Tidak ada koneksi database."} for m in moves]
+        kamar_ref = self._ref_cache.get('kamar') or {'id_by_key': {}}
+        hasil = []
+        target_by_nim = {}
+        for nim, nomor_kamar_baru, asrama_id_baru in moves:
+            nim = str(nim).strip()
+            item = {'nim': nim, 'nomor_kamar_baru': nomor_kamar_baru, 'asrama_id_baru': asrama_id_baru, 'status': 'ok', 'pesan': ''}
+            hasil.append(item)
+            try:
+                kamar_id = kamar_ref['id_by_key'].get((int(nomor_kamar_baru), int(asrama_id_baru)))
+            except (TypeError, ValueError):
+                kamar_id = None
+            if not NIM_PATTERN.match(nim):
+                item.update(status='rejected', pesan="NIM tidak valid.")
+            elif nim in target_by_nim:
+                item.update(status='rejected', pesan="NIM muncul lebih dari sekali dalam rencana.")
+            elif kamar_id is None:
+                item.update(status='rejected', pesan="Kamar tujuan tidak ditemukan.")
+            else:
+                target_by_nim[nim] = kamar_id
+
+        if not target_by_nim:
+            return False, hasil
+
+        try:
+            with self._cursor(dictionary=False) as (conn, cursor):
+                nims = list(target_by_nim)
+                placeholders = ", ".join(["%s"] * len(nims))
+                cursor.execute(f"SELECT nim, kamar_id_internal FROM Penghuni WHERE nim IN ({placeholders}) FOR UPDATE", nims)
+                kamar_asal = {row[0]: row[1] for row in cursor.fetchall()}
+
+                kamar_ids = sorted(set(kamar_asal.values()) | set(target_by_nim.values()))
+                placeholders = ", ".join(["%s"] * len(kamar_ids))
+                cursor.execute(f"SELECT kamar_id_internal, kapasitas, jumlah_penghuni FROM Kamar "
+                               f"WHERE kamar_id_internal IN ({placeholders}) FOR UPDATE", kamar_ids)
+                kapasitas = {}
+                jumlah_akhir = {}
+                for kamar_id, kap, jumlah in cursor.fetchall():
+                    kapasitas[kamar_id] = kap
+                    jumlah_akhir[kamar_id] = jumlah
+
+                perpindahan = {}
+                for item in hasil:
+                    nim = item['nim']
+                    if item['status'] != 'ok' or target_by_nim.get(nim) is None: continue
+                    if nim not in kamar_asal:
+                        item.update(status='rejected', pesan="Penghuni dengan NIM tersebut tidak ditemukan.")
+                    elif kamar_asal[nim] == target_by_nim[nim]:
+                        item.update(status='noop', pesan="Penghuni sudah berada di kamar tujuan.")
+                    else:
+                        perpindahan[nim] = target_by_nim[nim]
+                        jumlah_akhir[kamar_asal[nim]] -= 1
+                        jumlah_akhir[target_by_nim[nim]] += 1
+
+                for item in hasil:
+                    kamar_id = perpindahan.get(item['nim'])
+                    if kamar_id is not None and jumlah_akhir[kamar_id] > kapasitas[kamar_id]:
+                        item.update(status='rejected', pesan=f"Kamar tujuan akan melebihi kapasitas ({jumlah_akhir[kamar_id]}/{kapasitas[kamar_id]}).")
+
+                if any(item['status'] == 'rejected' for item in hasil):
+                    conn.rollback()
+                    for item in hasil:
+                        if item['status'] == 'ok': item['pesan'] = "Tidak diterapkan: rencana perpindahan ditolak."
+                    return False, hasil
+                if perpindahan:
+                    case_sql = " ".join(["WHEN %s THEN %s"] * len(perpindahan))
+                    placeholders = ", ".join(["%s"] * len(perpindahan))
+                    params = [v for pair in perpindahan.items() for v in pair] + list(perpindahan)
+                    cursor.execute(f"UPDATE Penghuni SET kamar_id_internal = CASE nim {case_sql} END "
+                                   f"WHERE nim IN ({placeholders})", params)
+                conn.commit()
+                self._tandai_okupansi_berubah()
+                for item in hasil:
+                    if item['status'] == 'ok': item['pesan'] = "Berhasil dipindahkan."
+                return True, hasil
+        except mysql.connector.Error as err:
+            print(f"Kesalahan pindah kamar massal: {err}")
+            for item in hasil:
+                if item['status'] in ('ok', 'noop'): item.update(status='rejected', pesan=f"Transaksi dibatalkan: {err}")
+            return False, hasil
+
+    def _validate_bulk_record(self, record, fakultas_ref, kamar_ref):
+        """Validasi satu baris impor di Python. Mengembalikan (nim, nama, fakultas_id, kamar_id_internal) atau pesan kesalahan."""
+        nim = (record.get('nim') or '').strip()
+        nama = (record.get('nama') or '').strip()
+        nama_fakultas = (record.get('fakultas') or '').strip()
+        if not NIM_PATTERN.match(nim):
+            return None, "NIM tidak valid (harus berupa angka dan tidak boleh kosong)."
+        if not nama:
+            return None, "Nama tidak boleh kosong."
+        try:
+            key = (int(record.get('nomor_kamar')), int(record.get('asrama_id')))
+        except (TypeError, ValueError):
+            return None, "Nomor kamar atau ID asrama tidak valid."
+        kamar_id = kamar_ref['id_by_key'].get(key)
+        if kamar_id is None:
+            return None, f"Kamar {key[0]} di asrama {key[1]} tidak ditemukan."
+        fakultas_id = None
+        if nama_fakultas:
+            fakultas_id = fakultas_ref.get(nama_fakultas)
+            if fakultas_id is None:
+                # Sama seperti sp_TambahPenghuni: fakultas yang belum ada dibuat otomatis.
+                fakultas_id = self._tambah_fakultas(nama_fakultas)
+                if fakultas_id is None:
+                    return None, f"Fakultas '{nama_fakultas}' tidak dapat ditambahkan."
+                fakultas_ref[nama_fakultas] = fakultas_id
+        return (nim, nama, fakultas_id, kamar_id), None
+
+    def _tambah_fakultas(self, nama_fakultas):
+        """Membuat fakultas (atau mengambil yang sudah dibuat mesin lain) dan mengembalikan fakultas_id-nya; None jika gagal."""
+        try:
+            with self._cursor(dictionary=False) as (conn, cursor):
+                cursor.execute("INSERT IGNORE INTO Fakultas (nama_fakultas) VALUES (%s)", (nama_fakultas,))
+                cursor.execute("SELECT fakultas_id FROM Fakultas WHERE nama_fakultas = %s", (nama_fakultas,))
+                row = cursor.fetchone()
+                conn.commit()
+        except mysql.connector.Error as err:
+            print(f"Kesalahan menambah fakultas '{nama_fakultas}': {err}")
+            return None
+        self._ref_cache.invalidate('fakultas')
+        return row[0] if row else None
+
+    def _insert_penghuni_chunk(self, chunk):
+        """
+        Menyisipkan satu chunk baris tervalidasi dalam satu transaksi.
+        Baris kamar dikunci (FOR UPDATE) agar kapasitas tidak terlampaui oleh penambahan dari mesin lain.
+        """
+        hasil = []
+        try:
+            with self._cursor(dictionary=False) as (conn, cursor):
+                nims = [data[0] for _, data in chunk]
+                placeholders = ", ".join(["%s"] * len(nims))
+                cursor.execute(f"SELECT nim FROM Penghuni WHERE nim IN ({placeholders})", nims)
+                nim_terdaftar = {row[0] for row in cursor.fetchall()}
+
+                kamar_ids = sorted({data[3] for _, data in chunk})
+                placeholders = ", ".join(["%s"] * len(kamar_ids))
+                cursor.execute(f"SELECT kamar_id_internal, kapasitas - jumlah_penghuni FROM Kamar "
+                               f"WHERE kamar_id_internal IN ({placeholders}) FOR UPDATE", kamar_ids)
+                sisa_kapasitas = {row[0]: row[1] for row in cursor.fetchall()}
+
+                baris_insert = []
+                for baris, data in chunk:
+                    nim, _, _, kamar_id = data
+                    if nim in nim_terdaftar:
+                        hasil.append({'baris': baris, 'nim': nim, 'status': 'duplicate_nim', 'pesan': f"NIM {nim} sudah terdaftar."})
+                    elif sisa_kapasitas.get(kamar_id, 0) <= 0:
+                        hasil.append({'baris': baris, 'nim': nim, 'status': 'room_full', 'pesan': "Kamar sudah penuh."})
+                    else:
+                        sisa_kapasitas[kamar_id] -= 1
+                        baris_insert.append(data)
+                        hasil.append({'baris': baris, 'nim': nim, 'status': 'inserted', 'pesan': "Berhasil ditambahkan."})
+
+                if baris_insert:
+                    cursor.executemany("INSERT INTO Penghuni (nim, nama_penghuni, fakultas_id, kamar_id_internal) "
+                                       "VALUES (%s, %s, %s, %s)", baris_insert)
+                conn.commit()
+                if baris_insert: self._tandai_okupansi_berubah()
+            return hasil
+        except mysql.connector.Error as err:
+            print(f"Kesalahan impor chunk penghuni: {err}")
+            return [{'baris': baris, 'nim': data[0], 'status': 'error', 'pesan': f"Chunk dibatalkan: {err}"} for baris, data in chunk]
+
+    def add_penghuni_bulk(self, records, chunk_size=1000):
+        """
+        Menambahkan banyak penghuni sekaligus dari iterable (baris_ke, dict) secara streaming.
+        Setiap chunk ditulis dengan executemany dalam satu transaksi.
+        Menghasilkan (yield) laporan per baris dengan status: inserted, room_full, duplicate_nim, invalid, atau error.
+        """
+        if not self.is_connected():
+            raise mysql.connector.errors.InterfaceError("Tidak ada koneksi ke database MySQL.")
+        self._ref_cache.invalidate('kamar')
+        fakultas_ref = dict(self._ref_cache.get('fakultas') or {}) # Salinan; fakultas baru dari file ditambahkan ke sini
+        kamar_ref = self._ref_cache.get('kamar') or {'id_by_key': {}}
+        nim_dalam_file = set()
+        chunk = []
+        for baris, record in records:
+            data, pesan = self._validate_bulk_record(record, fakultas_ref, kamar_ref)
+            if data is None:
+                yield {'baris': baris, 'nim': (record.get('nim') or '').strip(), 'status': 'invalid', 'pesan': pesan}
+                continue
+            if data[0] in nim_dalam_file:
+                yield {'baris': baris, 'nim': data[0], 'status': 'duplicate_nim', 'pesan': f"NIM {data[0]} muncul lebih dari sekali dalam file."}
+                continue
+            nim_dalam_file.add(data[0])
+            chunk.append((baris, data))
+            if len(chunk) >= chunk_size:
+                yield from self._insert_penghuni_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield from self._insert_penghuni_chunk(chunk)
+
+    def get_komposisi_fakultas_kamar(self, lempar_galat=False):
+        """Jumlah penghuni per (kamar, fakultas) untuk seluruh kamar: {kamar_id_internal: {fakultas_id: jumlah}}."""
+        rows = self._execute_query("SELECT kamar_id_internal, fakultas_id, COUNT(*) AS jumlah FROM Penghuni "
+                                   "GROUP BY kamar_id_internal, fakultas_id", fetch_all=True, lempar_galat=lempar_galat)
+        if rows is None:
+            return None
+        komposisi = {}
+        for row in rows:
+            komposisi.setdefault(row['kamar_id_internal'], {})[row['fakultas_id']] = row['jumlah']
+        return komposisi
+
+    def get_nim_terdaftar(self, nims, chunk_size=1000, lempar_galat=False):
+        """Mengembalikan himpunan NIM dari `nims` yang sudah terdaftar sebagai penghuni."""
+        nims = list(nims)
+        terdaftar = set()
+        for i in range(0, len(nims), chunk_size):
+            bagian = nims[i:i + chunk_size]
+            placeholders = ", ".join(["%s"] * len(bagian))
+            rows = self._execute_query(f"SELECT nim FROM Penghuni WHERE nim IN ({placeholders})", tuple(bagian), fetch_all=True,
+                                       lempar_galat=lempar_galat)
+            if rows is None:
+                return None
+            terdaftar.update(row['nim'] for row in rows)
+        return terdaftar
+
+    def terapkan_alokasi(self, penempatan, chunk_size=1000):
+        """
+        Menerapkan rencana alokasi (daftar dict nim, nama, fakultas, fakultas_id, kamar_id_internal) dalam SATU transaksi.
+        Kamar dikunci (FOR UPDATE) lalu kapasitas dan NIM diperiksa ulang; jika ada satu saja yang tidak lagi
+        memenuhi syarat, seluruh rencana dibatalkan. Penempatan dengan nama fakultas tetapi tanpa fakultas_id
+        (fakultas baru) membuat fakultas tersebut di transaksi yang sama, seperti sp_TambahPenghuni dan impor massal.
+        Mengembalikan (berhasil, daftar hasil per penghuni).
+        """
+        hasil = [{'nim': p['nim'], 'status': 'ok', 'pesan': ''} for p in penempatan]
+        if not penempatan:
+            return True, hasil
+        if not self.is_connected():
+            for item in hasil: item.update(status='rejected', pesan="Tidak ada koneksi database.")
+            return False, hasil
+        try:
+            with self._cursor(dictionary=False) as (conn, cursor):
+                kamar_ids = sorted({p['kamar_id_internal'] for p in penempatan})
+                placeholders = ", ".join(["%s"] * len(kamar_ids))
+                cursor.execute(f"SELECT kamar_id_internal, kapasitas - jumlah_penghuni FROM Kamar "
+                               f"WHERE kamar_id_internal IN ({placeholders}) FOR UPDATE", kamar_ids)
+                sisa_kapasitas = {row[0]: row[1] for row in cursor.fetchall()}
+
+                nim_terdaftar = set()
+                for i in range(0, len(penempatan), chunk_size):
+                    nims = [p['nim'] for p in penempatan[i:i + chunk_size]]
+                    placeholders = ", ".join(["%s"] * len(nims))
+                    cursor.execute(f"SELECT nim FROM Penghuni WHERE nim IN ({placeholders})", nims)
+                    nim_terdaftar.update(row[0] for row in cursor.fetchall())
+
+                for p, item in zip(penempatan, hasil):
+                    if p['nim'] in nim_terdaftar:
+                        item.update(status='rejected', pesan=f"NIM {p['nim']} sudah terdaftar.")
+                    elif sisa_kapasitas.get(p['kamar_id_internal'], 0) <= 0:
+                        item.update(status='rejected', pesan="Kamar sudah penuh sejak rencana dibuat.")
+                    else:
+                        sisa_kapasitas[p['kamar_id_internal']] -= 1
+                if any(item['status'] == 'rejected' for item in hasil):
+                    conn.rollback()
+                    for item in hasil:
+                        if item['status'] == 'ok': item['pesan'] = "Tidak diterapkan: rencana alokasi ditolak."
+                    return False, hasil
+
+                fakultas_baru = {}
+                for nama_fakultas in sorted({p['fakultas'] for p in penempatan if p.get('fakultas_id') is None and p.get('fakultas')}):
+                    cursor.execute("INSERT IGNORE INTO Fakultas (nama_fakultas) VALUES (%s)", (nama_fakultas,))
+                    cursor.execute("SELECT fakultas_id FROM Fakultas WHERE nama_fakultas = %s", (nama_fakultas,))
+                    fakultas_baru[nama_fakultas] = cursor.fetchone()[0]
+                baris_insert = [(p['nim'], p['nama'], p['fakultas_id'] if p.get('fakultas_id') is not None else fakultas_baru.get(p.get('fakultas')),
+                                 p['kamar_id_internal']) for p in penempatan]
+                for i in range(0, len(baris_insert), chunk_size):
+                    cursor.executemany("INSERT INTO Penghuni (nim, nama_penghuni, fakultas_id, kamar_id_internal) "
+                                       "VALUES (%s, %s, %s, %s)", baris_insert[i:i + chunk_size])
+                conn.commit()
+                if fakultas_baru:
+                    self._ref_cache.invalidate('fakultas')
+                self._tandai_okupansi_berubah()
+                for item in hasil: item['pesan'] = "Berhasil ditempatkan."
+                return True, hasil
+        except mysql.connector.Error as err:
+            print(f"Kesalahan penerapan alokasi: {err}")
+            for item in hasil: item.update(status='rejected', pesan=f"Transaksi dibatalkan: {err}")
+            return False, hasil
+
     def update_penghuni(self, nim_original, nim_baru, nama_baru, nama_fakultas_baru):
         """Memperbarui data penghuni (Trigger akan mencatat log)."""
-        if not self.conn or not self.conn.is_connected():
-            messagebox.showerror("Kesalahan Database", "Tidak ada koneksi ke database MySQL.")
+        if not self.is_connected():
+            self._notify(messagebox.showerror, "Kesalahan Database", "Tidak ada koneksi ke database MySQL.")
             return False
 
         # 1. Periksa apakah NIM original ada di database
-        check_exists_query = "SELECT 1 FROM Penghuni WHERE nim = %s"
-        self.cursor.execute(check_exists_query, (nim_original,))
-        if not self.cursor.fetchone():
-            messagebox.showwarning("Perhatian", f"Tidak ada data penghuni yang cocok dengan NIM original: {nim_original}.")
+        if not self._execute_prepared('nim_exists', (nim_original,), fetch_one=True):
+            self._notify(messagebox.showwarning, "Perhatian", f"Tidak ada data penghuni yang cocok dengan NIM original: {nim_original}.")
             return False
 
         updates = []
@@ -297,12 +978,10 @@ class DatabaseService:
         # Validasi dan persiapan update NIM baru
         if nim_baru and nim_original != nim_baru:
             if not nim_baru.isdigit(): # Validasi NIM baru harus angka
-                messagebox.showerror("Kesalahan Input", "NIM baru harus berupa angka.")
+                self._notify(messagebox.showerror, "Kesalahan Input", "NIM baru harus berupa angka.")
                 return False
-            check_nim_conflict_query = "SELECT 1 FROM Penghuni WHERE nim = %s"
-            self.cursor.execute(check_nim_conflict_query, (nim_baru,))
-            if self.cursor.fetchone():
-                messagebox.showerror("Kesalahan", f"NIM baru '{nim_baru}' sudah digunakan oleh penghuni lain.")
+            if self._execute_prepared('nim_exists', (nim_baru,), fetch_one=True):
+                self._notify(messagebox.showerror, "Kesalahan", f"NIM baru '{nim_baru}' sudah digunakan oleh penghuni lain.")
                 return False
             updates.append("nim = %s")
             params.append(nim_baru)
@@ -323,72 +1002,190 @@ class DatabaseService:
                 fakultas_id_to_update = self.get_fakultas_id_by_name(nama_fakultas_baru)
                 if fakultas_id_to_update is None: 
                     try: 
-                        self.cursor.execute("INSERT INTO Fakultas (nama_fakultas) VALUES (%s)", (nama_fakultas_baru,))
-                        fakultas_id_to_update = self.cursor.lastrowid 
+                        with self._cursor() as (conn, cursor):
+                            cursor.execute("INSERT INTO Fakultas (nama_fakultas) VALUES (%s)", (nama_fakultas_baru,))
+                            fakultas_id_to_update = cursor.lastrowid 
+                            if fakultas_id_to_update: 
+                                conn.commit() 
                         if fakultas_id_to_update: 
-                            self.conn.commit() 
+                            self._ref_cache.invalidate('fakultas')
                             print(f"Fakultas baru '{nama_fakultas_baru}' ditambahkan dengan ID: {fakultas_id_to_update}")
                         else: 
-                            messagebox.showerror("Kesalahan", f"Gagal menambahkan fakultas baru '{nama_fakultas_baru}'.")
+                            self._notify(messagebox.showerror, "Kesalahan", f"Gagal menambahkan fakultas baru '{nama_fakultas_baru}'.")
                             return False
                     except mysql.connector.Error as e_fak:
-                        messagebox.showerror("Kesalahan Database", f"Gagal menambahkan fakultas baru: {e_fak}")
+                        self._notify(messagebox.showerror, "Kesalahan Database", f"Gagal menambahkan fakultas baru: {e_fak}")
                         return False
                 updates.append("fakultas_id = %s")
                 params.append(fakultas_id_to_update)
         
         if not updates:
-            messagebox.showinfo("Info", "Tidak ada data yang diubah (nilai baru sama dengan nilai lama atau tidak ada input perubahan).")
+            self._notify(messagebox.showinfo, "Info", "Tidak ada data yang diubah (nilai baru sama dengan nilai lama atau tidak ada input perubahan).")
             return True 
 
         params_for_update = list(params) 
         params_for_update.append(nim_original)
         query = f"UPDATE Penghuni SET {', '.join(updates)} WHERE nim = %s"
 
-        success = self._execute_query(query, tuple(params_for_update), is_ddl_or_commit_managed_elsewhere=False)
+        rowcount = self._execute_query(query, tuple(params_for_update), is_ddl_or_commit_managed_elsewhere=False, return_rowcount=True)
         
-        if success:
-            if self.cursor.rowcount > 0:
-                messagebox.showinfo("Sukses", "Data penghuni berhasil diubah.")
+        if rowcount is not False:
+            if rowcount > 0:
+                self._tandai_data_berubah()
+                self._notify(messagebox.showinfo, "Sukses", "Data penghuni berhasil diubah.")
                 return True
             else:
-                messagebox.showwarning("Perhatian", "Tidak ada perubahan aktual pada data (data baru mungkin sama dengan data lama).")
+                self._notify(messagebox.showwarning, "Perhatian", "Tidak ada perubahan aktual pada data (data baru mungkin sama dengan data lama).")
                 return False # Tetap dianggap berhasil karena operasi valid
         else:
             return False
 
-    def get_audit_log_penghuni(self, limit=100): 
-        """Mengambil data log aktivitas penghuni dengan batasan jumlah."""
-        query = """
-            SELECT 
-                log_id, 
-                DATE_FORMAT(waktu_aksi, '%Y-%m-%d %H:%i:%S') AS waktu_aksi_formatted, 
-                aksi, 
-                nim, 
-                IFNULL(nama_penghuni_baru, nama_penghuni_lama) AS nama_terkait,
-                IF(aksi = 'INSERT', 
-                   CONCAT('Ke: ', IFNULL(nomor_kamar_baru, 'N/A'), ' (', IFNULL(nama_asrama_baru, 'N/A'), ') - Fak: ', IFNULL(fakultas_baru, 'N/A')),
-                   IF(aksi = 'DELETE',
-                      CONCAT('Dari: ', IFNULL(nomor_kamar_lama, 'N/A'), ' (', IFNULL(nama_asrama_lama, 'N/A'), ') - Fak: ', IFNULL(fakultas_lama, 'N/A')),
-                      CONCAT('Dari: ', IFNULL(nomor_kamar_lama, 'N/A'), ' (', IFNULL(nama_asrama_lama, 'N/A'), ') Fak: ', IFNULL(fakultas_lama, 'N/A'),
-                             ' Ke: ', IFNULL(nomor_kamar_baru, 'N/A'), ' (', IFNULL(nama_asrama_baru, 'N/A'), ') Fak: ', IFNULL(fakultas_baru, 'N/A'))
-                   )
-                ) AS detail_perubahan,
-                keterangan_tambahan
+    def get_audit_log_penghuni(self, limit=100, include_archive=False): 
+        """
+        Mengambil data log aktivitas penghuni dengan batasan jumlah (termasuk arsip jika diminta).
+        Baris berisi kolom mentah AUDIT_LOG_COLUMNS; gunakan auditExport.format_log untuk teks tampilan.
+        """
+        query = f"""
+            SELECT {AUDIT_LOG_COLUMNS}
             FROM AuditLogAktivitasPenghuni 
-            ORDER BY waktu_aksi DESC 
+            ORDER BY waktu_aksi DESC, log_id DESC 
             LIMIT %s
         """ 
-        return self._execute_query(query, (limit,), fetch_all=True) or []
-    
+        params = (limit,)
+        if include_archive:
+            query = f"""
+                SELECT * FROM (
+                    ({query})
+                    UNION ALL
+                    (SELECT {AUDIT_LOG_COLUMNS} FROM AuditLogAktivitasPenghuniArsip ORDER BY waktu_aksi DESC, log_id DESC LIMIT %s)
+                ) AS gabungan
+                ORDER BY waktu_aksi DESC, log_id DESC
+                LIMIT %s
+            """
+            params = (limit, limit, limit)
+        return self._fetch_records(AuditEntry, query, params) or []
+
+    def get_audit_log_page(self, before_log_id=None, limit=50, filters=None, include_archive=False, after_log_id=None, lempar_galat=False):
+        """
+        Mengambil satu halaman log aktivitas dengan keyset pagination (mundur berdasarkan log_id).
+        `before_log_id` adalah log_id terakhir dari halaman sebelumnya (None untuk halaman terbaru).
+        `after_log_id` mengambil halaman ke arah sebaliknya: `limit` log tertua yang lebih baru dari log_id tersebut.
+        Hasil selalu diurutkan log_id menurun.
+        `filters` opsional: {'nim': ..., 'aksi': ..., 'dari': datetime, 'sampai': datetime}.
+        Latensi konstan berapa pun posisinya karena memakai PK / indeks (nim, log_id), bukan OFFSET.
+        Dengan `lempar_galat=True` kegagalan dilempar alih-alih ditampilkan dan dikembalikan sebagai halaman kosong.
+        """
+        filters = filters or {}
+        kondisi = []
+        params = []
+        if before_log_id is not None:
+            kondisi.append("log_id < %s")
+            params.append(before_log_id)
+        if after_log_id is not None:
+            kondisi.append("log_id > %s")
+            params.append(after_log_id)
+        if filters.get('nim'):
+            kondisi.append("nim = %s")
+            params.append(filters['nim'])
+        if filters.get('aksi'):
+            kondisi.append("aksi = %s")
+            params.append(filters['aksi'])
+        if filters.get('dari'):
+            kondisi.append("waktu_aksi >= %s")
+            params.append(filters['dari'])
+        if filters.get('sampai'):
+            kondisi.append("waktu_aksi < %s")
+            params.append(filters['sampai'])
+        where_sql = f"WHERE {' AND '.join(kondisi)}" if kondisi else ""
+        arah = "ASC" if after_log_id is not None else "DESC"
+        params.append(limit)
+        query = f"""
+            SELECT {AUDIT_LOG_COLUMNS}
+            FROM AuditLogAktivitasPenghuni
+            {where_sql}
+            ORDER BY log_id {arah}
+            LIMIT %s
+        """
+        if include_archive:
+            query = f"""
+                SELECT * FROM (
+                    ({query})
+                    UNION ALL
+                    (SELECT {AUDIT_LOG_COLUMNS} FROM AuditLogAktivitasPenghuniArsip {where_sql} ORDER BY log_id {arah} LIMIT %s)
+                ) AS gabungan
+                ORDER BY log_id {arah}
+                LIMIT %s
+            """
+            params = params + params + [limit]
+        rows = self._fetch_records(AuditEntry, query, tuple(params), lempar_galat=lempar_galat) or []
+        if after_log_id is not None:
+            rows.reverse()
+        return rows
+
+    def arsipkan_audit_log(self, cutoff, chunk_size=500, jeda_detik=0.05):
+        """
+        Memindahkan log aktivitas yang lebih lama dari `cutoff` (datetime) ke AuditLogAktivitasPenghuniArsip
+        dalam chunk kecil yang masing-masing di-commit sendiri, agar kunci baris tidak lama menahan
+        trigger yang sedang menulis log baru. Mengembalikan jumlah baris yang diarsipkan.
+        """
+        if not self.is_connected(): return 0
+        total = 0
+        while True:
+            try:
+                with self._cursor(dictionary=False) as (conn, cursor):
+                    cursor.execute("SELECT log_id FROM AuditLogAktivitasPenghuni WHERE waktu_aksi < %s "
+                                   "ORDER BY waktu_aksi, log_id LIMIT %s", (cutoff, chunk_size))
+                    log_ids = [row[0] for row in cursor.fetchall()]
+                    if not log_ids:
+                        break
+                    placeholders = ", ".join(["%s"] * len(log_ids))
+                    # INSERT biasa (bukan IGNORE): log_id yang sudah ada di arsip menggagalkan chunk ini dan
+                    # transaksinya di-rollback, sehingga baris aktif tidak pernah dihapus tanpa salinan.
+                    cursor.execute(f"INSERT INTO AuditLogAktivitasPenghuniArsip "
+                                   f"SELECT * FROM AuditLogAktivitasPenghuni WHERE log_id IN ({placeholders})", log_ids)
+                    if cursor.rowcount != len(log_ids):
+                        conn.rollback()
+                        print(f"Pengarsipan dihentikan: {cursor.rowcount} dari {len(log_ids)} log tersalin ke arsip.")
+                        break
+                    cursor.execute(f"DELETE FROM AuditLogAktivitasPenghuni WHERE log_id IN ({placeholders})", log_ids)
+                    conn.commit()
+            except mysql.connector.Error as err:
+                print(f"Kesalahan pengarsipan log aktivitas setelah {total} baris: {err}")
+                break
+            total += len(log_ids)
+            if jeda_detik: time.sleep(jeda_detik) # Memberi ruang bagi transaksi lain di antara chunk
+        print(f"Pengarsipan log aktivitas selesai: {total} baris dipindahkan ke arsip.")
+        return total
+
+    def iter_audit_log_batches(self, after_log_id=0, batch_size=1000, sertakan_arsip=False):
+        """
+        Membaca log aktivitas mentah secara streaming dengan cursor unbuffered (server-side),
+        menghasilkan (yield) batch berukuran tetap berupa (nama_kolom, daftar_tuple) urut log_id naik.
+        Memori tetap konstan berapa pun jumlah baris di tabel.
+        Dengan `sertakan_arsip`, AuditLogAktivitasPenghuniArsip dibaca lebih dahulu lalu tabel aktif; urutan log_id
+        tetap naik karena arsipkan_audit_log hanya memindahkan log yang lebih lama dari log di tabel aktif.
+        """
+        tabel = ("AuditLogAktivitasPenghuniArsip", "AuditLogAktivitasPenghuni") if sertakan_arsip else ("AuditLogAktivitasPenghuni",)
+        for nama_tabel in tabel:
+            query = f"SELECT {AUDIT_LOG_RAW_COLUMNS} FROM {nama_tabel} WHERE log_id > %s ORDER BY log_id ASC"
+            with self._cursor(dictionary=False, buffered=False) as (conn, cursor):
+                cursor.execute(query, (after_log_id,))
+                kolom = cursor.column_names
+                while True:
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    yield kolom, batch
+
     def delete_penghuni(self, nim):
         """Menghapus data penghuni (Trigger akan mencatat log)."""
-        success = self._execute_query("DELETE FROM Penghuni WHERE nim = %s", (nim,), is_ddl_or_commit_managed_elsewhere=False)
-        if success and self.cursor.rowcount > 0:
-            messagebox.showinfo("Sukses", f"Data penghuni dengan NIM {nim} berhasil dihapus.")
+        rowcount = self._execute_query("DELETE FROM Penghuni WHERE nim = %s", (nim,), is_ddl_or_commit_managed_elsewhere=False, return_rowcount=True)
+        if rowcount is not False and rowcount > 0:
+            self._tandai_okupansi_berubah()
+            self._notify(messagebox.showinfo, "Sukses", f"Data penghuni dengan NIM {nim} berhasil dihapus.")
             return True
-        elif success and self.cursor.rowcount == 0:
-            messagebox.showwarning("Gagal", f"Penghuni dengan NIM {nim} tidak ditemukan.")
+        elif rowcount is not False and rowcount == 0:
+            self._notify(messagebox.showwarning, "Gagal", f"Penghuni dengan NIM {nim} tidak ditemukan.")
             return False
         return False
 
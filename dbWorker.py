@@ -0,0 +1,84 @@
+import queue
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import messagebox
+
+
+class DbWorker:
+    """
+    Menjalankan pemanggilan DatabaseService di thread pool terpisah agar loop utama Tk tidak membeku.
+    Hasil (atau exception) dikirim kembali ke thread Tk melalui polling `root.after`,
+    sehingga callback selalu berjalan di thread UI dan aman menyentuh widget.
+    """
+    def __init__(self, root, max_workers=2, poll_ms=20):
+        self._root = root
+        self._poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-worker")
+        self._antrian = queue.SimpleQueue()
+        self._jumlah_tertunda = 0
+        self._polling = False
+
+    def submit(self, fungsi, *args, on_success=None, on_error=None, is_current=None, **kwargs):
+        """
+        Menjadwalkan `fungsi(*args, **kwargs)` di thread worker dan mengembalikan Future-nya.
+        `on_success(hasil)` / `on_error(exc)` dipanggil di thread Tk. Jika `is_current()` bernilai False
+        saat hasil tiba (misalnya layar sudah ditinggalkan), hasil tersebut dibuang.
+        Harus dipanggil dari thread Tk.
+        """
+        future = self._executor.submit(fungsi, *args, **kwargs)
+        self._jumlah_tertunda += 1
+        future.add_done_callback(lambda f: self._antrian.put(("hasil", f, on_success, on_error, is_current)))
+        self._ensure_polling()
+        return future
+
+    def call_in_ui(self, fungsi, *args):
+        """Meminta `fungsi(*args)` dijalankan di thread Tk (dipakai DatabaseService untuk messagebox dari worker)."""
+        self._antrian.put(("ui", fungsi, args, None, None))
+
+    def _ensure_polling(self):
+        if not self._polling:
+            self._polling = True
+            self._root.after(self._poll_ms, self._poll)
+
+    def _poll(self):
+        try:
+            while True:
+                try:
+                    jenis, a, b, on_error, is_current = self._antrian.get_nowait()
+                except queue.Empty:
+                    break
+                if jenis == "ui":
+                    self._jalankan_callback(a, *b)
+                    continue
+                future, on_success = a, b
+                self._jumlah_tertunda -= 1
+                if future.cancelled() or (is_current is not None and not self._jalankan_callback(is_current)):
+                    continue # Hasil basi: layar yang meminta sudah tidak aktif
+                exc = future.exception()
+                if exc is not None:
+                    if on_error: self._jalankan_callback(on_error, exc)
+                    else:
+                        print(f"Kesalahan pada DB worker: {exc!r}")
+                        self._jalankan_callback(messagebox.showerror, "Kesalahan Database", f"Operasi database gagal: {exc}")
+                elif on_success:
+                    self._jalankan_callback(on_success, future.result())
+        finally:
+            # Selalu dijadwalkan ulang agar satu callback yang gagal tidak menghentikan pengiriman hasil berikutnya.
+            if self._jumlah_tertunda > 0 or not self._antrian.empty():
+                self._root.after(self._poll_ms, self._poll)
+            else:
+                self._polling = False
+
+    @staticmethod
+    def _jalankan_callback(fungsi, *args):
+        """Menjalankan callback di thread Tk; exception dicatat agar tidak memutus loop polling."""
+        try:
+            return fungsi(*args)
+        except Exception as e:
+            print(f"Kesalahan pada callback DB worker {getattr(fungsi, '__qualname__', fungsi)!r}: {e!r}")
+            traceback.print_exc()
+            return None
+
+    def shutdown(self):
+        """Menghentikan worker; pekerjaan yang belum dimulai dibatalkan."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
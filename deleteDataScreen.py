@@ -1,6 +1,6 @@
 from baseScreen import BaseScreen
-from tombol import tbl
 from tkinter import ttk, messagebox, StringVar
+from typeAheadCombobox import TypeAheadCombobox
 
 
 class DeleteDataScreen(BaseScreen):
@@ -13,11 +13,18 @@ class DeleteDataScreen(BaseScreen):
         self.selected_mahasiswa_nim_to_delete = None
     def setup_ui(self):
         self.create_canvas_text(560, 50, text=f"Hapus Data Kamar {self.kamar_id} Asrama {self.asrama_nama}", fill="#F4FEFF", font=("Cooper Black", 20, "bold"))
-        opsi_display_db, _ = self.db_service.get_penghuni_in_kamar(self.kamar_id, self.asrama_id)
         self.create_canvas_text(520, 290, text="Pilih Mahasiswa (NIM - Nama) untuk Dihapus", fill="#F4FEFF", font=("Arial", 12, "bold"))
-        mahasiswa_dropdown = self.add_widget(ttk.Combobox(self.canvas, textvariable=self.plh_mahasiswa_var,font=("Arial",15),state="readonly", values=opsi_display_db,width=34))
+        self.mahasiswa_dropdown = mahasiswa_dropdown = self.add_widget(TypeAheadCombobox(self.canvas, textvariable=self.plh_mahasiswa_var,font=("Arial",15),width=34))
         mahasiswa_dropdown.place(x=350, y=310)
         mahasiswa_dropdown.bind("<<ComboboxSelected>>", self._on_mahasiswa_selected)
+        self.plh_mahasiswa_var.set("Memuat data penghuni...")
+        self.tbl(300, 430, 200, 70, 20, 20, 90, 180, 270, 360, "red", "Hapus", self._delete_data_action)
+        self.tbl(600, 430, 200, 70, 20, 20, 90, 180, 270, 360,"#F47B07","Batal", lambda: self.screen_manager.show_kamar_detail(self.kamar_id))
+        self.run_db(self.db_service.get_penghuni_in_kamar, self.kamar_id, self.asrama_id, on_success=self._tampilkan_penghuni)
+
+    def _tampilkan_penghuni(self, hasil):
+        opsi_display_db, _ = hasil
+        self.mahasiswa_dropdown.set_options(opsi_display_db)
         if opsi_display_db and not opsi_display_db[0].startswith("Info:") and not opsi_display_db[0].startswith("Kesalahan:"):
             self.plh_mahasiswa_var.set(opsi_display_db[0])
             self._on_mahasiswa_selected()
@@ -25,8 +32,6 @@ class DeleteDataScreen(BaseScreen):
              self.plh_mahasiswa_var.set(opsi_display_db[0])
         else:
             self.plh_mahasiswa_var.set("Tidak ada data penghuni.")
-        tbl(self.canvas, 300, 430, 200, 70, 20, 20, 90, 180, 270, 360, "red", "Hapus", self._delete_data_action)
-        tbl(self.canvas, 600, 430, 200, 70, 20, 20, 90, 180, 270, 360,"#F47B07","Batal", lambda: self.screen_manager.show_kamar_detail(self.kamar_id))
 
     def _get_nim_from_selection(self, selection_string):
         if " - " in selection_string: return selection_string.split(" - ")[0]
@@ -35,10 +40,12 @@ class DeleteDataScreen(BaseScreen):
         selected_display_string = self.plh_mahasiswa_var.get()
         self.selected_mahasiswa_nim_to_delete = self._get_nim_from_selection(selected_display_string)
     def _delete_data_action(self):
+        self._on_mahasiswa_selected() # Isi combobox bisa diketik langsung tanpa memicu <<ComboboxSelected>>
+        if not self.mahasiswa_dropdown.is_valid_option(): self.selected_mahasiswa_nim_to_delete = None
         if not self.selected_mahasiswa_nim_to_delete:
             messagebox.showwarning("Peringatan", "Pilih mahasiswa yang akan dihapus.")
             return
         konfirmasi = messagebox.askyesno("Konfirmasi Hapus", f"Anda yakin ingin menghapus penghuni dengan NIM {self.selected_mahasiswa_nim_to_delete}?")
         if konfirmasi:
-            if self.db_service.delete_penghuni(self.selected_mahasiswa_nim_to_delete):
-                self.screen_manager.show_kamar_detail(self.kamar_id)
\ No newline at end of file
+            self.run_db(self.db_service.delete_penghuni, self.selected_mahasiswa_nim_to_delete,
+                        on_success=lambda berhasil: berhasil and self.screen_manager.show_kamar_detail(self.kamar_id))
\ No newline at end of file
@@ -1,7 +1,8 @@
+import os
 from baseScreen import BaseScreen
-from tombol import tbl
 from tkinter import *
-from tkinter import messagebox,ttk
+from tkinter import messagebox,ttk,filedialog
+from bulkImport import import_penghuni_csv
 class InsertDataScreen(BaseScreen):
     def __init__(self, screen_manager, db_service, kamar_id):
         super().__init__(screen_manager, db_service)
@@ -24,9 +25,26 @@ class InsertDataScreen(BaseScreen):
         self.create_canvas_text(385, 340, text="Fakultas", fill="#F4FEFF", font=("Arial", 12, "bold"))
         dropdown = self.add_widget(ttk.Combobox(self.canvas, textvariable=self.fakultas_pilihan, values=fakultas_list,width=29, font=("Arial", 18), state="readonly"))
         dropdown.place(x=350, y=360)
-        tbl(self.canvas, 300, 430, 200, 70, 20, 20, 90, 180, 270, 360, "#F47B07", "Simpan", self._save_data)
-        tbl(self.canvas, 600, 430, 200, 70, 20, 20, 90, 180, 270, 360, "red", "Batal",
+        self.tbl(300, 430, 200, 70, 20, 20, 90, 180, 270, 360, "#F47B07", "Simpan", self._save_data)
+        self.tbl(600, 430, 200, 70, 20, 20, 90, 180, 270, 360, "red", "Batal",
             lambda: self.screen_manager.show_kamar_detail(self.kamar_id))
+        self.tbl(450, 530, 200, 50, 10, 10, 90, 180, 270, 360, "#4682B4", "Impor CSV", self._import_csv)
+        self.run_db(self.db_service.cari_kamar_kosong, self.asrama_id, self.kamar_id, 5, on_success=self._tampilkan_saran_kamar)
+
+    def _tampilkan_saran_kamar(self, saran):
+        kamar_ini = next((k for k in saran if k['nomor_kamar'] == self.kamar_id), None)
+        if kamar_ini:
+            self.create_canvas_text(560, 120, text=f"Kamar ini masih memiliki {kamar_ini['sisa']} tempat kosong.", fill="#F4FEFF", font=("Arial", 12, "bold"))
+            return
+        if not saran:
+            self.create_canvas_text(560, 120, text=f"Kamar ini penuh dan tidak ada kamar kosong di Asrama {self.asrama_nama}.", fill="#F4FEFF", font=("Arial", 12, "bold"))
+            return
+        self.create_canvas_text(560, 110, text="Kamar ini penuh. Kamar dengan tempat kosong terdekat:", fill="#F4FEFF", font=("Arial", 12, "bold"))
+        x = 560 - len(saran[:4]) * 110 / 2
+        for kamar in saran[:4]:
+            self.tbl(x, 125, 100, 35, 10, 10, 90, 180, 270, 360, "#2E8B57", f"{kamar['nomor_kamar']} (sisa {kamar['sisa']})",
+                lambda nomor=kamar['nomor_kamar']: self.screen_manager.show_insert_data_form(nomor))
+            x += 110
 
     def _save_data(self):
         nim = self.nim_entry.get()
@@ -35,5 +53,24 @@ class InsertDataScreen(BaseScreen):
         if not nim or not nama:
             messagebox.showwarning("Input Tidak Lengkap", "NIM dan Nama tidak boleh kosong.")
             return
-        if self.db_service.add_penghuni(nim, nama, fakultas, self.kamar_id, self.asrama_id): 
-            self.screen_manager.show_kamar_detail(self.kamar_id) 
+        self.run_db(self.db_service.add_penghuni, nim, nama, fakultas, self.kamar_id, self.asrama_id,
+                    on_success=lambda berhasil: berhasil and self.screen_manager.show_kamar_detail(self.kamar_id))
+
+    def _import_csv(self):
+        csv_path = filedialog.askopenfilename(title="Pilih File CSV Penghuni", filetypes=[("CSV", "*.csv")])
+        if not csv_path: return
+        report_path = f"{os.path.splitext(csv_path)[0]}_laporan.csv"
+        self.create_canvas_text(550, 600, text="Mengimpor data, mohon tunggu...", fill="#F4FEFF", font=("Arial", 12, "bold"))
+        self.run_db(import_penghuni_csv, self.db_service, csv_path, report_path,
+                    on_success=lambda ringkasan: self._tampilkan_ringkasan_impor(ringkasan, report_path),
+                    on_error=lambda e: messagebox.showerror("Impor Gagal", f"Impor CSV gagal: {e}"))
+
+    def _tampilkan_ringkasan_impor(self, ringkasan, report_path):
+        messagebox.showinfo("Impor Selesai",
+                            f"Berhasil ditambahkan: {ringkasan['inserted']}\n"
+                            f"Kamar penuh: {ringkasan['room_full']}\n"
+                            f"NIM duplikat: {ringkasan['duplicate_nim']}\n"
+                            f"Tidak valid: {ringkasan['invalid']}\n"
+                            f"Gagal: {ringkasan['error']}\n\n"
+                            f"Laporan per baris: {report_path}")
+        self.screen_manager.show_kamar_detail(self.kamar_id)
@@ -1,10 +1,12 @@
 from baseScreen import BaseScreen
-from tombol import tbl
 from tkinter import ttk
 import tkinter as tk
 
 
 class KamarDetailScreen(BaseScreen):
+    dapat_disimpan = True
+    pakai_konteks_asrama = True
+
     def __init__(self, screen_manager, db_service, kamar_id):
         super().__init__(screen_manager, db_service)
         self.asrama_id = self.screen_manager.current_asrama_id_context
@@ -22,9 +24,7 @@ class KamarDetailScreen(BaseScreen):
         self.create_canvas_text(self.app_instance.appwidth / 2, 80, text=f"Asrama {self.asrama_nama} - Kamar {self.kamar_id}", fill="#F4F0FF", font=("Cooper Black", 22, "bold"))
         info_text_x = self.app_instance.appwidth / 2
         info_text_y = 120
-        jml_penghuni = self.db_service.get_jumlah_penghuni(self.kamar_id, self.asrama_id)
-        kapasitas = self.db_service.get_kapasitas_kamar(self.kamar_id, self.asrama_id)
-        self.create_canvas_text(info_text_x, info_text_y, text=f"Data Penghuni ({jml_penghuni}/{kapasitas})", fill="#F4F0FF", font=("Cooper Black", 18, "bold"))
+        self.info_text = self.create_canvas_text(info_text_x, info_text_y, text="Data Penghuni (memuat...)", fill="#F4F0FF", font=("Cooper Black", 18, "bold"))
 
         table_padding_horizontal = 50
         table_padding_top = 20
@@ -50,32 +50,43 @@ class KamarDetailScreen(BaseScreen):
         self.treeview_scrollbar = ttk.Scrollbar(self.canvas, orient="vertical", command=self.penghuni_treeview.yview)
         self.penghuni_treeview.configure(yscrollcommand=self.treeview_scrollbar.set)
 
-        _, daftar_penghuni = self.db_service.get_penghuni_in_kamar(self.kamar_id, self.asrama_id)
-        for item in self.penghuni_treeview.get_children(): self.penghuni_treeview.delete(item)
-        if daftar_penghuni and not (isinstance(daftar_penghuni[0], str) and daftar_penghuni[0].startswith("Info:")):
-            for i, penghuni in enumerate(daftar_penghuni):
-                fakultas_str = penghuni['fakultas'] if penghuni['fakultas'] else "N/A"
-                self.penghuni_treeview.insert("", tk.END, values=(i+1, penghuni['nim'], penghuni['nama_penghuni'], fakultas_str))
-        else:
-            if not self.penghuni_treeview.get_children(): self.penghuni_treeview.insert("", tk.END, values=("", "Belum ada penghuni.", "", ""))
+        self.penghuni_treeview.insert("", tk.END, values=("", "Memuat data...", "", ""))
 
         self.add_widget(self.penghuni_treeview)
         self.add_widget(self.treeview_scrollbar)
-        self.canvas.create_window(table_x, table_y, anchor=tk.NW, window=self.penghuni_treeview, width=treeview_actual_width, height=treeview_display_height)
-        self.canvas.create_window(table_x + treeview_actual_width, table_y, anchor=tk.NW, window=self.treeview_scrollbar, height=treeview_display_height)
+        self.create_canvas_window(table_x, table_y, anchor=tk.NW, window=self.penghuni_treeview, width=treeview_actual_width, height=treeview_display_height)
+        self.create_canvas_window(table_x + treeview_actual_width, table_y, anchor=tk.NW, window=self.treeview_scrollbar, height=treeview_display_height)
 
         y_buttons = 15
-        tbl(self.canvas, 50, y_buttons, 150, 50, 10, 10, 90, 180, 270, 360, "red", "Kembali", lambda: self.screen_manager.show_kamar_list(self.asrama_id, self.asrama_nama))
-        tbl(self.canvas,293, y_buttons, 150, 50, 10, 10, 90, 180, 270, 360, "#F47B07", "Tambah Data", lambda: self.screen_manager.show_insert_data_form(self.kamar_id))
-        tbl(self.canvas,600, y_buttons, 150, 50, 10, 10, 90, 180, 270, 360, "#F47B07", "Ubah Data", lambda: self.screen_manager.show_update_data_form(self.kamar_id))
-        tbl(self.canvas,880, y_buttons, 150, 50, 10, 10, 90, 180, 270, 360, "#F47B07", "Hapus Data", lambda: self.screen_manager.show_delete_data_form(self.kamar_id))
+        self.tbl(50, y_buttons, 150, 50, 10, 10, 90, 180, 270, 360, "red", "Kembali", lambda: self.screen_manager.show_kamar_list(self.asrama_id, self.asrama_nama))
+        self.tbl(293, y_buttons, 150, 50, 10, 10, 90, 180, 270, 360, "#F47B07", "Tambah Data", lambda: self.screen_manager.show_insert_data_form(self.kamar_id))
+        self.tbl(600, y_buttons, 150, 50, 10, 10, 90, 180, 270, 360, "#F47B07", "Ubah Data", lambda: self.screen_manager.show_update_data_form(self.kamar_id))
+        self.tbl(880, y_buttons, 150, 50, 10, 10, 90, 180, 270, 360, "#F47B07", "Hapus Data", lambda: self.screen_manager.show_delete_data_form(self.kamar_id))
         
         y_pindah_button = table_y + treeview_display_height + 25 
         lebar_tombol_pindah = 200
         x_tombol_pindah = (self.app_instance.appwidth / 2) - (lebar_tombol_pindah / 2) 
-        tbl(self.canvas, x_tombol_pindah , y_pindah_button, lebar_tombol_pindah, 50, 10,10, 90, 180, 270, 360, "blue", "Pindah Kamar", 
+        self.tbl(x_tombol_pindah , y_pindah_button, lebar_tombol_pindah, 50, 10,10, 90, 180, 270, 360, "blue", "Pindah Kamar", 
             lambda: self.screen_manager.show_pindah_kamar_form(self.kamar_id))
 
+        self.refresh_data()
+
+    def refresh_data(self):
+        self.run_db(self.db_service.get_room_snapshot, self.kamar_id, self.asrama_id, on_success=self._tampilkan_snapshot)
+
+    def _tampilkan_snapshot(self, snapshot):
+        jml_penghuni = snapshot['jumlah_penghuni'] if snapshot else 0
+        kapasitas = snapshot['kapasitas'] if snapshot else 0
+        self.canvas.itemconfigure(self.info_text, text=f"Data Penghuni ({jml_penghuni}/{kapasitas})")
+        daftar_penghuni = snapshot['penghuni'] if snapshot else []
+        for item in self.penghuni_treeview.get_children(): self.penghuni_treeview.delete(item)
+        if daftar_penghuni:
+            for i, penghuni in enumerate(daftar_penghuni):
+                fakultas_str = penghuni['fakultas'] if penghuni['fakultas'] else "N/A"
+                self.penghuni_treeview.insert("", tk.END, values=(i+1, penghuni['nim'], penghuni['nama_penghuni'], fakultas_str))
+        else:
+            self.penghuni_treeview.insert("", tk.END, values=("", "Belum ada penghuni.", "", ""))
+
 
     def clear_screen_elements(self):
         super().clear_screen_elements()
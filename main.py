@@ -1,6 +1,16 @@
-import tkinter as tk
-from app import App
+import argparse
+from startupProfile import StartupProfiler, PROFIL_DEFAULT
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manajemen Asrama OOP - MySQL")
+    parser.add_argument("--profile-startup", nargs="?", const=PROFIL_DEFAULT, default=None, metavar="FILE",
+                        help=f"Mencatat waktu import dan waktu hingga cat pertama ke FILE (default {PROFIL_DEFAULT}).")
+    args = parser.parse_args()
+    profiler = None
+    if args.profile_startup:
+        profiler = StartupProfiler()
+        profiler.pasang() # Harus sebelum tkinter dan modul aplikasi di-import
+    import tkinter as tk
+    from app import App
     root = tk.Tk()
-    main_app = App(root)
-    root.mainloop()
\ No newline at end of file
+    main_app = App(root, profiler=profiler, profile_path=args.profile_startup)
+    root.mainloop()
@@ -1,11 +1,18 @@
 from baseScreen import BaseScreen
-from tombol import tbl
 class MainMenuScreen(BaseScreen):
+    dapat_disimpan = True
+
     def setup_ui(self):
         self.create_canvas_text(50, 300, text="MANAJEMEN\nSISTEM\nASRAMA", fill="#F47B07", font=("Cooper Black", 50, "bold"), anchor="w")
-        tbl(self.canvas, 700, 180, 300, 100, 20, 20, 90, 180, 270, 360, "#F47B07", "Masuk",
+        self.tbl(700, 100, 300, 70, 20, 20, 90, 180, 270, 360, "#F47B07", "Masuk",
             self.screen_manager.show_asrama_selection)
-        tbl(self.canvas, 700, 300, 300, 100, 20, 20, 90, 180, 270, 360, "#4682B4", "Riwayat Aktivitas",
+        self.tbl(700, 185, 300, 70, 20, 20, 90, 180, 270, 360, "#2E8B57", "Cari Penghuni",
+            self.screen_manager.show_cari_penghuni)
+        self.tbl(700, 270, 300, 70, 20, 20, 90, 180, 270, 360, "#8E44AD", "Papan Okupansi",
+            self.screen_manager.show_papan_okupansi)
+        self.tbl(700, 355, 300, 70, 20, 20, 90, 180, 270, 360, "#B9770E", "Alokasi Otomatis",
+            self.screen_manager.show_alokasi)
+        self.tbl(700, 440, 300, 70, 20, 20, 90, 180, 270, 360, "#4682B4", "Riwayat Aktivitas",
             self.screen_manager.show_riwayat_aktivitas)
-        tbl(self.canvas, 700, 420, 300, 100, 20, 20, 90, 180, 270, 360, "red", "Keluar",
+        self.tbl(700, 525, 300, 70, 20, 20, 90, 180, 270, 360, "red", "Keluar",
             self.app_instance.quit)
\ No newline at end of file
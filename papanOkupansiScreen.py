@@ -0,0 +1,149 @@
+from baseScreen import BaseScreen
+
+WARNA_KOSONG = "#2E8B57"
+WARNA_TERISI_SEBAGIAN = "#E0A100"
+WARNA_PENUH = "#C0392B"
+
+
+def warna_okupansi(jumlah_penghuni, kapasitas):
+    """Warna sel kamar: hijau jika kosong, kuning jika terisi sebagian, merah jika penuh."""
+    if jumlah_penghuni >= kapasitas:
+        return WARNA_PENUH
+    if jumlah_penghuni > 0:
+        return WARNA_TERISI_SEBAGIAN
+    return WARNA_KOSONG
+
+
+class PapanOkupansiScreen(BaseScreen):
+    """
+    Papan okupansi seluruh kamar di semua asrama untuk monitor meja depan.
+    Grid digambar sekali dari satu kueri agregat; setelah itu layar mem-polling log aktivitas
+    berdasarkan watermark log_id dan hanya menggambar ulang sel kamar yang jumlah penghuninya berubah.
+    """
+    POLL_MS = 5000
+    RESYNC_SETIAP = 12 # Setiap N polling, seluruh okupansi dibandingkan ulang untuk menangkap log yang ter-commit terlambat
+    AREA_X, AREA_Y = 40, 110
+    LEBAR_LABEL = 120
+    dapat_disimpan = True
+
+    def __init__(self, screen_manager, db_service):
+        super().__init__(screen_manager, db_service)
+        self.sel_kamar = {} # kamar_id_internal -> (rect_id, teks_id, nomor_kamar, jumlah_penghuni, kapasitas)
+        self.info_text_id = None
+        self._watermark = 0
+        self._jumlah_polling = 0
+        self._after_id = None
+        self._sedang_polling = False
+        self._ukuran_sel = 0
+
+    def setup_ui(self):
+        self.create_canvas_text(self.app_instance.appwidth / 2, 50, text="Papan Okupansi Kamar", fill="#F4F0FF", font=("Cooper Black", 24, "bold"))
+        self.tbl(50, 15, 150, 50, 10, 10, 90, 180, 270, 360, "red", "Kembali",
+            self.screen_manager.show_main_menu)
+        x_legenda = 700
+        for warna, teks in ((WARNA_KOSONG, "Kosong"), (WARNA_TERISI_SEBAGIAN, "Terisi"), (WARNA_PENUH, "Penuh")):
+            self.create_canvas_rectangle(x_legenda, 85, x_legenda + 14, 99, fill=warna, outline="white")
+            self.create_canvas_text(x_legenda + 20, 92, text=teks, fill="#F4FEFF", font=("Arial", 10, "bold"), anchor="w")
+            x_legenda += 90
+        self.info_text_id = self.create_canvas_text(self.app_instance.appwidth / 2, self.app_instance.appheight / 2,
+                                                    text="Memuat okupansi kamar...", fill="#F4FEFF", font=("Arial", 14, "bold"))
+        self.run_db(self.db_service.get_vacancy_board, on_success=self._gambar_papan)
+
+    def on_hide(self):
+        self._batalkan_polling()
+        self._sedang_polling = False
+
+    def on_show(self):
+        # Papan memperbarui dirinya sendiri lewat polling; langsung kejar perubahan selama tersembunyi.
+        if self.sel_kamar: self._polling()
+
+    def refresh_data(self):
+        if not self.sel_kamar: # Pemuatan awal terputus sebelum papan sempat digambar
+            self.run_db(self.db_service.get_vacancy_board, on_success=self._gambar_papan)
+
+    def _hitung_ukuran_sel(self, kamar_per_asrama):
+        """Mencari ukuran sel terbesar agar seluruh grid (dengan baris terlipat per asrama) muat di canvas."""
+        lebar_area = self.app_instance.appwidth - self.AREA_X * 2 - self.LEBAR_LABEL
+        tinggi_area = self.app_instance.appheight - self.AREA_Y - 20
+        for ukuran in range(64, 13, -2):
+            per_baris = max(1, lebar_area // (ukuran + 4))
+            jumlah_baris = sum(-(-jumlah // per_baris) for jumlah in kamar_per_asrama)
+            if jumlah_baris * (ukuran + 4) + len(kamar_per_asrama) * 6 <= tinggi_area:
+                return ukuran, per_baris
+        return 14, max(1, lebar_area // 18)
+
+    def _gambar_papan(self, hasil):
+        rows, self._watermark = hasil
+        if not rows:
+            self.canvas.itemconfig(self.info_text_id, text="Belum ada data kamar.")
+            return
+        self.canvas.itemconfig(self.info_text_id, text="")
+        per_asrama = {}
+        for row in rows:
+            per_asrama.setdefault((row['asrama_id'], row['nama_asrama']), []).append(row)
+        ukuran, per_baris = self._hitung_ukuran_sel([len(kamars) for kamars in per_asrama.values()])
+        font_sel = ("Arial", max(6, ukuran // 6), "bold")
+        y = self.AREA_Y
+        for (_, nama_asrama), kamars in per_asrama.items():
+            self.create_canvas_text(self.AREA_X, y + ukuran / 2, text=nama_asrama, fill="#F4FEFF", font=("Arial", 12, "bold"), anchor="w")
+            for i, row in enumerate(kamars):
+                x0 = self.AREA_X + self.LEBAR_LABEL + (i % per_baris) * (ukuran + 4)
+                y0 = y + (i // per_baris) * (ukuran + 4)
+                rect_id = self.create_canvas_rectangle(x0, y0, x0 + ukuran, y0 + ukuran, outline="white",
+                                                       fill=warna_okupansi(row['jumlah_penghuni'], row['kapasitas']))
+                teks_id = self.create_canvas_text(x0 + ukuran / 2, y0 + ukuran / 2, fill="white", font=font_sel,
+                                                  text=self._teks_sel(row['nomor_kamar'], row['jumlah_penghuni'], row['kapasitas'], ukuran))
+                self.sel_kamar[row['kamar_id_internal']] = (rect_id, teks_id, row['nomor_kamar'], row['jumlah_penghuni'], row['kapasitas'])
+            y += -(-len(kamars) // per_baris) * (ukuran + 4) + 6
+        self._ukuran_sel = ukuran
+        self._jadwalkan_polling()
+
+    @staticmethod
+    def _teks_sel(nomor_kamar, jumlah_penghuni, kapasitas, ukuran):
+        if ukuran < 30:
+            return f"{jumlah_penghuni}/{kapasitas}"
+        return f"{nomor_kamar}\n{jumlah_penghuni}/{kapasitas}"
+
+    def _jadwalkan_polling(self):
+        if self.is_active():
+            self._after_id = self.canvas.after(self.POLL_MS, self._polling)
+
+    def _polling(self):
+        self._after_id = None
+        if not self.is_active() or self._sedang_polling: return
+        self._sedang_polling = True
+        self._jumlah_polling += 1
+        if self._jumlah_polling % self.RESYNC_SETIAP == 0:
+            self.run_db(self.db_service.get_vacancy_board, lempar_galat=True, on_success=self._terapkan_perubahan, on_error=self._polling_gagal)
+        else:
+            self.run_db(self.db_service.get_occupancy_changes, self._watermark, lempar_galat=True,
+                        on_success=self._terapkan_perubahan, on_error=self._polling_gagal)
+
+    def _polling_gagal(self, exc):
+        # Monitor meja depan tidak boleh memunculkan dialog berulang; coba lagi pada polling berikutnya.
+        print(f"Polling papan okupansi gagal: {exc!r}")
+        self._sedang_polling = False
+        self._jadwalkan_polling()
+
+    def _terapkan_perubahan(self, hasil):
+        rows, self._watermark = hasil
+        self._sedang_polling = False
+        for row in rows:
+            sel = self.sel_kamar.get(row['kamar_id_internal'])
+            if sel is None: continue # Kamar baru baru tampil setelah layar dibuka ulang
+            rect_id, teks_id, nomor_kamar, jumlah_lama, kapasitas_lama = sel
+            if (row['jumlah_penghuni'], row['kapasitas']) == (jumlah_lama, kapasitas_lama): continue
+            self.canvas.itemconfigure(rect_id, fill=warna_okupansi(row['jumlah_penghuni'], row['kapasitas']))
+            self.canvas.itemconfigure(teks_id, text=self._teks_sel(nomor_kamar, row['jumlah_penghuni'], row['kapasitas'], self._ukuran_sel))
+            self.sel_kamar[row['kamar_id_internal']] = (rect_id, teks_id, nomor_kamar, row['jumlah_penghuni'], row['kapasitas'])
+        self._jadwalkan_polling()
+
+    def _batalkan_polling(self):
+        if self._after_id is not None:
+            self.canvas.after_cancel(self._after_id)
+            self._after_id = None
+
+    def clear_screen_elements(self):
+        self._batalkan_polling()
+        super().clear_screen_elements()
+        self.sel_kamar = {}
@@ -1,7 +1,7 @@
 from baseScreen import BaseScreen
-from tombol import tbl
 from tkinter import *
 from tkinter import messagebox,ttk
+from typeAheadCombobox import TypeAheadCombobox
 class PindahKamarScreen(BaseScreen):
     def __init__(self, screen_manager, db_service, kamar_id_asal):
         super().__init__(screen_manager, db_service)
@@ -16,6 +16,8 @@ class PindahKamarScreen(BaseScreen):
         self.penghuni_asal_options = []
         self.asrama_tujuan_options_map = {} 
         self.kamar_tujuan_options = []
+        self.saran_kamar_tujuan = []
+        self.saran_text_id = None
 
     def setup_ui(self):
         self.create_canvas_text(self.app_instance.appwidth / 2, 50,
@@ -34,64 +36,103 @@ class PindahKamarScreen(BaseScreen):
 
 
         self.create_canvas_text(x_label, y_current + 10, text="Pilih Penghuni:", fill="#F4FEFF", font=("Arial", 12, "bold"), anchor="w")
-        opsi_penghuni_asal, _ = self.db_service.get_penghuni_in_kamar(self.kamar_id_asal, self.asrama_id_asal)
-        self.penghuni_asal_options = opsi_penghuni_asal if not (opsi_penghuni_asal and opsi_penghuni_asal[0].startswith("Info:")) else ["Tidak ada penghuni"]
-        
-        penghuni_dropdown = self.add_widget(ttk.Combobox(self.canvas, textvariable=self.selected_nim_var,
-                                                        values=self.penghuni_asal_options, width=dropdown_width_chars, state="readonly", font=("Arial", 14)))
-        penghuni_dropdown.place(x=x_dropdown, y=y_current)
-        if self.penghuni_asal_options and self.penghuni_asal_options[0] != "Tidak ada penghuni":
-            self.selected_nim_var.set(self.penghuni_asal_options[0])
+        self.penghuni_dropdown = self.add_widget(TypeAheadCombobox(self.canvas, textvariable=self.selected_nim_var,
+                                                        width=dropdown_width_chars, font=("Arial", 14)))
+        self.penghuni_dropdown.place(x=x_dropdown, y=y_current)
+        self.selected_nim_var.set("Memuat data penghuni...")
         y_current += 50
 
         self.create_canvas_text(x_label, y_current + 10, text="Asrama Tujuan:", fill="#F4FEFF", font=("Arial", 12, "bold"), anchor="w")
-        all_asrama_db = self.db_service.get_all_asrama()
-        self.asrama_tujuan_options_map = {asrama['nama_asrama']: asrama['asrama_id'] for asrama in all_asrama_db}
-        asrama_display_options = list(self.asrama_tujuan_options_map.keys())
-
-        asrama_tujuan_dropdown = self.add_widget(ttk.Combobox(self.canvas, textvariable=self.selected_asrama_tujuan_var,
-                                                            values=asrama_display_options, width=dropdown_width_chars, state="readonly", font=("Arial", 14)))
-        asrama_tujuan_dropdown.place(x=x_dropdown, y=y_current)
-        asrama_tujuan_dropdown.bind("<<ComboboxSelected>>", self._on_asrama_tujuan_selected)
+        self.asrama_tujuan_dropdown = self.add_widget(ttk.Combobox(self.canvas, textvariable=self.selected_asrama_tujuan_var,
+                                                            values=[], width=dropdown_width_chars, state="readonly", font=("Arial", 14)))
+        self.asrama_tujuan_dropdown.place(x=x_dropdown, y=y_current)
+        self.asrama_tujuan_dropdown.bind("<<ComboboxSelected>>", self._on_asrama_tujuan_selected)
         y_current += 50
 
         self.create_canvas_text(x_label, y_current + 10, text="Kamar Tujuan:", fill="#F4FEFF", font=("Arial", 12, "bold"), anchor="w")
-        self.kamar_tujuan_dropdown = self.add_widget(ttk.Combobox(self.canvas, textvariable=self.selected_kamar_tujuan_var,
-                                                                values=[], width=dropdown_width_chars, state="disabled", font=("Arial", 14)))
+        self.kamar_tujuan_dropdown = self.add_widget(TypeAheadCombobox(self.canvas, textvariable=self.selected_kamar_tujuan_var,
+                                                                width=dropdown_width_chars, state="disabled", font=("Arial", 14)))
         self.kamar_tujuan_dropdown.place(x=x_dropdown, y=y_current)
+        self.saran_text_id = self.create_canvas_text(x_dropdown, y_current + 50, text="", fill="#F4FEFF", font=("Arial", 11, "bold"), anchor="w")
         y_current += 100
 
         button_width = 200
         x_button_pindah = self.app_instance.appwidth / 2 - button_width - 10
         x_button_batal = self.app_instance.appwidth / 2 + 10
 
-        tbl(self.canvas, x_button_pindah, y_current, button_width, 50, 10,10,90,180,270,360, "blue", "Pindahkan", self._proses_pindah_kamar)
-        tbl(self.canvas, x_button_batal, y_current, button_width, 50, 10,10,90,180,270,360, "red", "Batal",
+        self.tbl(x_button_pindah, y_current, button_width, 50, 10,10,90,180,270,360, "blue", "Pindahkan", self._proses_pindah_kamar)
+        self.tbl(x_button_batal, y_current, button_width, 50, 10,10,90,180,270,360, "red", "Batal",
             lambda: self.screen_manager.show_kamar_detail(self.kamar_id_asal)) 
 
+        self.run_db(self.db_service.get_penghuni_in_kamar, self.kamar_id_asal, self.asrama_id_asal, on_success=self._tampilkan_penghuni_asal)
+        self.run_db(self.db_service.get_all_asrama, on_success=self._tampilkan_asrama_tujuan)
+
+    def _tampilkan_penghuni_asal(self, hasil):
+        opsi_penghuni_asal, _ = hasil
+        self.penghuni_asal_options = opsi_penghuni_asal if not (opsi_penghuni_asal and opsi_penghuni_asal[0].startswith("Info:")) else ["Tidak ada penghuni"]
+        self.penghuni_dropdown.set_options(self.penghuni_asal_options)
+        if self.penghuni_asal_options and self.penghuni_asal_options[0] != "Tidak ada penghuni":
+            self.selected_nim_var.set(self.penghuni_asal_options[0])
+        else:
+            self.selected_nim_var.set("Tidak ada penghuni")
+
+    def _tampilkan_asrama_tujuan(self, all_asrama_db):
+        self.asrama_tujuan_options_map = {asrama['nama_asrama']: asrama['asrama_id'] for asrama in all_asrama_db}
+        self.asrama_tujuan_dropdown['values'] = list(self.asrama_tujuan_options_map.keys())
+
     def _on_asrama_tujuan_selected(self, event=None):
         selected_nama_asrama = self.selected_asrama_tujuan_var.get()
         asrama_id_tujuan = self.asrama_tujuan_options_map.get(selected_nama_asrama)
         
         if asrama_id_tujuan:
-            kamars_in_asrama = self.db_service.get_all_kamar_in_asrama(asrama_id_tujuan)
-            self.kamar_tujuan_options = [k['nomor_kamar'] for k in kamars_in_asrama]
-            self.kamar_tujuan_dropdown['values'] = self.kamar_tujuan_options
-            if self.kamar_tujuan_options:
-                self.selected_kamar_tujuan_var.set(self.kamar_tujuan_options[0])
-                self.kamar_tujuan_dropdown['state'] = "readonly"
-            else:
-                self.selected_kamar_tujuan_var.set("Tidak ada kamar")
-                self.kamar_tujuan_dropdown['state'] = "disabled"
+            self.kamar_tujuan_dropdown['state'] = "disabled"
+            self.selected_kamar_tujuan_var.set("Memuat kamar...")
+            self.run_db(self.db_service.get_all_kamar_in_asrama, asrama_id_tujuan,
+                        on_success=lambda kamars, aid=asrama_id_tujuan: self._tampilkan_kamar_tujuan(aid, kamars))
+            self.saran_kamar_tujuan = []
+            self.canvas.itemconfig(self.saran_text_id, text="")
+            # Di asrama yang sama, saran diurutkan dari kamar yang paling dekat dengan kamar asal.
+            acuan = self.kamar_id_asal if asrama_id_tujuan == self.asrama_id_asal else None
+            self.run_db(self.db_service.cari_kamar_kosong, asrama_id_tujuan, acuan, 5,
+                        on_success=lambda saran, aid=asrama_id_tujuan: self._tampilkan_saran_kamar(aid, saran))
         else:
             self.kamar_tujuan_options = []
-            self.kamar_tujuan_dropdown['values'] = []
+            self.kamar_tujuan_dropdown.set_options([])
             self.selected_kamar_tujuan_var.set("")
             self.kamar_tujuan_dropdown['state'] = "disabled"
 
+    def _tampilkan_saran_kamar(self, asrama_id_tujuan, saran):
+        if self.asrama_tujuan_options_map.get(self.selected_asrama_tujuan_var.get()) != asrama_id_tujuan:
+            return
+        saran = [k for k in saran if not (asrama_id_tujuan == self.asrama_id_asal and k['nomor_kamar'] == self.kamar_id_asal)]
+        self.saran_kamar_tujuan = [k['nomor_kamar'] for k in saran]
+        if saran:
+            self.canvas.itemconfig(self.saran_text_id, text="Ada tempat kosong: " + ", ".join(f"{k['nomor_kamar']} (sisa {k['sisa']})" for k in saran))
+        else:
+            self.canvas.itemconfig(self.saran_text_id, text="Tidak ada kamar dengan tempat kosong di asrama ini.")
+        self._pilih_saran_kamar()
+
+    def _pilih_saran_kamar(self):
+        """Memilih kamar saran terdekat sebagai kamar tujuan default setelah daftar kamar dan saran sama-sama tersedia."""
+        if self.saran_kamar_tujuan and self.kamar_tujuan_dropdown.is_valid_option(str(self.saran_kamar_tujuan[0])):
+            self.selected_kamar_tujuan_var.set(self.saran_kamar_tujuan[0])
+
+    def _tampilkan_kamar_tujuan(self, asrama_id_tujuan, kamars_in_asrama):
+        if self.asrama_tujuan_options_map.get(self.selected_asrama_tujuan_var.get()) != asrama_id_tujuan:
+            return # Pengguna sudah memilih asrama lain sebelum hasil ini tiba
+        self.kamar_tujuan_options = [k['nomor_kamar'] for k in kamars_in_asrama]
+        self.kamar_tujuan_dropdown.set_options(self.kamar_tujuan_options)
+        if self.kamar_tujuan_options:
+            self.selected_kamar_tujuan_var.set(self.kamar_tujuan_options[0])
+            self.kamar_tujuan_dropdown['state'] = "normal"
+            self._pilih_saran_kamar()
+        else:
+            self.selected_kamar_tujuan_var.set("Tidak ada kamar")
+            self.kamar_tujuan_dropdown['state'] = "disabled"
+
     def _proses_pindah_kamar(self):
         nim_str_selection = self.selected_nim_var.get()
-        if not nim_str_selection or nim_str_selection == "Tidak ada penghuni":
+        if not nim_str_selection or " - " not in nim_str_selection or not self.penghuni_dropdown.is_valid_option(nim_str_selection):
             messagebox.showwarning("Peringatan", "Pilih penghuni yang akan dipindahkan.")
             return
         
@@ -102,7 +143,7 @@ class PindahKamarScreen(BaseScreen):
         
         nomor_kamar_tujuan_str = self.selected_kamar_tujuan_var.get()
 
-        if not asrama_id_tujuan or not nomor_kamar_tujuan_str or nomor_kamar_tujuan_str == "Tidak ada kamar":
+        if not asrama_id_tujuan or not nomor_kamar_tujuan_str or not self.kamar_tujuan_dropdown.is_valid_option(nomor_kamar_tujuan_str):
             messagebox.showwarning("Peringatan", "Pilih asrama dan kamar tujuan.")
             return
         
@@ -112,6 +153,5 @@ class PindahKamarScreen(BaseScreen):
             messagebox.showerror("Kesalahan", "Nomor kamar tujuan tidak valid.")
             return
 
-        success, message = self.db_service.pindah_kamar_penghuni(nim_to_move, nomor_kamar_tujuan, asrama_id_tujuan)
-        if success:
-            self.screen_manager.show_kamar_detail(self.kamar_id_asal)
\ No newline at end of file
+        self.run_db(self.db_service.pindah_kamar_penghuni, nim_to_move, nomor_kamar_tujuan, asrama_id_tujuan,
+                    on_success=lambda hasil: hasil[0] and self.screen_manager.show_kamar_detail(self.kamar_id_asal))
\ No newline at end of file
@@ -0,0 +1,96 @@
+from operator import itemgetter
+
+
+class _Record:
+    """
+    Basis record baris hasil kueri dengan __slots__: tanpa __dict__ per baris, sehingga jauh lebih hemat memori
+    dibanding dict dari cursor dictionary=True. Akses gaya dict (`row['nim']`, `row.get(...)`) tetap didukung
+    agar pemanggil lama tidak perlu diubah.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def pembuat(cls, kolom):
+        """
+        Mengembalikan fungsi tuple -> record untuk urutan kolom `kolom` (cursor.column_names).
+        Kolom yang tidak ada pada record diabaikan; field record yang tidak ada pada kueri bernilai None.
+        """
+        kolom = tuple(kolom)
+        if kolom == cls.__slots__:
+            return lambda row: cls(*row)
+        posisi = [kolom.index(nama) if nama in kolom else None for nama in cls.__slots__]
+        if None not in posisi:
+            ambil = itemgetter(*posisi)
+            return lambda row: cls(*ambil(row))
+        return lambda row: cls(*[row[i] if i is not None else None for i in posisi])
+
+    def __getitem__(self, nama):
+        try:
+            return getattr(self, nama)
+        except (AttributeError, TypeError):
+            raise KeyError(nama) from None
+
+    def get(self, nama, default=None):
+        return getattr(self, nama, default)
+
+    def as_dict(self):
+        return {nama: getattr(self, nama) for nama in self.__slots__}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, nama) == getattr(other, nama) for nama in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        isi = ", ".join(f"{nama}={getattr(self, nama)!r}" for nama in self.__slots__)
+        return f"{type(self).__name__}({isi})"
+
+
+class Penghuni(_Record):
+    """Satu penghuni beserta kamar dan asramanya (daftar penghuni kamar, hasil pencarian)."""
+    __slots__ = ("nim", "nama_penghuni", "fakultas", "nomor_kamar", "asrama_id", "nama_asrama")
+
+    def __init__(self, nim, nama_penghuni, fakultas=None, nomor_kamar=None, asrama_id=None, nama_asrama=None):
+        self.nim = nim
+        self.nama_penghuni = nama_penghuni
+        self.fakultas = fakultas
+        self.nomor_kamar = nomor_kamar
+        self.asrama_id = asrama_id
+        self.nama_asrama = nama_asrama
+
+
+class Kamar(_Record):
+    """Okupansi satu kamar (papan okupansi, indeks kamar kosong, alokasi otomatis)."""
+    __slots__ = ("kamar_id_internal", "asrama_id", "nama_asrama", "nomor_kamar", "kapasitas", "jumlah_penghuni")
+
+    def __init__(self, kamar_id_internal, asrama_id=None, nama_asrama=None, nomor_kamar=None, kapasitas=None, jumlah_penghuni=None):
+        self.kamar_id_internal = kamar_id_internal
+        self.asrama_id = asrama_id
+        self.nama_asrama = nama_asrama
+        self.nomor_kamar = nomor_kamar
+        self.kapasitas = kapasitas
+        self.jumlah_penghuni = jumlah_penghuni
+
+
+class AuditEntry(_Record):
+    """Satu baris log AuditLogAktivitasPenghuni dengan nilai mentah; teks tampilan dibentuk oleh auditExport.format_log."""
+    __slots__ = ("log_id", "waktu_aksi", "aksi", "nim", "nama_penghuni_lama", "nama_penghuni_baru", "fakultas_lama", "fakultas_baru",
+                 "nomor_kamar_lama", "nama_asrama_lama", "nomor_kamar_baru", "nama_asrama_baru", "keterangan_tambahan")
+
+    def __init__(self, log_id, waktu_aksi, aksi, nim, nama_penghuni_lama, nama_penghuni_baru, fakultas_lama, fakultas_baru,
+                 nomor_kamar_lama, nama_asrama_lama, nomor_kamar_baru, nama_asrama_baru, keterangan_tambahan):
+        self.log_id = log_id
+        self.waktu_aksi = waktu_aksi
+        self.aksi = aksi
+        self.nim = nim
+        self.nama_penghuni_lama = nama_penghuni_lama
+        self.nama_penghuni_baru = nama_penghuni_baru
+        self.fakultas_lama = fakultas_lama
+        self.fakultas_baru = fakultas_baru
+        self.nomor_kamar_lama = nomor_kamar_lama
+        self.nama_asrama_lama = nama_asrama_lama
+        self.nomor_kamar_baru = nomor_kamar_baru
+        self.nama_asrama_baru = nama_asrama_baru
+        self.keterangan_tambahan = keterangan_tambahan
@@ -0,0 +1,48 @@
+import threading
+import time
+
+
+class ReferenceCache:
+    """
+    Cache in-process untuk data referensi yang jarang berubah (Asrama, Fakultas, peta kamar).
+    Setiap bagian (section) memiliki fungsi loader sendiri dan dimuat ulang setelah TTL habis
+    atau setelah di-invalidate secara eksplisit.
+    """
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._loaders = {}
+        self._data = {}
+        self._loaded_at = {}
+        self._lock = threading.RLock()
+
+    def register(self, section, loader):
+        """Mendaftarkan loader untuk satu section. Loader mengembalikan None jika gagal memuat."""
+        self._loaders[section] = loader
+
+    def get(self, section):
+        """Mengambil data section dari memori, memuat ulang dari database jika belum ada atau kedaluwarsa."""
+        with self._lock:
+            loaded_at = self._loaded_at.get(section)
+            if loaded_at is not None and time.monotonic() - loaded_at < self.ttl:
+                return self._data[section]
+            data = self._loaders[section]()
+            if data is None:
+                # Gagal memuat: pakai data lama bila ada, tapi jangan tandai sebagai segar.
+                return self._data.get(section)
+            self._data[section] = data
+            self._loaded_at[section] = time.monotonic()
+            return data
+
+    def invalidate(self, section=None):
+        """Menandai satu section (atau semua jika None) agar dimuat ulang pada akses berikutnya."""
+        with self._lock:
+            if section is None:
+                self._loaded_at.clear()
+            else:
+                self._loaded_at.pop(section, None)
+
+    def warm(self):
+        """Memuat semua section sekaligus, dipanggil sekali saat aplikasi dimulai."""
+        for section in self._loaders:
+            self.invalidate(section)
+            self.get(section)
@@ -1,13 +1,28 @@
 from baseScreen import BaseScreen
-from tombol import tbl
-from tkinter import ttk
+from tkinter import ttk, filedialog, messagebox
 import tkinter as tk
+import os
+from auditExport import export_audit_log, read_watermark, format_log
 
 class RiwayatAktivitasScreen(BaseScreen):
+    """
+    Riwayat aktivitas dengan Treeview tervirtualisasi: widget hanya menyimpan jendela baris di sekitar posisi gulir
+    (paling banyak MAKS_BARIS). Saat gulir mendekati ujung jendela, halaman berikutnya diambil dengan keyset
+    pagination (get_audit_log_page) dan baris di ujung seberangnya dibuang, sehingga seluruh tabel log dapat
+    ditelusuri tanpa pernah dimuat utuh ke memori.
+    """
+    UKURAN_HALAMAN = 100
+    MAKS_BARIS = 300
+    AMBANG_GULIR = 0.15 # Muat halaman berikutnya jika sisa gulir ke ujung jendela kurang dari 15%
+    dapat_disimpan = True
+
     def __init__(self, screen_manager, db_service):
         super().__init__(screen_manager, db_service)
         self.log_treeview = None
         self.log_scrollbar = None
+        self._sedang_memuat = False
+        self._habis_lama = False # Jendela sudah memuat log tertua
+        self._habis_baru = True # Jendela sudah memuat log terbaru
 
     def setup_ui(self):
         style = ttk.Style()
@@ -47,37 +62,129 @@ class RiwayatAktivitasScreen(BaseScreen):
         self.log_treeview.column("keterangan", width=int(treeview_actual_width * 0.22), anchor=tk.W, stretch=tk.YES)
         
         self.log_scrollbar = ttk.Scrollbar(self.canvas, orient="vertical", command=self.log_treeview.yview)
-        self.log_treeview.configure(yscrollcommand=self.log_scrollbar.set)
+        self.log_treeview.configure(yscrollcommand=self._on_gulir)
 
-        daftar_log = self.db_service.get_audit_log_penghuni(limit=200) 
-        for item in self.log_treeview.get_children(): self.log_treeview.delete(item)
-        if daftar_log:
-            for log_entry in daftar_log:
-                self.log_treeview.insert("", tk.END, values=(
-                    log_entry['log_id'],
-                    log_entry['waktu_aksi_formatted'],
-                    log_entry['aksi'],
-                    log_entry['nim'],
-                    log_entry['nama_terkait'],
-                    log_entry['detail_perubahan'],
-                    log_entry['keterangan_tambahan']
-                ))
-        else:
-            self.log_treeview.insert("", tk.END, values=("", "Belum ada riwayat aktivitas.", "", "", "", "", ""))
+        self.log_treeview.insert("", tk.END, values=("", "Memuat riwayat...", "", "", "", "", ""))
 
         self.add_widget(self.log_treeview)
         self.add_widget(self.log_scrollbar)
         
-        self.canvas.create_window(table_x, table_y, anchor=tk.NW,
+        self.create_canvas_window(table_x, table_y, anchor=tk.NW,
                                   window=self.log_treeview,
                                   width=treeview_actual_width, height=treeview_display_height)
-        self.canvas.create_window(table_x + treeview_actual_width, table_y, anchor=tk.NW,
+        self.create_canvas_window(table_x + treeview_actual_width, table_y, anchor=tk.NW,
                                   window=self.log_scrollbar,
                                   height=treeview_display_height)
 
         y_button_kembali = self.app_instance.appheight - 50
-        tbl(self.canvas, 50, 15, 150, 50, 10, 10, 90, 180, 270, 360, "red", "Kembali",
+        self.tbl(50, 15, 150, 50, 10, 10, 90, 180, 270, 360, "red", "Kembali",
             self.screen_manager.show_main_menu)
+        self.tbl(880, 15, 150, 50, 10, 10, 90, 180, 270, 360, "#4682B4", "Ekspor Log",
+            self._export_log)
+        self.refresh_data()
+
+    def refresh_data(self):
+        self._sedang_memuat = True
+        self.run_db(self.db_service.get_audit_log_page, limit=self.UKURAN_HALAMAN, lempar_galat=True,
+                    on_success=self._tampilkan_halaman_awal, on_error=self._gagal_memuat_awal)
+
+    def _tampilkan_halaman_awal(self, daftar_log):
+        self._sedang_memuat = False
+        for item in self.log_treeview.get_children(): self.log_treeview.delete(item)
+        self._habis_lama = len(daftar_log) < self.UKURAN_HALAMAN
+        self._habis_baru = True
+        if daftar_log:
+            for log_entry in daftar_log: self._sisipkan_log(log_entry, tk.END)
+        else:
+            self.log_treeview.insert("", tk.END, values=("", "Belum ada riwayat aktivitas.", "", "", "", "", ""))
+
+    def _sisipkan_log(self, log_entry, posisi):
+        self.log_treeview.insert("", posisi, iid=str(log_entry['log_id']), values=format_log(log_entry))
+
+    def _on_gulir(self, first, last):
+        if self.log_scrollbar is None: return
+        self.log_scrollbar.set(first, last)
+        if self._sedang_memuat: return
+        if float(last) >= 1 - self.AMBANG_GULIR and not self._habis_lama:
+            self._muat_halaman(lebih_lama=True)
+        elif float(first) <= self.AMBANG_GULIR and not self._habis_baru:
+            self._muat_halaman(lebih_lama=False)
+
+    def _muat_halaman(self, lebih_lama):
+        anak = self.log_treeview.get_children()
+        if not anak: return
+        self._sedang_memuat = True
+        if lebih_lama:
+            self.run_db(self.db_service.get_audit_log_page, before_log_id=int(anak[-1]), limit=self.UKURAN_HALAMAN, lempar_galat=True,
+                        on_success=lambda daftar_log: self._tambah_halaman(daftar_log, lebih_lama=True), on_error=self._gagal_memuat)
+        else:
+            self.run_db(self.db_service.get_audit_log_page, after_log_id=int(anak[0]), limit=self.UKURAN_HALAMAN, lempar_galat=True,
+                        on_success=lambda daftar_log: self._tambah_halaman(daftar_log, lebih_lama=False), on_error=self._gagal_memuat)
+
+    def _tambah_halaman(self, daftar_log, lebih_lama):
+        self._sedang_memuat = False
+        if len(daftar_log) < self.UKURAN_HALAMAN:
+            if lebih_lama: self._habis_lama = True
+            else: self._habis_baru = True
+        if not daftar_log: return
+        jangkar = self._baris_teratas()
+        if lebih_lama:
+            for log_entry in daftar_log: self._sisipkan_log(log_entry, tk.END)
+            anak = self.log_treeview.get_children()
+            kelebihan = len(anak) - self.MAKS_BARIS
+            if kelebihan > 0:
+                self.log_treeview.delete(*anak[:kelebihan])
+                self._habis_baru = False
+        else:
+            for posisi, log_entry in enumerate(daftar_log): self._sisipkan_log(log_entry, posisi)
+            anak = self.log_treeview.get_children()
+            kelebihan = len(anak) - self.MAKS_BARIS
+            if kelebihan > 0:
+                self.log_treeview.delete(*anak[-kelebihan:])
+                self._habis_lama = False
+        self._pulihkan_posisi(jangkar)
+
+    def _baris_teratas(self):
+        """Baris yang sedang berada di tepi atas tampilan, dipakai sebagai jangkar agar tampilan tidak melompat."""
+        anak = self.log_treeview.get_children()
+        if not anak: return None
+        return anak[min(len(anak) - 1, int(round(self.log_treeview.yview()[0] * len(anak))))]
+
+    def _pulihkan_posisi(self, jangkar):
+        if jangkar is None or not self.log_treeview.exists(jangkar): return
+        anak = self.log_treeview.get_children()
+        self.log_treeview.yview_moveto(self.log_treeview.index(jangkar) / len(anak))
+
+    def _gagal_memuat(self, exc):
+        # Tidak memunculkan dialog agar gulir tidak terus menghasilkan popup; ujung jendela tidak ditandai habis
+        # sehingga halaman yang sama dicoba lagi pada gulir berikutnya.
+        print(f"Gagal memuat riwayat aktivitas: {exc!r}")
+        self._sedang_memuat = False
+
+    def _gagal_memuat_awal(self, exc):
+        self._gagal_memuat(exc)
+        for item in self.log_treeview.get_children(): self.log_treeview.delete(item)
+        # Baris pesan tidak memiliki log_id; gulir dinonaktifkan dan halaman awal dimuat ulang saat layar ditampilkan lagi.
+        self._habis_lama = self._habis_baru = True
+        self._versi_data = None
+        self.log_treeview.insert("", tk.END, values=("", "Gagal memuat riwayat aktivitas.", "", "", "", "", ""))
+
+    def _export_log(self):
+        output_path = filedialog.asksaveasfilename(title="Ekspor Riwayat Aktivitas", defaultextension=".csv",
+                                                   filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl")], confirmoverwrite=False)
+        if not output_path: return
+        fmt = "jsonl" if output_path.lower().endswith(".jsonl") else "csv"
+        incremental = False
+        if os.path.exists(output_path) and read_watermark(output_path):
+            incremental = messagebox.askyesno("Ekspor Inkremental",
+                                              f"File sudah berisi log hingga ID {read_watermark(output_path)}.\n"
+                                              "Lanjutkan ekspor dari titik tersebut? (Tidak = timpa file)")
+        sertakan_arsip = messagebox.askyesno("Sertakan Arsip",
+                                             "Sertakan log yang sudah dipindahkan ke arsip oleh job retensi?\n"
+                                             "(Tidak = hanya log aktif; ekspor tidak lengkap jika pengarsipan pernah dijalankan)")
+        self.run_db(export_audit_log, self.db_service, output_path, fmt=fmt, incremental=incremental, sertakan_arsip=sertakan_arsip,
+                    on_success=lambda hasil: messagebox.showinfo("Ekspor Selesai", f"{hasil[0]} baris log diekspor ke {output_path}.\nLog ID terakhir: {hasil[1]}"),
+                    on_error=lambda e: messagebox.showerror("Ekspor Gagal", f"Gagal mengekspor riwayat aktivitas: {e}"))
 
     def clear_screen_elements(self):
         super().clear_screen_elements()
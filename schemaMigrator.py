@@ -0,0 +1,182 @@
+import argparse
+import hashlib
+import os
+import re
+import mysql.connector
+from mysql.connector import errorcode
+
+# Naikkan setiap kali query.ddl diubah agar database yang sudah ada ikut diperbarui saat aplikasi dijalankan.
+SCHEMA_VERSION = 3
+DDL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "query.ddl")
+LOCK_NAME = "asrama_schema_migrasi"
+LOCK_TIMEOUT = 30
+POLA_CALL = re.compile(r"^\s*CALL\s+(\w+)\s*\(\s*\)\s*$", re.IGNORECASE) # Prosedur tanpa argumen di query.ddl
+
+DDL_SCHEMA_VERSION = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        versi INT PRIMARY KEY,
+        checksum CHAR(64) NOT NULL,
+        diterapkan_pada TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB
+"""
+
+
+def split_sql_statements(teks):
+    """
+    Memecah skrip SQL menjadi daftar statement, mengikuti perintah `DELIMITER` milik klien mysql
+    (untuk trigger dan stored procedure). Delimiter di dalam string, identifier ber-backtick,
+    dan komentar tidak dianggap sebagai akhir statement; komentar dibuang dari hasil.
+    """
+    statements = []
+    delimiter = ";"
+    buffer = []
+    kutip = None # Karakter kutip yang sedang terbuka: ', ", atau `
+    komentar_blok = False
+    for baris in teks.splitlines(keepends=True):
+        if not kutip and not komentar_blok and not "".join(buffer).strip():
+            bagian = baris.strip().split(None, 1)
+            if bagian and bagian[0].upper() == "DELIMITER":
+                delimiter = bagian[1].strip() if len(bagian) > 1 else ";"
+                buffer = []
+                continue
+        i = 0
+        while i < len(baris):
+            c = baris[i]
+            if komentar_blok:
+                if baris.startswith("*/", i):
+                    komentar_blok = False
+                    i += 2
+                else:
+                    i += 1
+                continue
+            if kutip:
+                buffer.append(c)
+                if c == "\\" and kutip != "`" and i + 1 < len(baris):
+                    buffer.append(baris[i + 1])
+                    i += 2
+                    continue
+                if c == kutip:
+                    kutip = None
+                i += 1
+                continue
+            if c in ("'", '"', "`"):
+                kutip = c
+            elif baris.startswith("/*", i):
+                komentar_blok = True
+                i += 2
+                continue
+            elif c == "#" or (baris.startswith("--", i) and baris[i + 2:i + 3] in (" ", "\t", "\n", "\r", "")):
+                buffer.append("\n")
+                break # Sisa baris adalah komentar
+            elif baris.startswith(delimiter, i):
+                statement = "".join(buffer).strip().rstrip(";").rstrip() # mis. "DROP ...;" sebelum "$$"
+                if statement:
+                    statements.append(statement)
+                buffer = []
+                i += len(delimiter)
+                continue
+            buffer.append(c)
+            i += 1
+    sisa = "".join(buffer).strip().rstrip(";").rstrip()
+    if sisa:
+        statements.append(sisa)
+    return statements
+
+
+def _checksum(ddl_path):
+    with open(ddl_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def read_schema_version(conn):
+    """Membaca (versi, checksum) skema yang terpasang dengan satu SELECT; (0, None) jika belum pernah dimigrasi."""
+    cursor = conn.cursor(buffered=True)
+    try:
+        cursor.execute("SELECT versi, checksum FROM schema_version ORDER BY versi DESC LIMIT 1")
+        row = cursor.fetchone()
+    except mysql.connector.Error as err:
+        if err.errno == errorcode.ER_NO_SUCH_TABLE:
+            return 0, None
+        raise
+    finally:
+        cursor.close()
+    return (row[0], row[1]) if row else (0, None)
+
+
+def apply_ddl(conn, ddl_path=DDL_PATH):
+    """Menjalankan seluruh statement di `ddl_path` pada koneksi ini dan meng-commit-nya."""
+    with open(ddl_path, encoding="utf-8") as f:
+        statements = split_sql_statements(f.read())
+    cursor = conn.cursor(buffered=True)
+    try:
+        for statement in statements:
+            panggilan = POLA_CALL.match(statement)
+            if panggilan:
+                # callproc + stored_results membaca habis semua result set prosedur di semua versi connector
+                # (cursor.nextset hanya ada di versi terbaru).
+                cursor.callproc(panggilan.group(1))
+                for hasil in cursor.stored_results():
+                    hasil.fetchall()
+            else:
+                cursor.execute(statement)
+                if cursor.with_rows:
+                    cursor.fetchall()
+        conn.commit()
+    finally:
+        cursor.close()
+    return len(statements)
+
+
+def ensure_schema(conn, ddl_path=DDL_PATH, versi=SCHEMA_VERSION, paksa=False):
+    """
+    Memastikan skema database berada pada `versi`. Jika versi terpasang sudah sama, biayanya hanya satu SELECT.
+    Jika belum, query.ddl diterapkan sekali di bawah GET_LOCK (agar dua instance aplikasi tidak bermigrasi
+    bersamaan) lalu versinya dicatat di tabel schema_version. Mengembalikan True jika migrasi dijalankan.
+    """
+    versi_terpasang, checksum_terpasang = read_schema_version(conn)
+    if versi_terpasang >= versi and not paksa:
+        if checksum_terpasang != _checksum(ddl_path) and versi_terpasang == versi:
+            print(f"Peringatan: query.ddl berubah tetapi SCHEMA_VERSION masih {versi}; naikkan versinya agar perubahan diterapkan.")
+        return False
+
+    cursor = conn.cursor(buffered=True)
+    try:
+        cursor.execute("SELECT GET_LOCK(%s, %s)", (LOCK_NAME, LOCK_TIMEOUT))
+        if cursor.fetchone()[0] != 1:
+            raise mysql.connector.errors.OperationalError(msg=f"Gagal mendapatkan lock migrasi skema dalam {LOCK_TIMEOUT} detik.")
+        conn.commit() # Akhiri snapshot transaksi lama agar pembacaan ulang melihat hasil instance lain
+        try:
+            versi_terpasang, _ = read_schema_version(conn) # Instance lain mungkin sudah bermigrasi selama kita menunggu lock
+            if versi_terpasang >= versi and not paksa:
+                return False
+            print(f"Menerapkan skema versi {versi} (terpasang: {versi_terpasang}) dari {os.path.basename(ddl_path)} ...")
+            jumlah = apply_ddl(conn, ddl_path)
+            cursor.execute(DDL_SCHEMA_VERSION)
+            cursor.execute("REPLACE INTO schema_version (versi, checksum) VALUES (%s, %s)", (versi, _checksum(ddl_path)))
+            conn.commit()
+            print(f"Skema versi {versi} diterapkan ({jumlah} statement).")
+            return True
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (LOCK_NAME,))
+            cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def main():
+    """Menerapkan query.ddl ke database secara manual (misalnya setelah deploy) tanpa membuka aplikasi."""
+    parser = argparse.ArgumentParser(description="Terapkan skema database asrama dari query.ddl.")
+    parser.add_argument("--paksa", action="store_true", help="Terapkan ulang walaupun versi skema sudah sama.")
+    args = parser.parse_args()
+
+    conn = mysql.connector.connect(host=os.getenv("DB_HOST", "localhost"), user=os.getenv("DB_USER", "root"),
+                                   password=os.getenv("DB_PASSWORD", ""), database=os.getenv("DB_NAME", "asrama_db_mysql"))
+    try:
+        if not ensure_schema(conn, paksa=args.paksa):
+            print(f"Skema sudah berada pada versi {SCHEMA_VERSION}.")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,49 +1,115 @@
-from baseScreen import BaseScreen
-from mainMenuScreen import MainMenuScreen
-from asramaSelectionScreen import AsramaSelectionScreen
-from kamarListScreen import KamarListScreen
-from kamarDetailScreen import KamarDetailScreen
-from insertDataScreen import InsertDataScreen
-from updateDataScreen import UpdateDataScreen
-from deleteDataScreen import DeleteDataScreen
-from pindahKamarScreen import PindahKamarScreen
-from riwayatScreen import RiwayatAktivitasScreen
+import importlib
 from tkinter import messagebox
+from collections import OrderedDict
+
+# Layar di-import saat pertama kali ditampilkan, bukan saat aplikasi dimulai: nama kelas -> modul
+MODUL_LAYAR = {
+    'MainMenuScreen': 'mainMenuScreen',
+    'AsramaSelectionScreen': 'asramaSelectionScreen',
+    'KamarListScreen': 'kamarListScreen',
+    'KamarDetailScreen': 'kamarDetailScreen',
+    'InsertDataScreen': 'insertDataScreen',
+    'UpdateDataScreen': 'updateDataScreen',
+    'DeleteDataScreen': 'deleteDataScreen',
+    'PindahKamarScreen': 'pindahKamarScreen',
+    'RiwayatAktivitasScreen': 'riwayatScreen',
+    'CariPenghuniScreen': 'cariPenghuniScreen',
+    'PapanOkupansiScreen': 'papanOkupansiScreen',
+    'AlokasiScreen': 'alokasiScreen',
+}
 
 class ScreenManager:
+    """
+    Mengatur perpindahan layar. Layar dengan `dapat_disimpan = True` tidak dihancurkan saat ditinggalkan,
+    melainkan disembunyikan dan disimpan (LRU) agar dapat ditampilkan ulang seketika; datanya dimuat ulang
+    hanya jika DatabaseService.versi_data berubah. Cache dibatasi jumlah layar dan total bobotnya (BaseScreen.bobot).
+    """
+    MAKS_LAYAR_TERSIMPAN = 8
+    MAKS_BOBOT_TERSIMPAN = 12000
+
     def __init__(self, app, db_service):
         self.app = app 
         self.db_service = db_service
         self.current_screen_instance = None
         self.current_asrama_id_context = None
         self.current_asrama_nama_context = None
+        self._layar_tersimpan = OrderedDict() # (kelas, args[, konteks asrama]) -> layar tersembunyi, urut LRU
+        self._kelas_layar = {} # nama kelas -> kelas yang sudah di-import
+
+    def _resolve_screen(self, nama_kelas):
+        """Mengembalikan kelas layar `nama_kelas`, meng-import modulnya saat pertama kali dibutuhkan."""
+        kelas = self._kelas_layar.get(nama_kelas)
+        if kelas is None:
+            kelas = getattr(importlib.import_module(MODUL_LAYAR[nama_kelas]), nama_kelas)
+            self._kelas_layar[nama_kelas] = kelas
+        return kelas
+
+    def _display_screen(self, nama_kelas, *args):
+        screen_class = self._resolve_screen(nama_kelas)
+        kunci = (screen_class, args)
+        if screen_class.pakai_konteks_asrama:
+            kunci += (self.current_asrama_id_context, self.current_asrama_nama_context)
+        layar_lama = self.current_screen_instance
+        if layar_lama:
+            if layar_lama.dapat_disimpan:
+                layar_lama.hide()
+                self._layar_tersimpan[layar_lama.kunci_layar] = layar_lama
+                self._layar_tersimpan.move_to_end(layar_lama.kunci_layar)
+            else:
+                layar_lama.clear_screen_elements()
+        layar = self._layar_tersimpan.pop(kunci, None)
+        self.current_screen_instance = layar
+        if layar:
+            layar.show()
+        else:
+            layar = screen_class(self, self.db_service, *args)
+            layar.kunci_layar = kunci
+            self.current_screen_instance = layar
+            layar.setup_ui()
+        self._batasi_layar_tersimpan()
 
-    def _display_screen(self, screen_class, *args):
-        if self.current_screen_instance: self.current_screen_instance.clear_screen_elements()
-        self.app._clear_canvas_for_new_screen()
-        self.app._draw_background() 
-        self.current_screen_instance = screen_class(self, self.db_service, *args)
-        self.current_screen_instance.setup_ui() 
+    def _batasi_layar_tersimpan(self):
+        """Membuang layar tersimpan yang paling lama tidak dipakai hingga jumlah dan total bobotnya di bawah batas."""
+        total_bobot = sum(layar.bobot() for layar in self._layar_tersimpan.values())
+        while self._layar_tersimpan and (len(self._layar_tersimpan) > self.MAKS_LAYAR_TERSIMPAN or total_bobot > self.MAKS_BOBOT_TERSIMPAN):
+            _, layar = self._layar_tersimpan.popitem(last=False)
+            total_bobot -= layar.bobot()
+            layar.clear_screen_elements()
 
-    def show_main_menu(self): self._display_screen(MainMenuScreen)
+    def clear_cache(self):
+        """Menghancurkan semua layar tersimpan (misalnya sebelum aplikasi ditutup)."""
+        while self._layar_tersimpan:
+            self._layar_tersimpan.popitem(last=False)[1].clear_screen_elements()
+
+    def show_main_menu(self): self._display_screen('MainMenuScreen')
     def show_asrama_selection(self):
         self.current_asrama_id_context = None 
         self.current_asrama_nama_context = None
-        self._display_screen(AsramaSelectionScreen)
+        self._display_screen('AsramaSelectionScreen')
     def show_kamar_list(self, asrama_id, asrama_nama):
         self.current_asrama_id_context = asrama_id
         self.current_asrama_nama_context = asrama_nama
-        self._display_screen(KamarListScreen, asrama_id, asrama_nama)
+        self._display_screen('KamarListScreen', asrama_id, asrama_nama)
     def show_kamar_detail(self, kamar_id): 
         if self.current_asrama_id_context is None:
             messagebox.showerror("Kesalahan Navigasi", "Konteks asrama tidak ditemukan.")
             self.show_asrama_selection()
             return
-        self._display_screen(KamarDetailScreen, kamar_id)
-    def show_insert_data_form(self, kamar_id): self._display_screen(InsertDataScreen, kamar_id)
-    def show_update_data_form(self, kamar_id): self._display_screen(UpdateDataScreen, kamar_id)
-    def show_delete_data_form(self, kamar_id): self._display_screen(DeleteDataScreen, kamar_id)
+        self._display_screen('KamarDetailScreen', kamar_id)
+    def show_kamar_detail_in_asrama(self, asrama_id, asrama_nama, kamar_id):
+        self.current_asrama_id_context = asrama_id
+        self.current_asrama_nama_context = asrama_nama
+        self._display_screen('KamarDetailScreen', kamar_id)
+    def show_insert_data_form(self, kamar_id): self._display_screen('InsertDataScreen', kamar_id)
+    def show_update_data_form(self, kamar_id): self._display_screen('UpdateDataScreen', kamar_id)
+    def show_delete_data_form(self, kamar_id): self._display_screen('DeleteDataScreen', kamar_id)
     def show_pindah_kamar_form(self, kamar_id_asal): 
-        self._display_screen(PindahKamarScreen, kamar_id_asal)
+        self._display_screen('PindahKamarScreen', kamar_id_asal)
     def show_riwayat_aktivitas(self): 
-        self._display_screen(RiwayatAktivitasScreen)
\ No newline at end of file
+        self._display_screen('RiwayatAktivitasScreen')
+    def show_cari_penghuni(self):
+        self._display_screen('CariPenghuniScreen')
+    def show_papan_okupansi(self):
+        self._display_screen('PapanOkupansiScreen')
+    def show_alokasi(self):
+        self._display_screen('AlokasiScreen')
\ No newline at end of file
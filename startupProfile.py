@@ -0,0 +1,104 @@
+import json
+import sys
+import threading
+import time
+
+PROFIL_DEFAULT = "startup_profile.json"
+
+
+class _PencatatImpor:
+    """
+    Finder di awal sys.meta_path yang tidak memuat modul sendiri: ia meminjam spec dari finder lain
+    lalu membungkus loader.exec_module agar waktu eksekusi setiap modul tercatat.
+    """
+    def __init__(self, profiler):
+        self._profiler = profiler
+        self._sedang_mencari = set()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname in self._sedang_mencari:
+            return None
+        self._sedang_mencari.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._sedang_mencari.discard(fullname)
+        loader = spec.loader
+        # BuiltinImporter/FrozenImporter adalah kelas bersama; hanya loader per modul yang boleh dibungkus
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return spec
+        exec_asli = loader.exec_module
+        profiler = self._profiler
+        def exec_module(module):
+            profiler._mulai_impor(fullname)
+            try:
+                exec_asli(module)
+            finally:
+                profiler._selesai_impor(fullname)
+        loader.exec_module = exec_module
+        return spec
+
+
+class StartupProfiler:
+    """
+    Mencatat waktu import setiap modul dan tanda waktu tahap start aplikasi (jendela dibuat, cat pertama,
+    database terhubung, menu utama siap), lalu menuliskannya ke file JSON dengan `tulis`.
+    Waktu diukur dengan time.perf_counter relatif terhadap pembuatan profiler.
+    """
+    def __init__(self):
+        self._mulai = time.perf_counter()
+        self.tanda = {}
+        self.impor = [] # (modul, thread, kumulatif_ms, sendiri_ms)
+        self._tumpukan = threading.local() # Per thread: database di-import di thread worker selagi UI berjalan
+        self._pencatat = None
+
+    def pasang(self):
+        """Mulai mencatat import. Panggil sebelum modul aplikasi di-import."""
+        if self._pencatat is None:
+            self._pencatat = _PencatatImpor(self)
+            sys.meta_path.insert(0, self._pencatat)
+
+    def lepas(self):
+        if self._pencatat is not None:
+            sys.meta_path.remove(self._pencatat)
+            self._pencatat = None
+
+    def _mulai_impor(self, modul):
+        if not hasattr(self._tumpukan, "isi"):
+            self._tumpukan.isi = []
+        self._tumpukan.isi.append([modul, time.perf_counter(), 0.0]) # [modul, waktu_mulai, waktu_anak]
+
+    def _selesai_impor(self, modul):
+        tumpukan = self._tumpukan.isi
+        _, mulai, anak = tumpukan.pop()
+        durasi = time.perf_counter() - mulai
+        if tumpukan:
+            tumpukan[-1][2] += durasi
+        self.impor.append((modul, threading.current_thread().name, durasi * 1000, (durasi - anak) * 1000))
+
+    def tandai(self, nama):
+        """Mencatat tanda waktu `nama` (ms sejak profiler dibuat); tanda yang sama hanya dicatat pertama kali."""
+        self.tanda.setdefault(nama, (time.perf_counter() - self._mulai) * 1000)
+
+    def tulis(self, path=PROFIL_DEFAULT):
+        """Menulis hasil ke `path` sebagai JSON; import diurutkan dari waktu sendiri terbesar."""
+        impor = sorted(self.impor, key=lambda baris: baris[3], reverse=True)
+        hasil = {
+            "python": sys.version.split()[0],
+            "tanda_ms": {nama: round(ms, 3) for nama, ms in self.tanda.items()},
+            "total_impor_ms": round(sum(baris[3] for baris in impor), 3),
+            "impor": [{"modul": modul, "thread": thread, "kumulatif_ms": round(kumulatif, 3), "sendiri_ms": round(sendiri, 3)}
+                      for modul, thread, kumulatif, sendiri in impor],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(hasil, f, indent=2)
+        ringkasan = ", ".join(f"{nama} {ms:.1f}ms" for nama, ms in self.tanda.items())
+        print(f"Profil start ditulis ke '{path}': {ringkasan}")
+        return hasil
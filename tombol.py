@@ -1,70 +1,138 @@
-import tkinter as tk
-from math import sin, cos, pi
-def tbl(canvas, x, y, lebar, tinggi, radius_awal, radius_akhir, 
-        sudut_awal_busur1, sudut_akhir_busur1, 
-        sudut_awal_busur2, sudut_akhir_busur2, 
+import weakref
+
+SKALA_SUPERSAMPLE = 4 # Sprite digambar 4x lebih besar lalu diperkecil agar tepi sudutnya halus
+TAG_TOMBOL = "tombol"
+
+# Sprite per interpreter Tk: (lebar, tinggi, radius_awal, radius_akhir, warna, keadaan) -> PhotoImage
+_sprite = weakref.WeakKeyDictionary()
+# Registri tombol per canvas: item_id (gambar dan teks) -> _Tombol
+_registri = weakref.WeakKeyDictionary()
+
+
+def _ubah_warna(rgb, faktor):
+    """faktor > 0 mencerahkan ke arah putih, faktor < 0 menggelapkan ke arah hitam."""
+    if faktor >= 0:
+        return tuple(round(c + (255 - c) * faktor) for c in rgb)
+    return tuple(round(c * (1 + faktor)) for c in rgb)
+
+
+def _render_sprite(lebar, tinggi, radius_awal, radius_akhir, warna):
+    """Menggambar badan tombol (persegi dengan sudut kiri berjari-jari radius_awal dan kanan radius_akhir) sebagai RGBA."""
+    from PIL import Image, ImageDraw # Hanya diperlukan saat sprite pertama kali dibuat
+    s = SKALA_SUPERSAMPLE
+    w, h, ra, rb = round(lebar * s), round(tinggi * s), radius_awal * s, radius_akhir * s
+    gambar = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(gambar)
+    isi = warna + (255,)
+    draw.rectangle((ra, 0, w - rb - 1, h - 1), fill=isi)
+    draw.rectangle((0, ra, ra, h - ra - 1), fill=isi)
+    draw.rectangle((w - rb - 1, rb, w - 1, h - rb - 1), fill=isi)
+    draw.pieslice((0, 0, 2 * ra, 2 * ra), 180, 270, fill=isi)
+    draw.pieslice((w - 2 * rb - 1, 0, w - 1, 2 * rb), 270, 360, fill=isi)
+    draw.pieslice((0, h - 2 * ra - 1, 2 * ra, h - 1), 90, 180, fill=isi)
+    draw.pieslice((w - 2 * rb - 1, h - 2 * rb - 1, w - 1, h - 1), 0, 90, fill=isi)
+    return gambar.resize((round(lebar), round(tinggi)), Image.LANCZOS)
+
+
+def sprite_tombol(canvas, lebar, tinggi, radius_awal, radius_akhir, warna, keadaan="normal"):
+    """
+    PhotoImage badan tombol untuk keadaan "normal", "hover", atau "tekan". Setiap kombinasi ukuran, radius,
+    warna, dan keadaan hanya di-render sekali per interpreter Tk, lalu dipakai ulang oleh semua layar.
+    """
+    cache = _sprite.setdefault(canvas._root(), {})
+    kunci = (lebar, tinggi, radius_awal, radius_akhir, warna, keadaan)
+    photo = cache.get(kunci)
+    if photo is None:
+        from PIL import ImageTk
+        rgb = tuple(c // 256 for c in canvas.winfo_rgb(warna))
+        rgb = _ubah_warna(rgb, {"normal": 0, "hover": 0.18, "tekan": -0.2}[keadaan])
+        photo = ImageTk.PhotoImage(_render_sprite(lebar, tinggi, radius_awal, radius_akhir, rgb), master=canvas)
+        cache[kunci] = photo
+    return photo
+
+
+class _Tombol:
+    __slots__ = ("gambar_id", "teks_id", "sprite", "perintah")
+
+    def __init__(self, gambar_id, teks_id, sprite, perintah):
+        self.gambar_id = gambar_id
+        self.teks_id = teks_id
+        self.sprite = sprite # {"normal": PhotoImage, "hover": ..., "tekan": ...}
+        self.perintah = perintah
+
+
+def _tombol_aktif(canvas):
+    item = canvas.find_withtag("current")
+    return _registri.get(canvas, {}).get(item[0]) if item else None
+
+
+def _pasang_binding(canvas):
+    """Binding hover/tekan/klik dipasang sekali per canvas pada tag bersama, bukan per tombol."""
+    def masuk(event):
+        tombol = _tombol_aktif(canvas)
+        if tombol: canvas.itemconfigure(tombol.gambar_id, image=tombol.sprite["hover"])
+
+    def keluar(event):
+        tombol = _tombol_aktif(canvas)
+        if tombol: canvas.itemconfigure(tombol.gambar_id, image=tombol.sprite["normal"])
+
+    def tekan(event):
+        tombol = _tombol_aktif(canvas)
+        if tombol: canvas.itemconfigure(tombol.gambar_id, image=tombol.sprite["tekan"])
+
+    def lepas(event):
+        tombol = _tombol_aktif(canvas)
+        if not tombol: return
+        x, y = canvas.canvasx(event.x), canvas.canvasy(event.y)
+        x0, y0, x1, y1 = canvas.bbox(tombol.gambar_id)
+        if x0 <= x < x1 and y0 <= y < y1:
+            canvas.itemconfigure(tombol.gambar_id, image=tombol.sprite["hover"])
+            tombol.perintah() # Bisa berpindah layar dan menghapus tombol ini; jangan sentuh item setelahnya
+        else:
+            canvas.itemconfigure(tombol.gambar_id, image=tombol.sprite["normal"])
+
+    canvas.tag_bind(TAG_TOMBOL, "<Enter>", masuk)
+    canvas.tag_bind(TAG_TOMBOL, "<Leave>", keluar)
+    canvas.tag_bind(TAG_TOMBOL, "<ButtonPress-1>", tekan)
+    canvas.tag_bind(TAG_TOMBOL, "<ButtonRelease-1>", lepas)
+
+
+def lupakan_tombol(canvas, item_ids):
+    """Menghapus tombol dari registri setelah item canvas-nya dihapus (dipanggil BaseScreen.clear_screen_elements)."""
+    registri = _registri.get(canvas)
+    if registri:
+        for item in item_ids: registri.pop(item, None)
+
+
+def reset_tombol(canvas, item_ids):
+    """Mengembalikan tombol ke sprite normal (misalnya saat layarnya disembunyikan ketika tombol masih hover/ditekan)."""
+    registri = _registri.get(canvas, {})
+    for item in item_ids:
+        tombol = registri.get(item)
+        if tombol and tombol.gambar_id == item:
+            canvas.itemconfigure(item, image=tombol.sprite["normal"])
+
+
+def tbl(canvas, x, y, lebar, tinggi, radius_awal, radius_akhir,
+        sudut_awal_busur1, sudut_akhir_busur1,
+        sudut_awal_busur2, sudut_akhir_busur2,
         warna, teks, perintah):
     """
-    Membuat tombol dengan bentuk kustom menggunakan poligon dan busur yang diisi.
-    Parameter sudut_awal/akhir_busur1/2 menentukan 'extent' jika tbl Anda menghitungnya.
-    Jika tbl Anda membuat sudut standar, nilai-nilai ini mungkin tidak terlalu berpengaruh.
-    Versi ini menggambar 4 sudut membulat standar.
+    Membuat tombol bersudut membulat dari sprite PhotoImage yang di-cache (lihat sprite_tombol) ditambah satu item teks,
+    dengan keadaan hover dan tekan; perintah dijalankan saat klik dilepas di atas tombol.
+    Parameter sudut_awal/akhir_busur1/2 dipertahankan demi kompatibilitas pemanggil lama dan tidak dipakai.
+    Label tetap berupa item teks agar dapat diubah dengan itemconfigure (misalnya okupansi kamar).
+    Mengembalikan (gambar_id, teks_id).
     """
-    
-    path_id = canvas.create_polygon(
-        x + radius_awal, y, 
-        x + lebar - radius_akhir, y, 
-        x + lebar - radius_akhir, y, 
-        x + lebar, y + radius_akhir, 
-        x + lebar, y + tinggi - radius_akhir, 
-        x + lebar - radius_akhir, y + tinggi, 
-        x + radius_awal, y + tinggi, 
-        x, y + tinggi - radius_awal, 
-        x, y + radius_awal, 
-        x + radius_awal, y, 
-        fill=warna,
-        outline=warna,
-        smooth=False 
-    )
-
-    # Sudut Kiri Atas
-    canvas.create_arc(
-        x, y, 
-        x + 2 * radius_awal, y + 2 * radius_awal,
-        start=90, extent=90, 
-        style=tk.PIESLICE, fill=warna, outline=warna
-    )
-    # Sudut Kanan Atas
-    canvas.create_arc(
-        x + lebar - 2 * radius_akhir, y,
-        x + lebar, y + 2 * radius_akhir,
-        start=0, extent=90, 
-        style=tk.PIESLICE, fill=warna, outline=warna
-    )
-    # Sudut Kiri Bawah
-    canvas.create_arc(
-        x, y + tinggi - 2 * radius_awal,
-        x + 2 * radius_awal, y + tinggi,
-        start=180, extent=90, 
-        style=tk.PIESLICE, fill=warna, outline=warna
-    )
-    # Sudut Kanan Bawah
-    canvas.create_arc(
-        x + lebar - 2 * radius_akhir, y + tinggi - 2 * radius_akhir,
-        x + lebar, y + tinggi,
-        start=270, extent=90, 
-        style=tk.PIESLICE, fill=warna, outline=warna
-    )
-    
-    teks_id = canvas.create_text(x + lebar / 2, y + tinggi / 2, text=teks, fill="white", font=("Arial", 12, "bold"))
-
-    button_tag = f"button_custom_{path_id}" 
-    canvas.addtag_withtag(button_tag, path_id)
-
-    def klik_tombol(event):
-        perintah()
-
-    canvas.tag_bind(path_id, "<Button-1>", klik_tombol)
-    canvas.tag_bind(teks_id, "<Button-1>", klik_tombol)
-    
-    return path_id, teks_id
\ No newline at end of file
+    sprite = {keadaan: sprite_tombol(canvas, lebar, tinggi, radius_awal, radius_akhir, warna, keadaan)
+              for keadaan in ("normal", "hover", "tekan")}
+    gambar_id = canvas.create_image(x, y, image=sprite["normal"], anchor="nw", tags=(TAG_TOMBOL,))
+    teks_id = canvas.create_text(x + lebar / 2, y + tinggi / 2, text=teks, fill="white", font=("Arial", 12, "bold"),
+                                 tags=(TAG_TOMBOL,))
+    if canvas not in _registri:
+        _registri[canvas] = {}
+        _pasang_binding(canvas)
+    tombol = _Tombol(gambar_id, teks_id, sprite, perintah)
+    _registri[canvas][gambar_id] = tombol
+    _registri[canvas][teks_id] = tombol
+    return gambar_id, teks_id
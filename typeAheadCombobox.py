@@ -0,0 +1,79 @@
+from bisect import bisect_left
+from tkinter import ttk
+
+
+class PrefixIndex:
+    """
+    Indeks awalan (sorted array + bisect) atas daftar string opsi, misalnya "NIM - Nama".
+    Setiap opsi dapat dicari dari awal string (awalan NIM), dari awal nama setelah " - ",
+    maupun dari awal setiap kata nama, tanpa membedakan huruf besar/kecil.
+    """
+    def __init__(self, opsi=()):
+        self.opsi = [str(o) for o in opsi]
+        entri = []
+        for posisi, teks in enumerate(self.opsi):
+            teks_kecil = teks.lower()
+            kunci = {teks_kecil}
+            if " - " in teks_kecil:
+                nama = teks_kecil.split(" - ", 1)[1]
+                kunci.add(nama)
+                kunci.update(nama.split())
+            entri.extend((k, posisi) for k in kunci)
+        entri.sort()
+        self._kunci = [k for k, _ in entri]
+        self._posisi = [p for _, p in entri]
+
+    def cari(self, awalan, batas=50):
+        """Mengembalikan hingga `batas` opsi yang cocok dengan `awalan` (urutan sesuai daftar asli)."""
+        awalan = awalan.strip().lower()
+        if not awalan:
+            return self.opsi[:batas]
+        hasil = set()
+        i = bisect_left(self._kunci, awalan)
+        while i < len(self._kunci) and self._kunci[i].startswith(awalan):
+            hasil.add(self._posisi[i])
+            i += 1
+        return [self.opsi[p] for p in sorted(hasil)[:batas]]
+
+
+class TypeAheadCombobox(ttk.Combobox):
+    """
+    Combobox yang dapat diketik: daftar pilihan disaring dari PrefixIndex saat pengguna mengetik,
+    dengan debounce `jeda_ms` dan jumlah opsi yang ditampilkan dibatasi `batas_hasil`,
+    sehingga dropdown tetap ringan walaupun opsinya ribuan.
+    """
+    def __init__(self, master=None, batas_hasil=50, jeda_ms=150, **kwargs):
+        kwargs.setdefault("state", "normal")
+        super().__init__(master, **kwargs)
+        self.batas_hasil = batas_hasil
+        self.jeda_ms = jeda_ms
+        self._indeks = PrefixIndex()
+        self._opsi_valid = set()
+        self._after_id = None
+        self.bind("<KeyRelease>", self._on_key_release, add="+")
+        self.bind("<Destroy>", lambda event: self._batalkan_jadwal(), add="+")
+
+    def set_options(self, opsi):
+        """Mengganti seluruh opsi dan membangun ulang indeksnya."""
+        self._indeks = PrefixIndex(opsi)
+        self._opsi_valid = set(self._indeks.opsi)
+        self['values'] = self._indeks.cari("", self.batas_hasil)
+
+    def is_valid_option(self, teks=None):
+        """True jika teks (default: isi combobox saat ini) persis salah satu opsi."""
+        return (self.get() if teks is None else teks) in self._opsi_valid
+
+    def _on_key_release(self, event):
+        if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        self._batalkan_jadwal()
+        self._after_id = self.after(self.jeda_ms, self._saring)
+
+    def _batalkan_jadwal(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _saring(self):
+        self._after_id = None
+        self['values'] = self._indeks.cari(self.get(), self.batas_hasil)
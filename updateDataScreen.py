@@ -1,8 +1,8 @@
 from baseScreen import BaseScreen
-from tombol import tbl
 from tkinter import * 
 import tkinter as tk
 from tkinter import messagebox,ttk
+from typeAheadCombobox import TypeAheadCombobox
 
 
 class UpdateDataScreen(BaseScreen):
@@ -20,11 +20,11 @@ class UpdateDataScreen(BaseScreen):
 
     def setup_ui(self):
         self.create_canvas_text(560, 50, text=f"Ubah Data Kamar {self.kamar_id} Asrama {self.asrama_nama}", fill="#F4FEFF", font=("Cooper Black", 20, "bold"))
-        opsi_display_db, self.data_lengkap_mahasiswa_cache = self.db_service.get_penghuni_in_kamar(self.kamar_id, self.asrama_id)
         self.create_canvas_text(460, 110, text="Pilih Mahasiswa (NIM - Nama)", fill="#F4FEFF", font=("Arial", 12, "bold"))
-        mahasiswa_dropdown = self.add_widget(ttk.Combobox(self.canvas, textvariable=self.plh_mahasiswa_var, font=("Arial",15), state="readonly", values=opsi_display_db, width=34))
+        self.mahasiswa_dropdown = mahasiswa_dropdown = self.add_widget(TypeAheadCombobox(self.canvas, textvariable=self.plh_mahasiswa_var, font=("Arial",15), width=34))
         mahasiswa_dropdown.place(x=350, y=120)
         mahasiswa_dropdown.bind("<<ComboboxSelected>>", self._on_mahasiswa_selected)
+        self.plh_mahasiswa_var.set("Memuat data penghuni...")
         self.create_canvas_text(500, 178, text="NIM Baru (Kosongkan jika tidak diubah)", fill="#F4FEFF", font=("Arial", 12, "bold"))
         self.nim_baru_entry = self.add_widget(Entry(self.canvas, width=30, font=("Arial", 18), bg="#F4FEFF"))
         self.nim_baru_entry.place(x=350, y=190)
@@ -35,6 +35,13 @@ class UpdateDataScreen(BaseScreen):
         self.create_canvas_text(405, 340, text="Fakultas Baru", fill="#F4FEFF", font=("Arial", 12, "bold"))
         fakultas_dropdown_widget = self.add_widget(ttk.Combobox(self.canvas, textvariable=self.fakultas_baru_pilihan, values=fakultas_list,width=29, font=("Arial", 18), state="readonly"))
         fakultas_dropdown_widget.place(x=350, y=350)
+        self.tbl(300, 430, 200, 70, 20, 20, 90, 180, 270, 360, "#F47B07", "Ubah", self._update_data_action)
+        self.tbl(600, 430, 200, 70, 20, 20, 90, 180, 270, 360,"red","Batal", lambda: self.screen_manager.show_kamar_detail(self.kamar_id))
+        self.run_db(self.db_service.get_penghuni_in_kamar, self.kamar_id, self.asrama_id, on_success=self._tampilkan_penghuni)
+
+    def _tampilkan_penghuni(self, hasil):
+        opsi_display_db, self.data_lengkap_mahasiswa_cache = hasil
+        self.mahasiswa_dropdown.set_options(opsi_display_db)
         if opsi_display_db and not opsi_display_db[0].startswith("Info:") and not opsi_display_db[0].startswith("Kesalahan:"):
             self.plh_mahasiswa_var.set(opsi_display_db[0])
             self._on_mahasiswa_selected()
@@ -45,8 +52,6 @@ class UpdateDataScreen(BaseScreen):
             if self.nim_baru_entry: self.nim_baru_entry.delete(0, tk.END)
             if self.nama_baru_entry: self.nama_baru_entry.delete(0, tk.END)
             self.fakultas_baru_pilihan.set("")
-        tbl(self.canvas, 300, 430, 200, 70, 20, 20, 90, 180, 270, 360, "#F47B07", "Ubah", self._update_data_action)
-        tbl(self.canvas, 600, 430, 200, 70, 20, 20, 90, 180, 270, 360,"red","Batal", lambda: self.screen_manager.show_kamar_detail(self.kamar_id))
 
     def _get_nim_from_selection(self, selection_string):
         if " - " in selection_string: return selection_string.split(" - ")[0]
@@ -54,7 +59,7 @@ class UpdateDataScreen(BaseScreen):
     def _on_mahasiswa_selected(self, event=None):
         if not all([self.nim_baru_entry, self.nama_baru_entry, hasattr(self.fakultas_baru_pilihan, 'set')]): return
         selected_display_string = self.plh_mahasiswa_var.get()
-        nim_original = self._get_nim_from_selection(selected_display_string)
+        nim_original = self._get_nim_from_selection(selected_display_string) if self.mahasiswa_dropdown.is_valid_option(selected_display_string) else None
         self.selected_mahasiswa_nim_original = nim_original
         self.nim_baru_entry.delete(0, tk.END)
         self.nama_baru_entry.delete(0, tk.END)
@@ -66,9 +71,17 @@ class UpdateDataScreen(BaseScreen):
                     self.fakultas_baru_pilihan.set(str(data_mhs['fakultas']) if data_mhs['fakultas'] else "")
                     break
     def _update_data_action(self):
-        if not self.selected_mahasiswa_nim_original:
+        # Isi combobox bisa diketik langsung tanpa memicu <<ComboboxSelected>>; NIM dibaca ulang tanpa mengosongkan isian.
+        pilihan = self.plh_mahasiswa_var.get()
+        nim_dipilih = self._get_nim_from_selection(pilihan) if self.mahasiswa_dropdown.is_valid_option(pilihan) else None
+        if not nim_dipilih:
             messagebox.showwarning("Peringatan", "Pilih mahasiswa yang akan diubah datanya.")
             return
+        if nim_dipilih != self.selected_mahasiswa_nim_original:
+            # Isian masih milik mahasiswa sebelumnya: muat data mahasiswa yang diketik dan minta pengguna memeriksanya.
+            self._on_mahasiswa_selected()
+            messagebox.showinfo("Periksa Data", f"Data mahasiswa NIM {nim_dipilih} telah dimuat. Periksa isian lalu tekan Ubah lagi.")
+            return
         nim_baru = self.nim_baru_entry.get().strip()
         nama_baru = self.nama_baru_entry.get().strip()
         fakultas_baru = self.fakultas_baru_pilihan.get()
@@ -80,5 +93,5 @@ class UpdateDataScreen(BaseScreen):
         if not nim_baru and any(char.isalnum() for char in current_nim_entry_val):
              messagebox.showwarning("Input Tidak Valid", "NIM baru tidak boleh dikosongkan jika field diisi.")
              return
-        if self.db_service.update_penghuni(self.selected_mahasiswa_nim_original, nim_baru, nama_baru, fakultas_baru):
-            self.screen_manager.show_kamar_detail(self.kamar_id)
\ No newline at end of file
+        self.run_db(self.db_service.update_penghuni, self.selected_mahasiswa_nim_original, nim_baru, nama_baru, fakultas_baru,
+                    on_success=lambda berhasil: berhasil and self.screen_manager.show_kamar_detail(self.kamar_id))
\ No newline at end of file
@@ -0,0 +1,100 @@
+import threading
+from bisect import bisect_left, insort
+
+
+def lantai_kamar(nomor_kamar):
+    """Lantai dari nomor kamar mengikuti penomoran asrama (101 = lantai 1, 203 = lantai 2)."""
+    return nomor_kamar // 100
+
+
+class VacancyIndex:
+    """
+    Indeks in-memory kamar yang masih memiliki tempat kosong.
+    Per asrama disimpan daftar nomor kamar terurut, dan per lantai daftar (asrama_id, nomor_kamar) terurut,
+    sehingga pencarian "kamar kosong terdekat di asrama X" dan "kamar kosong di lantai N" cukup dengan bisect.
+    Data kamar diisi dengan `muat` lalu diperbarui dengan `terapkan` setiap kali okupansi kamar berubah.
+    """
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._kamar = {} # kamar_id_internal -> [asrama_id, nomor_kamar, kapasitas, jumlah_penghuni]
+        self._per_asrama = {} # asrama_id -> [nomor_kamar, ...] terurut, hanya kamar yang masih ada tempat
+        self._per_lantai = {} # lantai -> [(asrama_id, nomor_kamar), ...] terurut
+        self._id_by_key = {} # (asrama_id, nomor_kamar) -> kamar_id_internal
+
+    def muat(self, rows):
+        """Membangun ulang indeks dari baris kamar (kamar_id_internal, asrama_id, nomor_kamar, kapasitas, jumlah_penghuni)."""
+        with self._lock:
+            self._kamar = {}
+            self._per_asrama = {}
+            self._per_lantai = {}
+            self._id_by_key = {}
+            for row in rows:
+                asrama_id, nomor_kamar = row['asrama_id'], row['nomor_kamar']
+                self._kamar[row['kamar_id_internal']] = [asrama_id, nomor_kamar, row['kapasitas'], row['jumlah_penghuni']]
+                self._id_by_key[(asrama_id, nomor_kamar)] = row['kamar_id_internal']
+                if row['jumlah_penghuni'] < row['kapasitas']:
+                    self._per_asrama.setdefault(asrama_id, []).append(nomor_kamar)
+                    self._per_lantai.setdefault(lantai_kamar(nomor_kamar), []).append((asrama_id, nomor_kamar))
+            for daftar in self._per_asrama.values(): daftar.sort()
+            for daftar in self._per_lantai.values(): daftar.sort()
+
+    def terapkan(self, rows):
+        """Memperbarui kapasitas/jumlah penghuni kamar yang berubah (baris berisi kamar_id_internal, kapasitas, jumlah_penghuni)."""
+        with self._lock:
+            for row in rows:
+                data = self._kamar.get(row['kamar_id_internal'])
+                if data is None: continue # Kamar baru masuk indeks saat dimuat ulang
+                asrama_id, nomor_kamar, kapasitas_lama, jumlah_lama = data
+                ada_tempat_lama = jumlah_lama < kapasitas_lama
+                ada_tempat_baru = row['jumlah_penghuni'] < row['kapasitas']
+                data[2], data[3] = row['kapasitas'], row['jumlah_penghuni']
+                if ada_tempat_lama == ada_tempat_baru: continue
+                per_asrama = self._per_asrama.setdefault(asrama_id, [])
+                per_lantai = self._per_lantai.setdefault(lantai_kamar(nomor_kamar), [])
+                if ada_tempat_baru:
+                    insort(per_asrama, nomor_kamar)
+                    insort(per_lantai, (asrama_id, nomor_kamar))
+                else:
+                    del per_asrama[bisect_left(per_asrama, nomor_kamar)]
+                    del per_lantai[bisect_left(per_lantai, (asrama_id, nomor_kamar))]
+
+    def _info(self, asrama_id, nomor_kamar):
+        kamar_id = self._id_by_key[(asrama_id, nomor_kamar)]
+        _, _, kapasitas, jumlah = self._kamar[kamar_id]
+        return {'kamar_id_internal': kamar_id, 'asrama_id': asrama_id, 'nomor_kamar': nomor_kamar,
+                'kapasitas': kapasitas, 'jumlah_penghuni': jumlah, 'sisa': kapasitas - jumlah}
+
+    def terdekat(self, asrama_id, nomor_kamar_acuan=None, batas=5):
+        """Hingga `batas` kamar dengan tempat kosong di asrama, diurutkan dari yang nomornya paling dekat dengan acuan."""
+        with self._lock:
+            daftar = self._per_asrama.get(asrama_id, [])
+            if nomor_kamar_acuan is None:
+                return [self._info(asrama_id, nomor) for nomor in daftar[:batas]]
+            kanan = bisect_left(daftar, nomor_kamar_acuan)
+            kiri = kanan - 1
+            hasil = []
+            while len(hasil) < batas and (kiri >= 0 or kanan < len(daftar)):
+                # Jarak dihitung per lantai lebih dulu, baru selisih nomor, agar kamar di lantai yang sama diutamakan.
+                jarak_kiri = self._jarak(daftar[kiri], nomor_kamar_acuan) if kiri >= 0 else None
+                jarak_kanan = self._jarak(daftar[kanan], nomor_kamar_acuan) if kanan < len(daftar) else None
+                if jarak_kanan is None or (jarak_kiri is not None and jarak_kiri <= jarak_kanan):
+                    hasil.append(daftar[kiri])
+                    kiri -= 1
+                else:
+                    hasil.append(daftar[kanan])
+                    kanan += 1
+            return [self._info(asrama_id, nomor) for nomor in hasil]
+
+    @staticmethod
+    def _jarak(nomor_kamar, acuan):
+        return abs(lantai_kamar(nomor_kamar) - lantai_kamar(acuan)), abs(nomor_kamar - acuan)
+
+    def di_lantai(self, lantai, asrama_id=None, batas=5):
+        """Hingga `batas` kamar dengan tempat kosong di lantai tertentu, di satu asrama atau di semua asrama."""
+        with self._lock:
+            if asrama_id is not None:
+                daftar = self._per_asrama.get(asrama_id, [])
+                awal = bisect_left(daftar, lantai * 100)
+                akhir = bisect_left(daftar, (lantai + 1) * 100, awal)
+                return [self._info(asrama_id, nomor) for nomor in daftar[awal:min(akhir, awal + batas)]]
+            return [self._info(aid, nomor) for aid, nomor in self._per_lantai.get(lantai, [])[:batas]]